@@ -1,5 +1,14 @@
 """Config package"""
 from .database import get_engine, get_session, test_connection
-from .settings import SOURCES_CONFIG, SELENIUM_CONFIG
+from .settings import (
+    SOURCES_CONFIG, SELENIUM_CONFIG, HTTP_CONFIG, POLITENESS_CONFIG, HTTP_CACHE_CONFIG, RESOURCE_BLOCKING_CONFIG,
+    BROWSER_SERVICE_CONFIG, RESULTS_STREAM_CONFIG, BACKFILL_CONFIG,
+    LIST_API_CONFIG, DISCOVERY_CONFIG, JOB_QUEUE_CONFIG, RUN_REPORT_CONFIG, PARSE_POOL_CONFIG,
+    DRIVER_SUPERVISION_CONFIG, ATTACHMENTS_CONFIG, INGESTION_CONFIG
+)
 
-__all__ = ['get_engine', 'get_session', 'test_connection', 'SOURCES_CONFIG', 'SELENIUM_CONFIG']
\ No newline at end of file
+__all__ = ['get_engine', 'get_session', 'test_connection', 'SOURCES_CONFIG', 'SELENIUM_CONFIG', 'HTTP_CONFIG',
+           'POLITENESS_CONFIG', 'HTTP_CACHE_CONFIG', 'RESOURCE_BLOCKING_CONFIG', 'BROWSER_SERVICE_CONFIG',
+           'RESULTS_STREAM_CONFIG', 'BACKFILL_CONFIG', 'LIST_API_CONFIG',
+           'DISCOVERY_CONFIG', 'JOB_QUEUE_CONFIG', 'RUN_REPORT_CONFIG', 'PARSE_POOL_CONFIG',
+           'DRIVER_SUPERVISION_CONFIG', 'ATTACHMENTS_CONFIG', 'INGESTION_CONFIG']
\ No newline at end of file
@@ -8,56 +8,285 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 JSON_DIR = DATA_DIR / "json"
+KNOWN_URLS_PATH = DATA_DIR / "known_urls.bin"  # Empreintes des URLs déjà en base
+LISTING_FINGERPRINTS_PATH = DATA_DIR / "listing_fingerprints.json"  # Empreinte de la liste de chaque source
 
 # Configuration des sources et leurs langues
+# "fetch_strategy" : "http", "browser" ou "auto" (HTTP puis Selenium en secours)
+# "readiness" : sélecteur CSS attendu et délai max (s) avant de lire la page,
+# pour la page de liste et pour les pages d'articles
+# "resources" (optionnel) : {"allow": [...], "deny": [...]} motifs d'URL ajoutés
+# à / retirés de RESOURCE_BLOCKING_CONFIG["blocked_patterns"] pour cette source
 SOURCES_CONFIG = {
     "afg": {
         "name": "AFG (France)",
         "language": "fr",
-        "enabled": True
+        "enabled": True,
+        "fetch_strategy": {"list": "browser", "content": "auto"},
+        "pagination": {"template": "https://www.afg.asso.fr/fr/actualites/?prod_post%5Bpage%5D={page}", "first_page": 1},
+        # La page des actualités est alimentée par un index Algolia : liste lue directement en JSON
+        "list_api": {"url_pattern": "algolia", "index": "prod_post", "hits_per_page": 500},
+        "readiness": {
+            "list": {"selector": "div.card-body h3.card-title", "timeout": 15},
+            "content": {"selector": "div.entry-content, div.post-content", "timeout": 5}
+        }
     },
     "afm": {
         "name": "AFM (Pays-Bas)",
         "language": "en",
-        "enabled": True
+        "enabled": True,
+        "fetch_strategy": {"list": "auto", "content": "auto"},
+        "pagination": {"template": "https://www.afm.nl/en/sector/actueel?page={page}", "first_page": 1},
+        "readiness": {
+            "list": {"selector": "div.cc-em--article", "timeout": 10},
+            "content": {"selector": "main.cc-page__content, main", "timeout": 10}
+        }
     },
     "alfi": {
         "name": "ALFI (Luxembourg)",
         "language": "en",
-        "enabled": True
+        "enabled": True,
+        "fetch_strategy": {"list": "auto", "content": "auto"},
+        "pagination": {"template": "https://www.alfi.lu/en-gb/news/{page}", "first_page": 1},
+        "readiness": {
+            "list": {"selector": "a.card", "timeout": 10},
+            "content": {"selector": "section.wrapper-news-detail", "timeout": 10}
+        }
     },
     "amf": {
         "name": "AMF (France)",
         "language": "fr",
-        "enabled": True
+        "enabled": True,
+        "fetch_strategy": {"list": "auto", "content": "auto"},
+        "pagination": {"template": "https://www.amf-france.org/fr/actualites-publications/actualites?page={page}", "first_page": 0},
+        "feeds": [{"type": "sitemap", "url": "https://www.amf-france.org/sitemap.xml", "archive": True,
+                   "pattern": r"/fr/actualites-publications/actualites/"}],
+        "readiness": {
+            "list": {"selector": "table.data-table-listing tbody tr", "timeout": 10},
+            "content": {"selector": "div.contentToc, div.field--name-body", "timeout": 10}
+        }
     },
     "cbi": {
         "name": "CBI (Irlande)",
         "language": "en",
-        "enabled": True
+        "enabled": True,
+        "fetch_strategy": {"list": "auto", "content": "auto"},
+        "pagination": {"template": "https://www.centralbank.ie/news-media/press-releases/page/{page}", "first_page": 1},
+        "feeds": [{"type": "sitemap", "url": "https://www.centralbank.ie/sitemap.xml", "archive": True,
+                   "pattern": r"/news/article/press-release"}],
+        "readiness": {
+            "list": {"selector": "div.spotlight div.spotlight-content a", "timeout": 10},
+            "content": {"selector": "div.sf_colsIn, article, main", "timeout": 10}
+        }
     },
     "cssf": {
         "name": "CSSF (Luxembourg)",
         "language": "fr",
-        "enabled": True
+        "enabled": True,
+        "fetch_strategy": {"list": "auto", "content": "auto"},
+        "pagination": {"template": "https://www.cssf.lu/fr/news-fr/page/{page}/", "first_page": 1},
+        "readiness": {
+            "list": {"selector": "div.article-card", "timeout": 10},
+            "content": {"selector": "div.content", "timeout": 10}
+        }
     },
     "esma": {
         "name": "ESMA (Europe)",
         "language": "en",
-        "enabled": True
+        "enabled": True,
+        "fetch_strategy": {"list": "auto", "content": "auto"},
+        "pagination": {"template": "https://www.esma.europa.eu/press-news/esma-news?page={page}", "first_page": 0},
+        "feeds": [{"type": "sitemap", "url": "https://www.esma.europa.eu/sitemap.xml", "archive": True,
+                   "pattern": r"/press-news/esma-news/"}],
+        "readiness": {
+            "list": {"selector": "div.search-card", "timeout": 10},
+            "content": {"selector": "article.node--view-mode-full", "timeout": 10}
+        }
     },
     "finma": {
         "name": "FINMA (Suisse)",
         "language": "en",
-        "enabled": True
+        "enabled": True,
+        "fetch_strategy": {"list": "browser", "content": "auto"},
+        "pagination": {"template": "https://www.finma.ch/fr/news/?page={page}", "first_page": 1},
+        "feeds": [{"type": "rss", "url": "https://www.finma.ch/fr/rss/news/", "pattern": r"/news/"}],
+        "readiness": {
+            "list": {"selector": 'div.teaser-news a.teaser-content-title:not([href*="{{"])', "timeout": 15},
+            "content": {"selector": "div.text-page", "timeout": 10}
+        }
     }
 }
 
+# Backfill (python scripts/run_scraping.py --backfill) : parcours profond des pages de liste
+# via SOURCES_CONFIG[...]["pagination"] ; arrêt à max_pages, à la date limite (--since)
+# ou dès qu'une page ne contient que des URLs déjà connues
+# Les flux marqués "archive" (sitemap couvrant tout l'historique) remplacent la pagination,
+# lus par tranches de "feed_page_size" articles soumises aux mêmes règles d'arrêt
+BACKFILL_CONFIG = {
+    "max_pages": 50,        # Profondeur par défaut (--max-pages N)
+    "parallel_pages": 4,    # Pages de liste récupérées en parallèle
+    "feed_page_size": 20    # Articles d'un flux d'archive comptés comme une page de liste
+}
+
+# Découverte des articles par les flux (SOURCES_CONFIG[...]["feeds"] : RSS/Atom ou sitemap.xml)
+# Les sources sans flux (ou dont les flux échouent) gardent leur liste HTML
+DISCOVERY_CONFIG = {
+    "max_age_days": 30,      # Entrées plus anciennes ignorées (lastmod / pubDate), hors backfill
+    "max_items": 50,         # Articles gardés par source, hors backfill
+    "max_sitemap_depth": 2   # Profondeur de lecture des index de sitemaps
+}
+
+# Listes servies par une API JSON (SOURCES_CONFIG[...]["list_api"]) : endpoints capturés
+# et réponses enregistrées. mode : "live", "record" (enregistre les réponses) ou "replay"
+LIST_API_CONFIG = {
+    "directory": DATA_DIR / "list_api",
+    "mode": "live"
+}
+
+# File de tâches de scraping partagée (listes et articles), vidée par plusieurs workers
+# backend : "sqlite" (run local) ou "mysql" (base existante, workers sur plusieurs machines)
+JOB_QUEUE_CONFIG = {
+    "backend": "sqlite",
+    "sqlite_path": DATA_DIR / "job_queue.sqlite",
+    "lease_s": 300,          # Durée d'un bail : passé ce délai sans heartbeat, la tâche est reprise
+    "heartbeat_s": 60,       # Prolongation du bail pendant le traitement
+    "max_attempts": 3,       # Tentatives avant l'abandon d'une tâche (statut failed)
+    "retry_delay_s": 30,     # Délai avant une nouvelle tentative après un échec
+    "poll_s": 5              # Attente d'un worker quand la file est vide (tâches encore en cours ailleurs)
+}
+
+# Rapport de run : temps par phase (navigate, wait, parse, extract, clean), par source et par URL
+# écrit en JSON et au format texte Prometheus (run_<date>.json / run_<date>.prom)
+RUN_REPORT_CONFIG = {
+    "enabled": True,
+    "directory": DATA_DIR / "run_reports",
+    "per_url": True          # Détail page par page dans le JSON (sinon seulement p50 / p95 / max)
+}
+
+# Extraction du contenu dans un pool de processus, pendant que le driver charge les pages suivantes
+# (mode séquentiel, hors --async)
+PARSE_POOL_CONFIG = {
+    "enabled": True,
+    "workers": None,         # Processus d'extraction (None = nombre de cœurs)
+    "queue_size": 16         # Pages chargées en attente d'extraction au maximum
+}
+
+# Surveillance du driver pendant les runs longs (mode séquentiel, pool de workers, file de tâches)
+DRIVER_SUPERVISION_CONFIG = {
+    "max_pages": 500,        # Chrome relancé après N pages servies
+    "max_rss_mb": 1500,      # ... ou quand Chrome et ses processus dépassent N Mo de RSS (Linux)
+    "rss_check_every": 10,   # Mesure de la mémoire toutes les N pages
+    "max_restarts": 2        # Relances de Chrome (puis nouvel essai) pour une même page
+}
+
+# Pièces jointes PDF des articles : téléchargées en flux, texte ajouté au contenu de l'article
+ATTACHMENTS_CONFIG = {
+    "enabled": True,
+    "sources": ["esma", "cbi"],
+    # Zones de la page où chercher les PDF (XPath essayés dans l'ordre, le premier trouvé
+    # l'emporte) : corps de l'article et documents liés, jamais en-tête, pied de page ni colonnes
+    "scopes": {
+        "esma": ["//article[contains(concat(' ', normalize-space(@class), ' '), ' node--view-mode-full ')]"],
+        "cbi": ["//main//article", "//article", "//main"]
+    },
+    "directory": DATA_DIR / "attachments",
+    "max_bytes": 50 * 1024 * 1024,  # Document abandonné au-delà (Content-Length ou octets reçus)
+    "max_per_article": 5,           # Documents liés retenus par article
+    "max_pages": 500,               # Pages extraites au maximum par document
+    "pages_per_task": 20,           # Pages par tâche du pool d'extraction
+    "workers": None,                # Processus d'extraction (None = nombre de cœurs)
+    "timeout": 60                   # Délai max de la requête de téléchargement (s)
+}
+
 # Configuration Selenium
 SELENIUM_CONFIG = {
     "headless": True,
     "window_size": "1920,1080",
-    "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "ready_poll_frequency": 0.1,  # Intervalle de vérification des sélecteurs d'attente (s)
+    "tabs": 1,                    # Onglets chargés en parallèle dans le même Chrome (articles, stratégie "browser")
+    "tab_timeout": 30             # Délai maximal de chargement d'une page dans un onglet (s)
+}
+
+# Filtrage des ressources dans le navigateur (images, polices, CSS, trackers)
+# Nos extracteurs ne lisent que le HTML : ces ressources ne font que ralentir le chargement.
+RESOURCE_BLOCKING_CONFIG = {
+    "enabled": True,
+    "page_load_strategy": "eager",  # Rendre la main au DOMContentLoaded (readiness prend le relais)
+    "measure": True,                # Mesurer octets transférés / temps de chargement par page
+    "blocked_patterns": [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+        "*.css",
+        "*.mp4", "*.webm",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*facebook.net*", "*hotjar.com*", "*matomo*", "*piwik*",
+        "*linkedin.com/px*", "*twitter.com/i/adsct*", "*youtube.com/embed*"
+    ]
+}
+
+# Service navigateur local (scripts/run_browser_service.py) : pool de sessions Chrome chaudes
+BROWSER_SERVICE_CONFIG = {
+    "host": "127.0.0.1",
+    "port": 4455,
+    "pool_size": 4,
+    "max_pages_per_session": 300,  # Recyclage de Chrome après N pages
+    "max_session_age": 3600,       # ... ou après N secondes
+    "health_interval": 30,         # Vérification des sessions libres (s)
+    "heartbeat_interval": 60,      # Prolongation du bail par le client tant qu'il garde la session (s)
+    "lease_timeout": 300,          # Session sans heartbeat ni retour du client : récupérée après N s
+    "acquire_timeout": 60          # Attente max d'une session libre (s)
+}
+
+# Configuration du client HTTP (fetch sans navigateur)
+HTTP_CONFIG = {
+    "timeout": 15,           # Délai max par requête (s)
+    "pool_connections": 10,  # Nombre d'hôtes gardés en keep-alive
+    "pool_maxsize": 16,      # Connexions simultanées par hôte
+    "async_per_host_limit": 8,     # Requêtes simultanées par hôte (étape asynchrone)
+    "async_max_connections": 64    # Connexions simultanées au total (étape asynchrone)
+}
+
+# Politesse par hôte (seau à jetons adaptatif, repli sur 429 / 5xx) pour tous les fetchs
+POLITENESS_CONFIG = {
+    "enabled": True,
+    "initial_rate": 1.0,        # Requêtes/s par hôte au démarrage
+    "min_rate": 0.2,
+    "max_rate": 8.0,
+    "burst": 2,                 # Requêtes pouvant partir d'affilée
+    "ramp_up_factor": 1.2,      # Débit x1.2 après une réponse rapide (/1.2 après une lente)
+    "fast_response_s": 1.0,
+    "slow_response_s": 5.0,
+    "backoff_rate_factor": 0.5, # Débit divisé par deux sur 429 / 5xx
+    "backoff_base_s": 2.0,      # Pause après un échec (doublée à chaque échec consécutif)
+    "backoff_max_s": 120.0,
+    "backoff_jitter": 0.25,
+    "max_retries": 3,           # Nouvelles tentatives après un 429 / 5xx
+    "host_overrides": {}        # {hôte: {réglage: valeur}} ex : {"www.esma.europa.eu": {"max_rate": 2.0}}
+}
+
+# Cache HTTP persistant (revalidation ETag / Last-Modified)
+HTTP_CACHE_CONFIG = {
+    "enabled": True,
+    "directory": DATA_DIR / "http_cache"
+}
+
+# Archive du HTML brut (zstd, dédupliqué par hash) pour la ré-extraction hors ligne
+ARCHIVE_CONFIG = {
+    "enabled": True,
+    "directory": DATA_DIR / "html_archive",
+    "compression_level": 10
+}
+
+# Flux de résultats JSONL (scrapers/<source>/results.jsonl) écrit article par article
+RESULTS_STREAM_CONFIG = {
+    "compress": False,  # True : results.jsonl.zst (zstd)
+    "fsync": False      # True : fsync après chaque article (plus sûr, plus lent)
+}
+
+# Ingestion JSON -> MySQL : articles écrits par lots (executemany + ON DUPLICATE KEY UPDATE)
+INGESTION_CONFIG = {
+    "batch_size": 200        # Articles par lot (une requête de lecture, une écriture et un commit par lot)
 }
 
 # Création automatique des dossiers
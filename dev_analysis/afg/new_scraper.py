@@ -7,7 +7,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.common.driver_setup import get_driver
+from src.browser_service.client import connect_driver
 from bs4 import BeautifulSoup
 import time
 import re
@@ -127,7 +127,7 @@ def scrape_afg_50_articles():
     print("🚀 SCRAPING AFG - 50 ARTICLES")
     print("=" * 60)
 
-    driver = get_driver()
+    driver = connect_driver()
 
     try:
         all_articles = []
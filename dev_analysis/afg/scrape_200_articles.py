@@ -1,6 +1,6 @@
 """
 Scraper AFG - 200 articles accessibles
-Avec sauvegarde progressive et reprise possible
+Avec sauvegarde progressive (checkpoint JSONL, un article par ligne) et reprise possible
 """
 import sys
 from pathlib import Path
@@ -9,29 +9,23 @@ import os
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.common.driver_setup import get_driver
+from src.browser_service.client import connect_driver
+from src.storage.results_stream import ResultsStreamWriter, iter_results
 from bs4 import BeautifulSoup
 import time
 import re
 
-CHECKPOINT_FILE = "dev_analysis/afg/checkpoint_200.json"
+CHECKPOINT_FILE = "dev_analysis/afg/checkpoint_200.jsonl"
 FINAL_OUTPUT = "dev_analysis/afg/afg_200_articles.json"
 
 
 def load_checkpoint():
     """Charge le checkpoint s'il existe."""
     if os.path.exists(CHECKPOINT_FILE):
-        with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return list(iter_results(CHECKPOINT_FILE))
     return []
 
 
-def save_checkpoint(articles):
-    """Sauvegarde un checkpoint."""
-    with open(CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
-
-
 def scrape_page(driver, page_num):
     """Scrape une page."""
     url = f"https://www.afg.asso.fr/fr/actualites/?prod_post%5Bpage%5D={page_num}"
@@ -115,7 +109,9 @@ def scrape_200_articles():
         if response != 'y':
             existing = []
 
-    driver = get_driver()
+    # Chaque article accessible est ajouté au checkpoint dès son extraction
+    checkpoint = ResultsStreamWriter(CHECKPOINT_FILE, append=bool(existing))
+    driver = connect_driver()
 
     try:
         accessible_articles = existing
@@ -153,10 +149,7 @@ def scrape_200_articles():
                     accessible_articles.append(article)
                     new_count += 1
                     print(f" ✅ ({len(content)} chars)")
-
-                    # Checkpoint tous les 10 articles
-                    if len(accessible_articles) % 10 == 0:
-                        save_checkpoint(accessible_articles)
+                    checkpoint.write(article)
                 else:
                     print(f" 🔒 Restreint")
 
@@ -166,9 +159,6 @@ def scrape_200_articles():
 
             print(f"      ✅ +{new_count} articles accessibles")
 
-            # Checkpoint de fin de page
-            save_checkpoint(accessible_articles)
-
             page += 1
 
         # Sauvegarder le résultat final
@@ -187,6 +177,7 @@ def scrape_200_articles():
         print(f"\n   💾 Fichier final : {FINAL_OUTPUT}")
 
         # Nettoyer le checkpoint
+        checkpoint.close()
         if os.path.exists(CHECKPOINT_FILE):
             os.remove(CHECKPOINT_FILE)
             print(f"   🧹 Checkpoint supprimé")
@@ -200,15 +191,14 @@ def scrape_200_articles():
         print(f"   💾 Progression sauvegardée : {len(accessible_articles)} articles")
         print(f"   📂 Checkpoint : {CHECKPOINT_FILE}")
         print("   ▶️  Relance le script pour reprendre")
-        save_checkpoint(accessible_articles)
 
     except Exception as e:
         print(f"\n❌ ERREUR : {e}")
-        print(f"   💾 Sauvegarde d'urgence : {len(accessible_articles)} articles")
-        save_checkpoint(accessible_articles)
+        print(f"   💾 Progression sauvegardée : {len(accessible_articles)} articles")
         raise
 
     finally:
+        checkpoint.close()
         driver.quit()
 
 
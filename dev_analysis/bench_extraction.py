@@ -0,0 +1,100 @@
+"""
+Microbenchmark des extracteurs : noyau lxml (scrapers/*/get_content.py) contre
+les extracteurs BeautifulSoup de référence (dev_analysis/extraction_reference.py).
+
+Vérifie au passage que le texte extrait est identique, page par page.
+Pages lues dans l'archive HTML (data/html_archive) ou dans un dossier de pages
+sauvegardées (<dossier>/<source>/*.html).
+
+Lance depuis la racine : python dev_analysis/bench_extraction.py
+Pages sauvegardées : python dev_analysis/bench_extraction.py --dir chemin/pages
+Répétitions / pages max par source : python dev_analysis/bench_extraction.py --repeat 5 --n 50
+"""
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import SOURCES_CONFIG
+from src.archive.html_archive import HtmlArchive
+from src.scrapers.registry import SCRAPER_FUNCTIONS
+from dev_analysis.extraction_reference import REFERENCE_EXTRACTORS
+
+
+def load_archived_pages(source_code, n):
+    """Pages d'articles archivées d'une source : [(url, html)]."""
+    archive = HtmlArchive()
+    try:
+        return [(entry["url"], archive.read(entry["sha256"])) for entry in archive.latest_articles(source_code)[:n]]
+    finally:
+        archive.close()
+
+
+def load_saved_pages(directory, source_code, n):
+    """Pages sauvegardées dans <dossier>/<source>/*.html : [(nom, html)]."""
+    files = sorted((Path(directory) / source_code).glob("*.html"))[:n]
+    return [(f.name, f.read_text(encoding="utf-8", errors="replace")) for f in files]
+
+
+def time_extractor(extract, pages, repeat):
+    """Temps CPU moyen par page (ms) et textes extraits."""
+    outputs = []
+    # Les extracteurs signalent les conteneurs manquants : on les fait taire pendant la mesure
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.process_time()
+        for _ in range(repeat):
+            outputs = [extract(html, url) for url, html in pages]
+        elapsed = time.process_time() - start
+    return elapsed * 1000 / (repeat * len(pages)), outputs
+
+
+def main():
+    """Point d'entrée principal."""
+    directory = None
+    repeat = 3
+    n = 100
+
+    if "--dir" in sys.argv:
+        idx = sys.argv.index("--dir")
+        if idx + 1 < len(sys.argv):
+            directory = sys.argv[idx + 1]
+    if "--repeat" in sys.argv:
+        idx = sys.argv.index("--repeat")
+        if idx + 1 < len(sys.argv):
+            repeat = max(1, int(sys.argv[idx + 1]))
+    if "--n" in sys.argv:
+        idx = sys.argv.index("--n")
+        if idx + 1 < len(sys.argv):
+            n = max(1, int(sys.argv[idx + 1]))
+
+    print("\n" + "=" * 60)
+    print("⏱️  EXTRACTION : BEAUTIFULSOUP vs NOYAU LXML")
+    print("=" * 60)
+    print(f"   {'Source':<8} {'Pages':>5} {'bs4 ms':>8} {'lxml ms':>8} {'Gain':>6}  Sortie")
+
+    for source_code in SOURCES_CONFIG:
+        pages = load_saved_pages(directory, source_code, n) if directory else load_archived_pages(source_code, n)
+        if not pages:
+            print(f"   {source_code.upper():<8} {'-':>5}  aucune page")
+            continue
+
+        ref_ms, ref_out = time_extractor(REFERENCE_EXTRACTORS[source_code], pages, repeat)
+        new_ms, new_out = time_extractor(SCRAPER_FUNCTIONS[source_code]["extract"], pages, repeat)
+        mismatches = [url for (url, _), a, b in zip(pages, ref_out, new_out) if a != b]
+
+        status = "✅ identique" if not mismatches else f"❌ {len(mismatches)} différences"
+        print(
+            f"   {source_code.upper():<8} {len(pages):>5} {ref_ms:>8.2f} {new_ms:>8.2f} "
+            f"{ref_ms / new_ms if new_ms else 0:>5.1f}x  {status}"
+        )
+        for url in mismatches[:3]:
+            print(f"            ≠ {url}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
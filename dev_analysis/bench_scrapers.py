@@ -0,0 +1,255 @@
+"""
+Benchmark hors ligne des scrapers : les 8 sources servies par un serveur local de
+fixtures (dev_analysis/fixture_server.py), avec latence réseau injectée.
+
+Les vraies fonctions du registre (SCRAPER_FUNCTIONS : parse_list, extract) sont
+utilisées à travers le pipeline, pour chaque stratégie de fetch :
+- http    : articles un par un (requests)
+- async   : tous les articles d'une source en une passe (httpx)
+- browser : articles un par un dans Chrome (option --browser)
+
+Mesures par source et par stratégie : pages/s, temps CPU par page, pic mémoire (tracemalloc,
+passe séparée pour ne pas fausser le CPU). Cache HTTP, archive, pièces jointes PDF et politesse
+sont désactivés.
+
+Créer les fixtures depuis l'archive HTML : python dev_analysis/bench_scrapers.py --record 30
+Lance depuis la racine : python dev_analysis/bench_scrapers.py --latency 80 --jitter 40
+Avec Chrome : python dev_analysis/bench_scrapers.py --browser
+Enregistrer une référence : python dev_analysis/bench_scrapers.py --save baseline.json
+Comparer à une référence : python dev_analysis/bench_scrapers.py --compare baseline.json
+Autres options : --dir DOSSIER (fixtures), --repeat N, --port P, --polite (garder la politesse)
+"""
+import contextlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import (
+    ARCHIVE_CONFIG, ATTACHMENTS_CONFIG, HTTP_CACHE_CONFIG, POLITENESS_CONFIG, RUN_REPORT_CONFIG, SOURCES_CONFIG
+)
+from src.archive.html_archive import HtmlArchive
+from src.common.http_client import http_get
+from src.common.readiness import load_page
+from src.scrapers.pipeline import scrape_article, scrape_articles_async
+from src.scrapers.registry import SCRAPER_FUNCTIONS
+from dev_analysis.fixture_server import FIXTURES_DIR, FixtureServer, load_manifest, save_manifest
+
+STRATEGIES = ("http", "async", "browser")
+
+
+def record_fixtures(directory, n):
+    """Copie la dernière page de liste et les n derniers articles archivés de chaque source."""
+    archive = HtmlArchive()
+    try:
+        for source_code in SOURCES_CONFIG:
+            source_dir = Path(directory) / source_code
+            manifest = {"list": None, "articles": []}
+
+            list_page = archive.latest_list_page(source_code)
+            if list_page:
+                (source_dir / "list.html").parent.mkdir(parents=True, exist_ok=True)
+                (source_dir / "list.html").write_text(archive.read(list_page["sha256"]), encoding="utf-8")
+                manifest["list"] = {"url": list_page["url"], "file": "list.html"}
+
+            for i, entry in enumerate(archive.latest_articles(source_code)[:n], 1):
+                file = f"articles/{i:04d}.html"
+                (source_dir / file).parent.mkdir(parents=True, exist_ok=True)
+                (source_dir / file).write_text(archive.read(entry["sha256"]), encoding="utf-8")
+                manifest["articles"].append(
+                    {"url": entry["url"], "title": entry["title"], "date": entry["date"], "file": file}
+                )
+
+            if manifest["list"] or manifest["articles"]:
+                save_manifest(directory, source_code, manifest)
+            print(f"   📼 {source_code.upper():<6} liste : {'oui' if manifest['list'] else 'non'}, "
+                  f"{len(manifest['articles'])} articles")
+    finally:
+        archive.close()
+
+
+@contextlib.contextmanager
+def forced_strategy(source_code, strategy):
+    """Force la stratégie de fetch d'une source le temps d'une mesure."""
+    config = SOURCES_CONFIG[source_code]
+    saved = config.get("fetch_strategy")
+    config["fetch_strategy"] = {"list": strategy, "content": strategy}
+    try:
+        yield
+    finally:
+        config["fetch_strategy"] = saved
+
+
+def local_items(server, source_code, manifest):
+    """Articles des fixtures, avec leur URL sur le serveur local."""
+    return [
+        {"title": article["title"] or article["file"], "url": server.url_for(source_code, article["file"]),
+         "date": article["date"] or ""}
+        for article in manifest["articles"]
+    ]
+
+
+def run_list(server, source_code, manifest, driver, strategy):
+    """Récupère et parse la page de liste. Retourne le nombre d'articles parsés."""
+    url = server.url_for(source_code, manifest["list"]["file"])
+    if strategy == "browser":
+        html = load_page(driver, url, source_code, "list")
+    else:
+        html = http_get(url).html or ""
+    return len(SCRAPER_FUNCTIONS[source_code]["parse_list"](html))
+
+
+def run_articles(source_code, items, driver, strategy):
+    """Récupère et extrait les articles. Retourne le nombre d'articles avec du contenu."""
+    with forced_strategy(source_code, "browser" if strategy == "browser" else "http"):
+        if strategy == "async":
+            results = scrape_articles_async(source_code, items, driver)
+        else:
+            results = [scrape_article(source_code, driver, item, i, len(items)) for i, item in enumerate(items, 1)]
+    return sum(1 for article in results if article.get("content"))
+
+
+def measure(func, repeat):
+    """Meilleur temps (mur, CPU) sur `repeat` exécutions, puis pic mémoire sur une passe dédiée."""
+    best_wall, best_cpu, result = None, None, None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            wall, cpu = time.perf_counter(), time.process_time()
+            result = func()
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            if best_wall is None or wall < best_wall:
+                best_wall, best_cpu = wall, cpu
+
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return best_wall, best_cpu, peak, result
+
+
+def bench_source(server, source_code, manifest, strategies, driver, repeat):
+    """Mesures d'une source : une ligne par (étape, stratégie)."""
+    rows = []
+    items = local_items(server, source_code, manifest)
+
+    for strategy in strategies:
+        if strategy == "browser" and driver is None:
+            continue
+
+        if manifest["list"] and strategy != "async":
+            wall, cpu, peak, parsed = measure(lambda: run_list(server, source_code, manifest, driver, strategy), repeat)
+            rows.append(_row(source_code, "list", strategy, 1, wall, cpu, peak, parsed))
+
+        if items:
+            wall, cpu, peak, ok = measure(lambda: run_articles(source_code, items, driver, strategy), repeat)
+            rows.append(_row(source_code, "articles", strategy, len(items), wall, cpu, peak, ok))
+    return rows
+
+
+def _row(source_code, stage, strategy, pages, wall, cpu, peak, ok):
+    return {
+        "source": source_code, "stage": stage, "strategy": strategy, "pages": pages, "ok": ok,
+        "pages_per_s": pages / wall if wall else 0.0,
+        "cpu_ms_per_page": cpu * 1000 / pages,
+        "peak_mb": peak / 1024 / 1024,
+    }
+
+
+def _row_key(row):
+    return f"{row['source']}/{row['stage']}/{row['strategy']}"
+
+
+def print_rows(rows, baseline=None):
+    """Tableau des mesures (et écart à la référence si fournie)."""
+    reference = {_row_key(row): row for row in (baseline or {}).get("rows", [])}
+    print(f"   {'Source':<7} {'Étape':<9} {'Stratégie':<9} {'Pages':>5} {'OK':>5} "
+          f"{'pages/s':>8} {'CPU ms/p':>9} {'Pic Mo':>7}")
+    for row in rows:
+        line = (
+            f"   {row['source'].upper():<7} {row['stage']:<9} {row['strategy']:<9} {row['pages']:>5} "
+            f"{row['ok']:>5} {row['pages_per_s']:>8.1f} {row['cpu_ms_per_page']:>9.2f} {row['peak_mb']:>7.1f}"
+        )
+        ref = reference.get(_row_key(row))
+        if ref:
+            speed = row['pages_per_s'] / ref['pages_per_s'] - 1 if ref['pages_per_s'] else 0
+            cpu = row['cpu_ms_per_page'] / ref['cpu_ms_per_page'] - 1 if ref['cpu_ms_per_page'] else 0
+            line += f"   ({speed:+.0%} débit, {cpu:+.0%} CPU)"
+        print(line)
+
+
+def parse_option(name, default=None, cast=str):
+    if name in sys.argv:
+        idx = sys.argv.index(name)
+        if idx + 1 < len(sys.argv):
+            return cast(sys.argv[idx + 1])
+    return default
+
+
+def main():
+    """Point d'entrée principal."""
+    directory = Path(parse_option("--dir", FIXTURES_DIR))
+    record = parse_option("--record", None, int)
+    if record:
+        print(f"📼 Enregistrement des fixtures dans {directory}")
+        record_fixtures(directory, record)
+        return
+
+    latency = parse_option("--latency", 0, float)
+    jitter = parse_option("--jitter", 0, float)
+    repeat = max(1, parse_option("--repeat", 3, int))
+    port = parse_option("--port", 8780, int)
+    save_path = parse_option("--save")
+    compare_path = parse_option("--compare")
+
+    # Mesure du scraper seul : ni cache, ni archive, ni rapport de run, ni PDF liés (téléchargés
+    # sur les vrais sites) ; politesse en option
+    HTTP_CACHE_CONFIG["enabled"] = False
+    ARCHIVE_CONFIG["enabled"] = False
+    RUN_REPORT_CONFIG["enabled"] = False
+    ATTACHMENTS_CONFIG["enabled"] = False
+    if "--polite" not in sys.argv:
+        POLITENESS_CONFIG["enabled"] = False
+
+    manifests = {code: load_manifest(directory, code) for code in SOURCES_CONFIG}
+    manifests = {code: manifest for code, manifest in manifests.items() if manifest}
+    if not manifests:
+        print(f"⚠️  Aucune fixture dans {directory} (créer avec --record N)")
+        return
+
+    driver = None
+    if "--browser" in sys.argv:
+        from src.common.driver_setup import get_driver
+        driver = get_driver()
+
+    print("\n" + "=" * 78)
+    print(f"🏎️  BENCHMARK HORS LIGNE DES SCRAPERS (latence {latency:.0f} ms + 0-{jitter:.0f} ms, {repeat} répétitions)")
+    print("=" * 78)
+
+    rows = []
+    try:
+        with FixtureServer(directory, port, latency, jitter) as server:
+            for source_code, manifest in manifests.items():
+                rows += bench_source(server, source_code, manifest, STRATEGIES, driver, repeat)
+    finally:
+        if driver is not None:
+            driver.quit()
+
+    baseline = None
+    if compare_path:
+        with open(compare_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_rows(rows, baseline)
+    print("=" * 78)
+
+    if save_path:
+        with open(save_path, 'w', encoding='utf-8') as f:
+            json.dump({"latency_ms": latency, "jitter_ms": jitter, "rows": rows}, f, indent=2)
+        print(f"💾 Référence enregistrée : {save_path}")
+
+
+if __name__ == "__main__":
+    main()
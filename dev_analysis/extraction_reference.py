@@ -0,0 +1,332 @@
+"""
+Extracteurs de référence (BeautifulSoup), tels qu'avant le noyau lxml
+(src/common/extraction.py). Servent uniquement à vérifier que les extracteurs
+actuels produisent exactement le même texte, et à mesurer le gain.
+"""
+from bs4 import BeautifulSoup
+
+
+def extract_afg_reference(html, url):
+    """
+    Extrait le contenu ou détecte si l'accès est restreint.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+
+    # 1. DÉTECTION PAYWALL / MEMBRES
+    # On cherche des mots clés indiquant que la page est bloquée
+    full_text = soup.get_text()
+    if "réservé aux membres" in full_text or "Connectez-vous" in full_text or "Authenticate to login" in full_text:
+        # On vérifie si on a quand même accès au contenu (parfois le message est là mais le contenu aussi)
+        if not soup.find('div', class_='entry-content'):
+            return "[CONTENU RESTREINT - AUTHENTIFICATION REQUISE]"
+
+    # 2. EXTRACTION DU CONTENU
+    content_div = soup.find('div', class_='entry-content')
+
+    # Fallback
+    if not content_div:
+        content_div = soup.find('div', class_='post-content')
+
+    if content_div:
+        # On nettoie un peu les retours à la ligne multiples
+        text = content_div.get_text(separator='\n\n', strip=True)
+        return text
+    else:
+        return "[Erreur : Conteneur entry-content introuvable]"
+
+
+def extract_afm_reference(html, url):
+    """
+    Extrait le contenu texte de l'article AFM.
+    Coupe le texte avant les sections "More information" ou "Contact".
+    """
+    soup = BeautifulSoup(html, 'lxml')
+
+    # CIBLAGE : On utilise le <main> identifié par le diagnostic
+    # On essaie la classe précise, sinon on prend le main tout court
+    content_container = soup.find('main', class_='cc-page__content')
+    if not content_container:
+        content_container = soup.find('main')
+
+    if content_container:
+        # On récupère tout le texte avec des sauts de ligne pour aérer
+        # Cela capture les <p>, les <ul>, les <h2>, etc.
+        full_text = content_container.get_text(separator='\n\n', strip=True)
+
+        # NETTOYAGE DU PIED DE PAGE
+        # On définit des marqueurs de fin. Dès qu'on en voit un, on coupe tout ce qui suit.
+        stop_markers = [
+            "More information",
+            "Contact for this article",
+            "Tags\nSustainability"
+        ]
+
+        for marker in stop_markers:
+            if marker in full_text:
+                # On ne garde que la partie GAUCHE du marqueur (avant le marqueur)
+                full_text = full_text.split(marker)[0]
+
+        # Petit nettoyage final des espaces en trop à la fin
+        return full_text.strip()
+
+    else:
+        print(f"   ⚠️ Conteneur <main> introuvable sur {url}")
+        return ""
+
+
+def extract_alfi_reference(html, url):
+    """
+    Extrait le contenu de la section 'wrapper-news-detail'.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+
+    # CIBLAGE : Identifié par le diagnostic (Niveau 1)
+    content_section = soup.find('section', class_='wrapper-news-detail')
+
+    if content_section:
+        full_text = content_section.get_text(separator='\n\n', strip=True)
+
+        # NETTOYAGE
+        # On coupe le bas de page inutile
+        stop_markers = ["Back", "JOIN THE ALFI COMMUNITY", "Related documents"]
+        for marker in stop_markers:
+            if marker in full_text:
+                full_text = full_text.split(marker)[0]
+
+        return full_text.strip()
+    else:
+        print(f"   ⚠️ Section 'wrapper-news-detail' introuvable sur {url}")
+        return ""
+
+
+def extract_amf_reference(html, url):
+    """
+    Extrait le contenu de l'article AMF.
+    Cible la div 'contentToc' ou 'field--name-body'.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+
+    # CIBLAGE : Basé sur ton diagnostic (Niveau -2)
+    content_div = soup.find('div', class_='contentToc')
+
+    # Fallback : Si contentToc n'existe pas, on cherche le standard Drupal
+    if not content_div:
+        content_div = soup.find('div', class_=lambda x: x and 'field--name-body' in x)
+
+    if content_div:
+        full_text = content_div.get_text(separator='\n\n', strip=True)
+
+        # NETTOYAGE DU BAS DE PAGE
+        stop_markers = [
+            "Mots clés",
+            "Sur le même thème",
+            "S'abonner à nos alertes",
+            "Revenir en haut de page"
+        ]
+
+        for marker in stop_markers:
+            if marker in full_text:
+                full_text = full_text.split(marker)[0]
+
+        return full_text.strip()
+    else:
+        print(f"   ⚠️ Conteneur introuvable sur {url}")
+        return ""
+
+
+def extract_cbi_reference(html, url):
+    """
+    Extrait le contenu pour Central Bank of Ireland (CMS Sitefinity).
+    Stratégie : Chercher les conteneurs standards du CMS (sf_colsIn).
+    """
+    soup = BeautifulSoup(html, 'lxml')
+
+    full_text = ""
+
+    # --- STRATÉGIE 1 : Conteneurs Sitefinity (Standard) ---
+    # Le contenu éditorial est souvent dans <div class="sf_colsIn">
+    content_divs = soup.find_all('div', class_='sf_colsIn')
+
+    if content_divs:
+        # On prend le div qui contient le plus de texte (pour éviter les sidebars)
+        main_div = max(content_divs, key=lambda d: len(d.get_text()))
+        full_text = main_div.get_text(separator='\n\n', strip=True)
+
+    # --- STRATÉGIE 2 : Fallback sur 'article' ou 'main' ---
+    if len(full_text) < 50:
+        fallback = soup.find('article') or soup.find('main')
+        if fallback:
+            full_text = fallback.get_text(separator='\n\n', strip=True)
+
+    # --- NETTOYAGE ---
+    if full_text:
+        # Nettoyage des parasites courants sur ce site
+        stop_phrases = [
+            "Share this page",
+            "Cookie Policy",
+            "See Also:",
+            "Notes to Editor"
+        ]
+
+        cleaned_lines = []
+        for line in full_text.split('\n'):
+            # On enlève les lignes vides ou qui contiennent des phrases parasites
+            if line.strip() and not any(phrase in line for phrase in stop_phrases):
+                cleaned_lines.append(line.strip())
+
+        return "\n".join(cleaned_lines)
+
+    return ""
+
+
+def extract_cssf_reference(html, url):
+    """
+    Extrait le contenu de la div 'content'.
+    Nettoie les boutons de partage au début.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+
+    # CIBLAGE : Classe 'content' identifiée au diagnostic
+    content_div = soup.find('div', class_='content')
+
+    if content_div:
+        # On récupère tout le texte
+        full_text = content_div.get_text(separator='\n\n', strip=True)
+
+        # NETTOYAGE
+        # On définit ce qu'on veut virer (le header de l'article avec les partages)
+        noise_start = [
+            "Envoyer par email",
+            "Partager sur LinkedIn",
+            "Partager sur Facebook",
+            "Partager sur Twitter",
+            "Publié le"  # La date est déjà dans la liste, on peut l'enlever du corps si on veut
+        ]
+
+        lines = full_text.split('\n\n')
+        cleaned_lines = []
+
+        for line in lines:
+            # Si la ligne contient un mot clé de bruit, on l'ignore
+            if any(noise in line for noise in noise_start):
+                continue
+            cleaned_lines.append(line)
+
+        return "\n\n".join(cleaned_lines).strip()
+
+    else:
+        print(f"   ⚠️ Conteneur 'content' introuvable sur {url}")
+        return ""
+
+
+def extract_esma_reference(html, url):
+    """
+    Extrait le contenu de l'article ESMA.
+    Cible <article class="node--view-mode-full"> et nettoie le bruit.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+
+    # CIBLAGE : Identifié par le diagnostic (Candidat 0)
+    # On cherche l'article en mode "vue complète"
+    article = soup.find('article', class_='node--view-mode-full')
+
+    if article:
+        # On récupère le texte avec des sauts de ligne
+        full_text = article.get_text(separator='\n\n', strip=True)
+
+        # NETTOYAGE
+        # 1. Bruit de fin de page
+        stop_markers = [
+            "Related Documents",
+            "Download All Files",
+            "Back to top",
+            "Related News"
+        ]
+        for marker in stop_markers:
+            if marker in full_text:
+                full_text = full_text.split(marker)[0]
+
+        # 2. Bruit de début de page (Tags, date répétés)
+        # On va supprimer les lignes qui contiennent ces mots clés génériques
+        noise_start = [
+            "About ESMA",
+            "Press Releases",
+            "Share this page",
+            "Menu",
+            "Home"
+        ]
+
+        lines = full_text.split('\n\n')
+        cleaned_lines = []
+
+        # On parcourt les lignes et on ne garde que celles qui sont du vrai texte
+        for line in lines:
+            # Si la ligne est exactement un des mots parasites, on saute
+            if line.strip() in noise_start:
+                continue
+            # Si la ligne est une date seule (04/12/2025), on saute (déjà dans la liste)
+            if len(line.strip()) == 10 and "/" in line:
+                continue
+
+            cleaned_lines.append(line)
+
+        return "\n\n".join(cleaned_lines).strip()
+
+    else:
+        print(f"   ⚠️ Conteneur <article> introuvable sur {url}")
+        return ""
+
+
+def extract_finma_reference(html, url):
+    """
+    Extrait le contenu global via le conteneur 'text-page' pour éviter de rater
+    des paragraphes ou des listes situés hors des blocs 'mod-content'.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+
+    # --- CORRECTION MAJEURE ---
+    # Au lieu de chercher des morceaux (mod-teaser, mod-content),
+    # on cible le conteneur parent global identifié par le diagnostic.
+    # Cela capture tout : le chapeau, le corps, les listes et les <span> isolés.
+    content_div = soup.find('div', class_='text-page')
+
+    full_text = ""
+
+    if content_div:
+        # separator='\n\n' est CRUCIAL pour que la liste des membres
+        # (Mirjam Eggen, etc.) ne soit pas collée en une seule ligne.
+        full_text = content_div.get_text(separator='\n\n', strip=True)
+    else:
+        # Fallback : Si 'text-page' n'existe pas (anciennes pages ?),
+        # on tente une extraction brute du body ou on log l'erreur.
+        print(f"   ⚠️ Conteneur 'text-page' introuvable sur {url}")
+        return ""
+
+    # --- NETTOYAGE DU PIED DE PAGE ---
+    # Le conteneur 'text-page' inclut souvent le footer technique,
+    # donc ce nettoyage reste indispensable.
+    stop_markers = [
+        "Dernière modification", # J'ai retiré le ':' pour être plus large
+        "Taille:",
+        "Langue(s):",
+        "Contact\n",
+        "Autorité fédérale de surveillance des marchés financiers FINMA"
+    ]
+
+    for marker in stop_markers:
+        if marker in full_text:
+            full_text = full_text.split(marker)[0]
+
+    return full_text.strip()
+
+
+REFERENCE_EXTRACTORS = {
+    "afg": extract_afg_reference,
+    "afm": extract_afm_reference,
+    "alfi": extract_alfi_reference,
+    "amf": extract_amf_reference,
+    "cbi": extract_cbi_reference,
+    "cssf": extract_cssf_reference,
+    "esma": extract_esma_reference,
+    "finma": extract_finma_reference,
+}
@@ -0,0 +1,162 @@
+"""
+Serveur HTTP local de pages enregistrées (fixtures), avec latence injectée.
+
+Les fixtures d'une source sont rangées dans <dossier>/<source>/ :
+- manifest.json : {"list": {"url", "file"}, "articles": [{"url", "title", "date", "file"}]}
+  (url = URL d'origine sur le site de l'autorité)
+- les fichiers HTML référencés (list.html, articles/0001.html, ...)
+
+Chaque réponse est retardée de `latency` ms (+ 0 à `jitter` ms) pour simuler le réseau ;
+le serveur est multi-thread, les requêtes simultanées attendent donc en parallèle.
+
+Fixtures créées depuis l'archive HTML : python dev_analysis/bench_scrapers.py --record 30
+Lance depuis la racine : python dev_analysis/fixture_server.py --port 8780 --latency 80 --jitter 40
+"""
+import json
+import multiprocessing
+import random
+import socket
+import sys
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import DATA_DIR
+
+FIXTURES_DIR = DATA_DIR / "bench_fixtures"
+
+
+def load_manifest(directory, source_code):
+    """Manifeste des fixtures d'une source, ou None."""
+    path = Path(directory) / source_code / "manifest.json"
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(directory, source_code, manifest):
+    path = Path(directory) / source_code / "manifest.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+
+def make_handler(directory, latency_ms=0, jitter_ms=0):
+    """Handler qui sert les fixtures après la latence configurée."""
+
+    class FixtureHandler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(directory), **kwargs)
+
+        def send_head(self):
+            delay = latency_ms + random.uniform(0, jitter_ms)
+            if delay:
+                time.sleep(delay / 1000)
+            return super().send_head()
+
+        def guess_type(self, path):
+            if str(path).endswith(".html"):
+                return "text/html; charset=utf-8"
+            return super().guess_type(path)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+class _FixtureHTTPServer(ThreadingHTTPServer):
+    # File d'attente de connexions assez longue pour la passe asynchrone (5 par défaut :
+    # au-delà, les connexions sont refusées et retentées par le client une seconde plus tard)
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def serve(directory, port, latency_ms=0, jitter_ms=0):
+    """Sert les fixtures jusqu'à l'arrêt du processus."""
+    server = _FixtureHTTPServer(("127.0.0.1", port), make_handler(directory, latency_ms, jitter_ms))
+    server.serve_forever()
+
+
+class FixtureServer:
+    """Serveur de fixtures dans un processus séparé (son CPU ne compte pas dans les mesures)."""
+
+    def __init__(self, directory=FIXTURES_DIR, port=8780, latency_ms=0, jitter_ms=0):
+        self.directory = Path(directory)
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._process = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def url_for(self, source_code, file):
+        """URL locale d'un fichier de fixtures."""
+        return f"{self.base_url}/{source_code}/{file}"
+
+    def start(self):
+        self._process = multiprocessing.Process(
+            target=serve, args=(self.directory, self.port, self.latency_ms, self.jitter_ms), daemon=True
+        )
+        self._process.start()
+        self._wait_ready()
+        return self
+
+    def _wait_ready(self, timeout=10):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=0.5).close()
+                return
+            except OSError:
+                time.sleep(0.05)
+        raise RuntimeError(f"Serveur de fixtures injoignable sur le port {self.port}")
+
+    def stop(self):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Point d'entrée principal."""
+    directory, port, latency, jitter = FIXTURES_DIR, 8780, 0, 0
+
+    if "--dir" in sys.argv:
+        idx = sys.argv.index("--dir")
+        if idx + 1 < len(sys.argv):
+            directory = Path(sys.argv[idx + 1])
+    if "--port" in sys.argv:
+        idx = sys.argv.index("--port")
+        if idx + 1 < len(sys.argv):
+            port = int(sys.argv[idx + 1])
+    if "--latency" in sys.argv:
+        idx = sys.argv.index("--latency")
+        if idx + 1 < len(sys.argv):
+            latency = float(sys.argv[idx + 1])
+    if "--jitter" in sys.argv:
+        idx = sys.argv.index("--jitter")
+        if idx + 1 < len(sys.argv):
+            jitter = float(sys.argv[idx + 1])
+
+    print(f"🧪 Fixtures {directory} servies sur http://127.0.0.1:{port} (latence {latency} ms + 0-{jitter} ms)")
+    try:
+        serve(directory, port, latency, jitter)
+    except KeyboardInterrupt:
+        print("\n🛑 Arrêt du serveur")
+
+
+if __name__ == "__main__":
+    main()
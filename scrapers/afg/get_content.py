@@ -1,38 +1,43 @@
-import time
-from bs4 import BeautifulSoup
+from src.common.extraction import Markers, by_class, find_first, get_text, parse_html
+from src.common.fetch import fetch_page
 
+ENTRY_CONTENT = by_class('div', 'entry-content')
+POST_CONTENT = by_class('div', 'post-content')
+PAYWALL_MARKERS = Markers(["réservé aux membres", "Connectez-vous", "Authenticate to login"])
 
-def get_afg_article_content(driver, url):
+
+def extract_afg_article_content(html, url):
     """
     Extrait le contenu ou détecte si l'accès est restreint.
     """
-    try:
-        driver.get(url)
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'lxml')
-
-        # 1. DÉTECTION PAYWALL / MEMBRES
-        # On cherche des mots clés indiquant que la page est bloquée
-        full_text = soup.get_text()
-        if "réservé aux membres" in full_text or "Connectez-vous" in full_text or "Authenticate to login" in full_text:
-            # On vérifie si on a quand même accès au contenu (parfois le message est là mais le contenu aussi)
-            if not soup.find('div', class_='entry-content'):
-                return "[CONTENU RESTREINT - AUTHENTIFICATION REQUISE]"
-
-        # 2. EXTRACTION DU CONTENU
-        content_div = soup.find('div', class_='entry-content')
-
-        # Fallback
-        if not content_div:
-            content_div = soup.find('div', class_='post-content')
-
-        if content_div:
-            # On nettoie un peu les retours à la ligne multiples
-            text = content_div.get_text(separator='\n\n', strip=True)
-            return text
-        else:
-            return "[Erreur : Conteneur entry-content introuvable]"
+    root = parse_html(html)
+    content_div = find_first(root, ENTRY_CONTENT)
+
+    # 1. DÉTECTION PAYWALL / MEMBRES
+    # On cherche des mots clés indiquant que la page est bloquée.
+    # Si le contenu est là (parfois le message est là mais le contenu aussi), inutile
+    # de lire le texte de toute la page.
+    if content_div is None and PAYWALL_MARKERS.search(get_text(root)):
+        return "[CONTENU RESTREINT - AUTHENTIFICATION REQUISE]"
+
+    # 2. EXTRACTION DU CONTENU
+    # Fallback
+    if content_div is None:
+        content_div = find_first(root, POST_CONTENT)
 
+    if content_div is not None:
+        # On nettoie un peu les retours à la ligne multiples
+        text = get_text(content_div, separator='\n\n', strip=True)
+        return text
+    else:
+        return "[Erreur : Conteneur entry-content introuvable]"
+
+
+def get_afg_article_content(driver, url):
+    """Charge l'article AFG (HTTP ou navigateur) et en extrait le contenu."""
+    try:
+        html = fetch_page(driver, url, "afg", "content")
+        return extract_afg_article_content(html, url)
     except Exception as e:
         print(f"   ⚠️ Erreur contenu {url}: {e}")
         return ""
\ No newline at end of file
@@ -1,28 +1,23 @@
-import time
 import re
+import html as html_lib
+from datetime import datetime
+from zoneinfo import ZoneInfo
 from bs4 import BeautifulSoup
+from src.common.fetch import fetch_page
+from src.common.list_api import fetch_api_list
 
+MOIS = ['janvier', 'février', 'mars', 'avril', 'mai', 'juin', 'juillet',
+        'août', 'septembre', 'octobre', 'novembre', 'décembre']
 
-def get_afg_articles_list(driver):
-    # --- CONFIGURATION ---
-    NB_ARTICLES_WANTED = 10  # <--- C'est ici qu'on change le nombre !
-    # ---------------------
+# Fuseau du site : les dates « Mis en ligne le » de la page sont à l'heure de Paris
+PARIS = ZoneInfo("Europe/Paris")
 
-    print(f"   [AFG] Récupération des {NB_ARTICLES_WANTED} derniers articles...")
-    url = "https://www.afg.asso.fr/fr/actualites/"
 
-    driver.get(url)
-    time.sleep(5)
-
-    soup = BeautifulSoup(driver.page_source, 'lxml')
+def parse_afg_articles_list(html, limit=None):
+    """Articles d'une page de liste AFG (les `limit` premiers si précisé)."""
+    soup = BeautifulSoup(html, 'lxml')
     cards = soup.find_all('div', class_='card-body')
 
-    if len(cards) == 0:
-        print("   ⚠️ Liste vide, tentative attente supplémentaire...")
-        time.sleep(5)
-        soup = BeautifulSoup(driver.page_source, 'lxml')
-        cards = soup.find_all('div', class_='card-body')
-
     # Petit check pour info
     print(f"   -> {len(cards)} cartes visibles sur la page.")
 
@@ -30,8 +25,8 @@ def get_afg_articles_list(driver):
     count = 0
 
     for card_body in cards:
-        # ON UTILISE LA VARIABLE ICI
-        if count >= NB_ARTICLES_WANTED:
+        # Limite du nombre d'articles (aucune en backfill)
+        if limit is not None and count >= limit:
             break
 
         # 1. Titre
@@ -64,5 +59,58 @@ def get_afg_articles_list(driver):
                     })
                     count += 1
 
+    return articles_list
+
+
+def parse_afg_api_hits(hits, limit=None):
+    """Articles à partir des résultats de l'index Algolia (même format que la page HTML)."""
+    articles_list = []
+
+    for hit in hits:
+        if limit is not None and len(articles_list) >= limit:
+            break
+
+        title = html_lib.unescape(hit.get('post_title') or '').strip()
+        link = hit.get('permalink')
+        if not title or not link:
+            continue
+
+        full_url = link if link.startswith('http') else "https://www.afg.asso.fr" + link
+        if "/fr/" not in full_url:
+            continue
+
+        # post_date : timestamp Unix -> "Mis en ligne le 3 décembre 2025" comme sur la page
+        # (jour à Paris, comme le site, quel que soit le fuseau de la machine)
+        date_pub = "Date non trouvée"
+        if isinstance(hit.get('post_date'), (int, float)):
+            d = datetime.fromtimestamp(hit['post_date'], PARIS)
+            date_pub = f"Mis en ligne le {d.day} {MOIS[d.month - 1]} {d.year}"
+
+        articles_list.append({
+            'title': title,
+            'url': full_url,
+            'date': date_pub
+        })
+
+    return articles_list
+
+
+def get_afg_articles_list(driver):
+    # --- CONFIGURATION ---
+    NB_ARTICLES_WANTED = 10  # <--- C'est ici qu'on change le nombre !
+    # ---------------------
+
+    print(f"   [AFG] Récupération des {NB_ARTICLES_WANTED} derniers articles...")
+    url = "https://www.afg.asso.fr/fr/actualites/"
+
+    # Index Algolia interrogé directement (endpoint capturé une fois depuis la page)
+    articles_list = fetch_api_list("afg", parse_afg_api_hits, driver, url, NB_ARTICLES_WANTED)
+    if articles_list is not None:
+        print(f"   [AFG] {len(articles_list)} articles sélectionnés (API).")
+        return articles_list
+
+    html = fetch_page(driver, url, "afg", "list")
+    articles_list = parse_afg_articles_list(html, NB_ARTICLES_WANTED)
+
     print(f"   [AFG] {len(articles_list)} articles sélectionnés.")
     return articles_list
\ No newline at end of file
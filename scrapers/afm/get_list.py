@@ -1,19 +1,11 @@
-import time
 import re
 from bs4 import BeautifulSoup
+from src.common.fetch import fetch_page
 
 
-def get_afm_articles_list(driver):
-    # Nombre d'articles à récupérer
-    NB_ARTICLES_WANTED = 5
-
-    print(f"   [AFM] Récupération des {NB_ARTICLES_WANTED} derniers articles...")
-    url = "https://www.afm.nl/en/sector/actueel"
-
-    driver.get(url)
-    time.sleep(5)
-
-    soup = BeautifulSoup(driver.page_source, 'lxml')
+def parse_afm_articles_list(html, limit=None):
+    """Articles d'une page de liste AFM (les `limit` premiers si précisé)."""
+    soup = BeautifulSoup(html, 'lxml')
 
     # CIBLAGE : On utilise la classe identifiée au niveau -4 du diagnostic
     # La classe est souvent multiple : "cc-em cc-em--article"
@@ -26,7 +18,7 @@ def get_afm_articles_list(driver):
     count = 0
 
     for card in cards:
-        if count >= NB_ARTICLES_WANTED:
+        if limit is not None and count >= limit:
             break
 
         # 1. Titre
@@ -61,5 +53,18 @@ def get_afm_articles_list(driver):
             })
             count += 1
 
+    return articles_list
+
+
+def get_afm_articles_list(driver):
+    # Nombre d'articles à récupérer
+    NB_ARTICLES_WANTED = 5
+
+    print(f"   [AFM] Récupération des {NB_ARTICLES_WANTED} derniers articles...")
+    url = "https://www.afm.nl/en/sector/actueel"
+
+    html = fetch_page(driver, url, "afm", "list")
+    articles_list = parse_afm_articles_list(html, NB_ARTICLES_WANTED)
+
     print(f"   [AFM] {len(articles_list)} articles sélectionnés.")
     return articles_list
\ No newline at end of file
@@ -1,34 +1,37 @@
-import time
-from bs4 import BeautifulSoup
+from src.common.extraction import Markers, by_class, find_first, get_text, parse_html
+from src.common.fetch import fetch_page
 
+NEWS_DETAIL = by_class('section', 'wrapper-news-detail')
+STOP_MARKERS = Markers(["Back", "JOIN THE ALFI COMMUNITY", "Related documents"])
 
-def get_alfi_article_content(driver, url):
+
+def extract_alfi_article_content(html, url):
     """
     Extrait le contenu de la section 'wrapper-news-detail'.
     """
-    try:
-        driver.get(url)
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+    root = parse_html(html)
 
-        # CIBLAGE : Identifié par le diagnostic (Niveau 1)
-        content_section = soup.find('section', class_='wrapper-news-detail')
+    # CIBLAGE : Identifié par le diagnostic (Niveau 1)
+    content_section = find_first(root, NEWS_DETAIL)
 
-        if content_section:
-            full_text = content_section.get_text(separator='\n\n', strip=True)
+    if content_section is not None:
+        full_text = get_text(content_section, separator='\n\n', strip=True)
 
-            # NETTOYAGE
-            # On coupe le bas de page inutile
-            stop_markers = ["Back", "JOIN THE ALFI COMMUNITY", "Related documents"]
-            for marker in stop_markers:
-                if marker in full_text:
-                    full_text = full_text.split(marker)[0]
+        # NETTOYAGE
+        # On coupe le bas de page inutile
+        full_text = STOP_MARKERS.cut(full_text)
 
-            return full_text.strip()
-        else:
-            print(f"   ⚠️ Section 'wrapper-news-detail' introuvable sur {url}")
-            return ""
+        return full_text.strip()
+    else:
+        print(f"   ⚠️ Section 'wrapper-news-detail' introuvable sur {url}")
+        return ""
 
+
+def get_alfi_article_content(driver, url):
+    """Charge l'article ALFI (HTTP ou navigateur) et en extrait le contenu."""
+    try:
+        html = fetch_page(driver, url, "alfi", "content")
+        return extract_alfi_article_content(html, url)
     except Exception as e:
         print(f"   ⚠️ Erreur contenu {url}: {e}")
         return ""
\ No newline at end of file
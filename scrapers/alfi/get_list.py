@@ -1,18 +1,11 @@
-import time
 import re
 from bs4 import BeautifulSoup
+from src.common.fetch import fetch_page
 
 
-def get_alfi_articles_list(driver):
-    NB_ARTICLES = 5
-    print(f"   [ALFI] Récupération des {NB_ARTICLES} derniers articles...")
-
-    # Page news ALFI
-    url = "https://www.alfi.lu/en-gb/news/1"
-
-    driver.get(url)
-    time.sleep(5)
-    soup = BeautifulSoup(driver.page_source, 'lxml')
+def parse_alfi_articles_list(html, limit=None):
+    """Articles d'une page de liste ALFI (les `limit` premiers si précisé)."""
+    soup = BeautifulSoup(html, 'lxml')
 
     # CIBLAGE : On prend les balises <a> qui ont la classe 'card'
     # (Identifié via ton diagnostic précédent Niveau -3)
@@ -22,7 +15,7 @@ def get_alfi_articles_list(driver):
     count = 0
 
     for card in cards:
-        if count >= NB_ARTICLES: break
+        if limit is not None and count >= limit: break
 
         # 1. URL
         link = card.get('href')
@@ -50,5 +43,18 @@ def get_alfi_articles_list(driver):
         })
         count += 1
 
+    return articles_list
+
+
+def get_alfi_articles_list(driver):
+    NB_ARTICLES = 5
+    print(f"   [ALFI] Récupération des {NB_ARTICLES} derniers articles...")
+
+    # Page news ALFI
+    url = "https://www.alfi.lu/en-gb/news/1"
+
+    html = fetch_page(driver, url, "alfi", "list")
+    articles_list = parse_alfi_articles_list(html, NB_ARTICLES)
+
     print(f"   [ALFI] {len(articles_list)} articles trouvés.")
     return articles_list
\ No newline at end of file
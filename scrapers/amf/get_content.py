@@ -1,44 +1,50 @@
-import time
-from bs4 import BeautifulSoup
+from lxml import etree
+from src.common.extraction import Markers, by_class, find_first, get_text, parse_html
+from src.common.fetch import fetch_page
 
+CONTENT_TOC = by_class('div', 'contentToc')
+# Toute classe contenant 'field--name-body' (standard Drupal)
+FIELD_BODY = etree.XPath("(//div[contains(@class, 'field--name-body')])[1]")
 
-def get_amf_article_content(driver, url):
+STOP_MARKERS = Markers([
+    "Mots clés",
+    "Sur le même thème",
+    "S'abonner à nos alertes",
+    "Revenir en haut de page"
+])
+
+
+def extract_amf_article_content(html, url):
     """
     Extrait le contenu de l'article AMF.
     Cible la div 'contentToc' ou 'field--name-body'.
     """
-    try:
-        driver.get(url)
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+    root = parse_html(html)
 
-        # CIBLAGE : Basé sur ton diagnostic (Niveau -2)
-        content_div = soup.find('div', class_='contentToc')
+    # CIBLAGE : Basé sur ton diagnostic (Niveau -2)
+    content_div = find_first(root, CONTENT_TOC)
 
-        # Fallback : Si contentToc n'existe pas, on cherche le standard Drupal
-        if not content_div:
-            content_div = soup.find('div', class_=lambda x: x and 'field--name-body' in x)
+    # Fallback : Si contentToc n'existe pas, on cherche le standard Drupal
+    if content_div is None:
+        content_div = find_first(root, FIELD_BODY)
 
-        if content_div:
-            full_text = content_div.get_text(separator='\n\n', strip=True)
+    if content_div is not None:
+        full_text = get_text(content_div, separator='\n\n', strip=True)
 
-            # NETTOYAGE DU BAS DE PAGE
-            stop_markers = [
-                "Mots clés",
-                "Sur le même thème",
-                "S'abonner à nos alertes",
-                "Revenir en haut de page"
-            ]
+        # NETTOYAGE DU BAS DE PAGE
+        full_text = STOP_MARKERS.cut(full_text)
 
-            for marker in stop_markers:
-                if marker in full_text:
-                    full_text = full_text.split(marker)[0]
+        return full_text.strip()
+    else:
+        print(f"   ⚠️ Conteneur introuvable sur {url}")
+        return ""
 
-            return full_text.strip()
-        else:
-            print(f"   ⚠️ Conteneur introuvable sur {url}")
-            return ""
 
+def get_amf_article_content(driver, url):
+    """Charge l'article AMF (HTTP ou navigateur) et en extrait le contenu."""
+    try:
+        html = fetch_page(driver, url, "amf", "content")
+        return extract_amf_article_content(html, url)
     except Exception as e:
         print(f"   ⚠️ Erreur contenu {url}: {e}")
         return ""
\ No newline at end of file
@@ -1,17 +1,10 @@
-import time
 from bs4 import BeautifulSoup
+from src.common.fetch import fetch_page
 
 
-def get_amf_articles_list(driver):
-    NB_ARTICLES = 5
-    print(f"   [AMF] Récupération des {NB_ARTICLES} derniers articles...")
-
-    url = "https://www.amf-france.org/fr/actualites-publications/actualites"
-
-    driver.get(url)
-    time.sleep(5)
-
-    soup = BeautifulSoup(driver.page_source, 'lxml')
+def parse_amf_articles_list(html, limit=None):
+    """Articles d'une page de liste AMF (les `limit` premiers si précisé)."""
+    soup = BeautifulSoup(html, 'lxml')
 
     articles_list = []
 
@@ -27,7 +20,7 @@ def get_amf_articles_list(driver):
 
     count = 0
     for row in rows:
-        if count >= NB_ARTICLES: break
+        if limit is not None and count >= limit: break
 
         # On récupère les cellules (colonnes)
         cols = row.find_all('td')
@@ -53,5 +46,17 @@ def get_amf_articles_list(driver):
                 })
                 count += 1
 
+    return articles_list
+
+
+def get_amf_articles_list(driver):
+    NB_ARTICLES = 5
+    print(f"   [AMF] Récupération des {NB_ARTICLES} derniers articles...")
+
+    url = "https://www.amf-france.org/fr/actualites-publications/actualites"
+
+    html = fetch_page(driver, url, "amf", "list")
+    articles_list = parse_amf_articles_list(html, NB_ARTICLES)
+
     print(f"   [AMF] {len(articles_list)} articles trouvés.")
     return articles_list
\ No newline at end of file
@@ -1,54 +1,64 @@
-import time
-from bs4 import BeautifulSoup
+import re
+from src.common.extraction import all_by_class, by_tag, find_all, find_first, get_text, parse_html, text_length
+from src.common.fetch import fetch_page
 
+SF_COLS = all_by_class('div', 'sf_colsIn')
+ARTICLE = by_tag('article')
+MAIN = by_tag('main')
 
-def get_cbi_article_content(driver, url):
+# Parasites courants sur ce site (une seule regex pour toutes les phrases)
+STOP_PHRASES = re.compile("|".join(re.escape(phrase) for phrase in [
+    "Share this page",
+    "Cookie Policy",
+    "See Also:",
+    "Notes to Editor"
+]))
+
+
+def extract_cbi_article_content(html, url):
     """
     Extrait le contenu pour Central Bank of Ireland (CMS Sitefinity).
     Stratégie : Chercher les conteneurs standards du CMS (sf_colsIn).
     """
-    try:
-        driver.get(url)
-        time.sleep(3)
-        soup = BeautifulSoup(driver.page_source, 'lxml')
-
-        full_text = ""
-
-        # --- STRATÉGIE 1 : Conteneurs Sitefinity (Standard) ---
-        # Le contenu éditorial est souvent dans <div class="sf_colsIn">
-        content_divs = soup.find_all('div', class_='sf_colsIn')
-
-        if content_divs:
-            # On prend le div qui contient le plus de texte (pour éviter les sidebars)
-            main_div = max(content_divs, key=lambda d: len(d.get_text()))
-            full_text = main_div.get_text(separator='\n\n', strip=True)
-
-        # --- STRATÉGIE 2 : Fallback sur 'article' ou 'main' ---
-        if len(full_text) < 50:
-            fallback = soup.find('article') or soup.find('main')
-            if fallback:
-                full_text = fallback.get_text(separator='\n\n', strip=True)
-
-        # --- NETTOYAGE ---
-        if full_text:
-            # Nettoyage des parasites courants sur ce site
-            stop_phrases = [
-                "Share this page",
-                "Cookie Policy",
-                "See Also:",
-                "Notes to Editor"
-            ]
-
-            cleaned_lines = []
-            for line in full_text.split('\n'):
-                # On enlève les lignes vides ou qui contiennent des phrases parasites
-                if line.strip() and not any(phrase in line for phrase in stop_phrases):
-                    cleaned_lines.append(line.strip())
-
-            return "\n".join(cleaned_lines)
-
-        return ""
+    root = parse_html(html)
+
+    full_text = ""
+
+    # --- STRATÉGIE 1 : Conteneurs Sitefinity (Standard) ---
+    # Le contenu éditorial est souvent dans <div class="sf_colsIn">
+    content_divs = find_all(root, SF_COLS)
+
+    if content_divs:
+        # On prend le div qui contient le plus de texte (pour éviter les sidebars)
+        main_div = max(content_divs, key=text_length)
+        full_text = get_text(main_div, separator='\n\n', strip=True)
 
+    # --- STRATÉGIE 2 : Fallback sur 'article' ou 'main' ---
+    if len(full_text) < 50:
+        fallback = find_first(root, ARTICLE)
+        if fallback is None:
+            fallback = find_first(root, MAIN)
+        if fallback is not None:
+            full_text = get_text(fallback, separator='\n\n', strip=True)
+
+    # --- NETTOYAGE ---
+    if full_text:
+        cleaned_lines = []
+        for line in full_text.split('\n'):
+            # On enlève les lignes vides ou qui contiennent des phrases parasites
+            if line.strip() and not STOP_PHRASES.search(line):
+                cleaned_lines.append(line.strip())
+
+        return "\n".join(cleaned_lines)
+
+    return ""
+
+
+def get_cbi_article_content(driver, url):
+    """Charge l'article CBI (HTTP ou navigateur) et en extrait le contenu."""
+    try:
+        html = fetch_page(driver, url, "cbi", "content")
+        return extract_cbi_article_content(html, url)
     except Exception as e:
         print(f"   ⚠️ Erreur contenu {url}: {e}")
         return ""
\ No newline at end of file
@@ -1,70 +1,74 @@
-import time
 import re
 from bs4 import BeautifulSoup
+from src.common.fetch import fetch_page
 
 
-def get_cbi_articles_list(driver):
-    NB_ARTICLES = 5
-    print(f"   [CBI] Récupération des {NB_ARTICLES} derniers articles...")
+def parse_cbi_articles_list(html, limit=None):
+    """Articles d'une page de liste CBI (les `limit` premiers si précisé)."""
+    soup = BeautifulSoup(html, 'lxml')
+    articles_list = []
 
-    url = "https://www.centralbank.ie/news-media/press-releases"
+    # Basé sur le diagnostic : GRAND-PARENT = class 'spotlight'
+    # On cherche tous les blocs qui contiennent "spotlight"
+    cards = soup.find_all('div', class_='spotlight')
 
-    try:
-        driver.get(url)
-        # Le site semble charger des éléments dynamiquement ou via des composants JS
-        time.sleep(5)
+    count = 0
+    for card in cards:
+        if limit is not None and count >= limit: break
 
-        soup = BeautifulSoup(driver.page_source, 'lxml')
-        articles_list = []
+        # Basé sur le diagnostic : PARENT direct = class 'spotlight-content'
+        content_div = card.find('div', class_='spotlight-content')
 
-        # Basé sur le diagnostic : GRAND-PARENT = class 'spotlight'
-        # On cherche tous les blocs qui contiennent "spotlight"
-        cards = soup.find_all('div', class_='spotlight')
+        if not content_div:
+            continue
 
-        count = 0
-        for card in cards:
-            if count >= NB_ARTICLES: break
+        # Le lien <a> est dans spotlight-content
+        link_tag = content_div.find('a')
 
-            # Basé sur le diagnostic : PARENT direct = class 'spotlight-content'
-            content_div = card.find('div', class_='spotlight-content')
+        if link_tag:
+            title = link_tag.get_text(strip=True)
+            href = link_tag.get('href', '')
 
-            if not content_div:
+            # Vérification si le lien est valide
+            if not href or href == "#":
                 continue
 
-            # Le lien <a> est dans spotlight-content
-            link_tag = content_div.find('a')
+            # Gestion des URLs relatives vs absolues
+            if href.startswith('http'):
+                full_url = href
+            else:
+                full_url = "https://www.centralbank.ie" + href
+
+            # Extraction de la date via Regex sur tout le texte de la carte
+            # Format observé : "05 December 2025"
+            date_pub = "Date non trouvée"
+            card_text = card.get_text(" ", strip=True)
 
-            if link_tag:
-                title = link_tag.get_text(strip=True)
-                href = link_tag.get('href', '')
+            # Regex pour : 1 ou 2 chiffres + espace + Mot (Mois) + espace + 4 chiffres
+            match_date = re.search(r"(\d{1,2}\s+[A-Za-z]+\s+\d{4})", card_text)
 
-                # Vérification si le lien est valide
-                if not href or href == "#":
-                    continue
+            if match_date:
+                date_pub = match_date.group(1)
 
-                # Gestion des URLs relatives vs absolues
-                if href.startswith('http'):
-                    full_url = href
-                else:
-                    full_url = "https://www.centralbank.ie" + href
+            articles_list.append({
+                'title': title,
+                'url': full_url,
+                'date': date_pub
+            })
+            count += 1
 
-                # Extraction de la date via Regex sur tout le texte de la carte
-                # Format observé : "05 December 2025"
-                date_pub = "Date non trouvée"
-                card_text = card.get_text(" ", strip=True)
+    return articles_list
 
-                # Regex pour : 1 ou 2 chiffres + espace + Mot (Mois) + espace + 4 chiffres
-                match_date = re.search(r"(\d{1,2}\s+[A-Za-z]+\s+\d{4})", card_text)
 
-                if match_date:
-                    date_pub = match_date.group(1)
+def get_cbi_articles_list(driver):
+    NB_ARTICLES = 5
+    print(f"   [CBI] Récupération des {NB_ARTICLES} derniers articles...")
 
-                articles_list.append({
-                    'title': title,
-                    'url': full_url,
-                    'date': date_pub
-                })
-                count += 1
+    url = "https://www.centralbank.ie/news-media/press-releases"
+
+    try:
+        html = fetch_page(driver, url, "cbi", "list")
+        articles_list = parse_cbi_articles_list(html, NB_ARTICLES)
 
         print(f"   [CBI] {len(articles_list)} articles trouvés.")
         return articles_list
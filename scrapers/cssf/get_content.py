@@ -1,49 +1,55 @@
-import time
-from bs4 import BeautifulSoup
+import re
+from src.common.extraction import by_class, find_first, get_text, parse_html
+from src.common.fetch import fetch_page
 
+CONTENT = by_class('div', 'content')
 
-def get_cssf_article_content(driver, url):
+# Ce qu'on veut virer (le header de l'article avec les partages), en une seule regex
+NOISE_START = re.compile("|".join(re.escape(noise) for noise in [
+    "Envoyer par email",
+    "Partager sur LinkedIn",
+    "Partager sur Facebook",
+    "Partager sur Twitter",
+    "Publié le"  # La date est déjà dans la liste, on peut l'enlever du corps si on veut
+]))
+
+
+def extract_cssf_article_content(html, url):
     """
     Extrait le contenu de la div 'content'.
     Nettoie les boutons de partage au début.
     """
-    try:
-        driver.get(url)
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'lxml')
-
-        # CIBLAGE : Classe 'content' identifiée au diagnostic
-        content_div = soup.find('div', class_='content')
-
-        if content_div:
-            # On récupère tout le texte
-            full_text = content_div.get_text(separator='\n\n', strip=True)
-
-            # NETTOYAGE
-            # On définit ce qu'on veut virer (le header de l'article avec les partages)
-            noise_start = [
-                "Envoyer par email",
-                "Partager sur LinkedIn",
-                "Partager sur Facebook",
-                "Partager sur Twitter",
-                "Publié le"  # La date est déjà dans la liste, on peut l'enlever du corps si on veut
-            ]
-
-            lines = full_text.split('\n\n')
-            cleaned_lines = []
-
-            for line in lines:
-                # Si la ligne contient un mot clé de bruit, on l'ignore
-                if any(noise in line for noise in noise_start):
-                    continue
-                cleaned_lines.append(line)
-
-            return "\n\n".join(cleaned_lines).strip()
-
-        else:
-            print(f"   ⚠️ Conteneur 'content' introuvable sur {url}")
-            return ""
+    root = parse_html(html)
+
+    # CIBLAGE : Classe 'content' identifiée au diagnostic
+    content_div = find_first(root, CONTENT)
+
+    if content_div is not None:
+        # On récupère tout le texte
+        full_text = get_text(content_div, separator='\n\n', strip=True)
+
+        # NETTOYAGE
+        lines = full_text.split('\n\n')
+        cleaned_lines = []
 
+        for line in lines:
+            # Si la ligne contient un mot clé de bruit, on l'ignore
+            if NOISE_START.search(line):
+                continue
+            cleaned_lines.append(line)
+
+        return "\n\n".join(cleaned_lines).strip()
+
+    else:
+        print(f"   ⚠️ Conteneur 'content' introuvable sur {url}")
+        return ""
+
+
+def get_cssf_article_content(driver, url):
+    """Charge l'article CSSF (HTTP ou navigateur) et en extrait le contenu."""
+    try:
+        html = fetch_page(driver, url, "cssf", "content")
+        return extract_cssf_article_content(html, url)
     except Exception as e:
         print(f"   ⚠️ Erreur contenu {url}: {e}")
         return ""
\ No newline at end of file
@@ -1,18 +1,11 @@
-import time
 import re
 from bs4 import BeautifulSoup
+from src.common.fetch import fetch_page
 
 
-def get_cssf_articles_list(driver):
-    NB_ARTICLES = 5
-    print(f"   [CSSF] Récupération des {NB_ARTICLES} derniers articles...")
-
-    url = "https://www.cssf.lu/fr/news-fr/"
-
-    driver.get(url)
-    time.sleep(5)
-
-    soup = BeautifulSoup(driver.page_source, 'lxml')
+def parse_cssf_articles_list(html, limit=None):
+    """Articles d'une page de liste CSSF (les `limit` premiers si précisé)."""
+    soup = BeautifulSoup(html, 'lxml')
 
     articles_list = []
 
@@ -21,7 +14,7 @@ def get_cssf_articles_list(driver):
 
     count = 0
     for card in cards:
-        if count >= NB_ARTICLES: break
+        if limit is not None and count >= limit: break
 
         # 1. TITRE (h3)
         title_tag = card.find('h3')
@@ -55,5 +48,17 @@ def get_cssf_articles_list(driver):
             })
             count += 1
 
+    return articles_list
+
+
+def get_cssf_articles_list(driver):
+    NB_ARTICLES = 5
+    print(f"   [CSSF] Récupération des {NB_ARTICLES} derniers articles...")
+
+    url = "https://www.cssf.lu/fr/news-fr/"
+
+    html = fetch_page(driver, url, "cssf", "list")
+    articles_list = parse_cssf_articles_list(html, NB_ARTICLES)
+
     print(f"   [CSSF] {len(articles_list)} articles trouvés.")
     return articles_list
\ No newline at end of file
@@ -1,67 +1,70 @@
-import time
-from bs4 import BeautifulSoup
+from src.common.extraction import Markers, by_class, find_first, get_text, parse_html
+from src.common.fetch import fetch_page
 
+FULL_ARTICLE = by_class('article', 'node--view-mode-full')
 
-def get_esma_article_content(driver, url):
+# 1. Bruit de fin de page
+STOP_MARKERS = Markers([
+    "Related Documents",
+    "Download All Files",
+    "Back to top",
+    "Related News"
+])
+
+# 2. Bruit de début de page (Tags, date répétés) : lignes composées uniquement de ces mots
+NOISE_START = frozenset([
+    "About ESMA",
+    "Press Releases",
+    "Share this page",
+    "Menu",
+    "Home"
+])
+
+
+def extract_esma_article_content(html, url):
     """
     Extrait le contenu de l'article ESMA.
     Cible <article class="node--view-mode-full"> et nettoie le bruit.
     """
-    try:
-        driver.get(url)
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+    root = parse_html(html)
 
-        # CIBLAGE : Identifié par le diagnostic (Candidat 0)
-        # On cherche l'article en mode "vue complète"
-        article = soup.find('article', class_='node--view-mode-full')
+    # CIBLAGE : Identifié par le diagnostic (Candidat 0)
+    # On cherche l'article en mode "vue complète"
+    article = find_first(root, FULL_ARTICLE)
 
-        if article:
-            # On récupère le texte avec des sauts de ligne
-            full_text = article.get_text(separator='\n\n', strip=True)
+    if article is not None:
+        # On récupère le texte avec des sauts de ligne
+        full_text = get_text(article, separator='\n\n', strip=True)
 
-            # NETTOYAGE
-            # 1. Bruit de fin de page
-            stop_markers = [
-                "Related Documents",
-                "Download All Files",
-                "Back to top",
-                "Related News"
-            ]
-            for marker in stop_markers:
-                if marker in full_text:
-                    full_text = full_text.split(marker)[0]
+        # NETTOYAGE
+        full_text = STOP_MARKERS.cut(full_text)
 
-            # 2. Bruit de début de page (Tags, date répétés)
-            # On va supprimer les lignes qui contiennent ces mots clés génériques
-            noise_start = [
-                "About ESMA",
-                "Press Releases",
-                "Share this page",
-                "Menu",
-                "Home"
-            ]
+        lines = full_text.split('\n\n')
+        cleaned_lines = []
 
-            lines = full_text.split('\n\n')
-            cleaned_lines = []
+        # On parcourt les lignes et on ne garde que celles qui sont du vrai texte
+        for line in lines:
+            # Si la ligne est exactement un des mots parasites, on saute
+            if line.strip() in NOISE_START:
+                continue
+            # Si la ligne est une date seule (04/12/2025), on saute (déjà dans la liste)
+            if len(line.strip()) == 10 and "/" in line:
+                continue
 
-            # On parcourt les lignes et on ne garde que celles qui sont du vrai texte
-            for line in lines:
-                # Si la ligne est exactement un des mots parasites, on saute
-                if line.strip() in noise_start:
-                    continue
-                # Si la ligne est une date seule (04/12/2025), on saute (déjà dans la liste)
-                if len(line.strip()) == 10 and "/" in line:
-                    continue
+            cleaned_lines.append(line)
 
-                cleaned_lines.append(line)
+        return "\n\n".join(cleaned_lines).strip()
 
-            return "\n\n".join(cleaned_lines).strip()
+    else:
+        print(f"   ⚠️ Conteneur <article> introuvable sur {url}")
+        return ""
 
-        else:
-            print(f"   ⚠️ Conteneur <article> introuvable sur {url}")
-            return ""
 
+def get_esma_article_content(driver, url):
+    """Charge l'article ESMA (HTTP ou navigateur) et en extrait le contenu."""
+    try:
+        html = fetch_page(driver, url, "esma", "content")
+        return extract_esma_article_content(html, url)
     except Exception as e:
         print(f"   ⚠️ Erreur contenu {url}: {e}")
         return ""
\ No newline at end of file
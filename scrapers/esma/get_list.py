@@ -1,23 +1,18 @@
-import time
 import re
 from bs4 import BeautifulSoup
+from src.common.fetch import fetch_page
 
 
-def get_esma_articles_list(driver):
-    NB_ARTICLES = 5
-    print(f"   [ESMA] Récupération des {NB_ARTICLES} derniers articles...")
-
-    url = "https://www.esma.europa.eu/press-news/esma-news"
-    driver.get(url)
-    time.sleep(5)
-    soup = BeautifulSoup(driver.page_source, 'lxml')
+def parse_esma_articles_list(html, limit=None):
+    """Articles d'une page de liste ESMA (les `limit` premiers si précisé)."""
+    soup = BeautifulSoup(html, 'lxml')
 
     articles_list = []
     cards = soup.find_all('div', class_='search-card')
 
     count = 0
     for card in cards:
-        if count >= NB_ARTICLES: break
+        if limit is not None and count >= limit: break
 
         title_div = card.find('div', class_='search-title')
         if not title_div: continue
@@ -44,5 +39,16 @@ def get_esma_articles_list(driver):
             })
             count += 1
 
+    return articles_list
+
+
+def get_esma_articles_list(driver):
+    NB_ARTICLES = 5
+    print(f"   [ESMA] Récupération des {NB_ARTICLES} derniers articles...")
+
+    url = "https://www.esma.europa.eu/press-news/esma-news"
+    html = fetch_page(driver, url, "esma", "list")
+    articles_list = parse_esma_articles_list(html, NB_ARTICLES)
+
     print(f"   [ESMA] {len(articles_list)} articles trouvés.")
     return articles_list
\ No newline at end of file
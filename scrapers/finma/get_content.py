@@ -1,51 +1,54 @@
-import time
-from bs4 import BeautifulSoup
-
-def get_finma_article_content(driver, url):
+from src.common.extraction import Markers, by_class, find_first, get_text, parse_html
+from src.common.fetch import fetch_page
+
+TEXT_PAGE = by_class('div', 'text-page')
+
+# Le conteneur 'text-page' inclut souvent le footer technique,
+# donc ce nettoyage reste indispensable.
+STOP_MARKERS = Markers([
+    "Dernière modification", # J'ai retiré le ':' pour être plus large
+    "Taille:",
+    "Langue(s):",
+    "Contact\n",
+    "Autorité fédérale de surveillance des marchés financiers FINMA"
+])
+
+def extract_finma_article_content(html, url):
     """
     Extrait le contenu global via le conteneur 'text-page' pour éviter de rater
     des paragraphes ou des listes situés hors des blocs 'mod-content'.
     """
-    try:
-        driver.get(url)
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, 'lxml')
-
-        # --- CORRECTION MAJEURE ---
-        # Au lieu de chercher des morceaux (mod-teaser, mod-content),
-        # on cible le conteneur parent global identifié par le diagnostic.
-        # Cela capture tout : le chapeau, le corps, les listes et les <span> isolés.
-        content_div = soup.find('div', class_='text-page')
-
-        full_text = ""
-
-        if content_div:
-            # separator='\n\n' est CRUCIAL pour que la liste des membres
-            # (Mirjam Eggen, etc.) ne soit pas collée en une seule ligne.
-            full_text = content_div.get_text(separator='\n\n', strip=True)
-        else:
-            # Fallback : Si 'text-page' n'existe pas (anciennes pages ?),
-            # on tente une extraction brute du body ou on log l'erreur.
-            print(f"   ⚠️ Conteneur 'text-page' introuvable sur {url}")
-            return ""
-
-        # --- NETTOYAGE DU PIED DE PAGE ---
-        # Le conteneur 'text-page' inclut souvent le footer technique,
-        # donc ce nettoyage reste indispensable.
-        stop_markers = [
-            "Dernière modification", # J'ai retiré le ':' pour être plus large
-            "Taille:",
-            "Langue(s):",
-            "Contact\n",
-            "Autorité fédérale de surveillance des marchés financiers FINMA"
-        ]
-
-        for marker in stop_markers:
-            if marker in full_text:
-                full_text = full_text.split(marker)[0]
-
-        return full_text.strip()
+    root = parse_html(html)
+
+    # --- CORRECTION MAJEURE ---
+    # Au lieu de chercher des morceaux (mod-teaser, mod-content),
+    # on cible le conteneur parent global identifié par le diagnostic.
+    # Cela capture tout : le chapeau, le corps, les listes et les <span> isolés.
+    content_div = find_first(root, TEXT_PAGE)
+
+    full_text = ""
+
+    if content_div is not None:
+        # separator='\n\n' est CRUCIAL pour que la liste des membres
+        # (Mirjam Eggen, etc.) ne soit pas collée en une seule ligne.
+        full_text = get_text(content_div, separator='\n\n', strip=True)
+    else:
+        # Fallback : Si 'text-page' n'existe pas (anciennes pages ?),
+        # on tente une extraction brute du body ou on log l'erreur.
+        print(f"   ⚠️ Conteneur 'text-page' introuvable sur {url}")
+        return ""
 
+    # --- NETTOYAGE DU PIED DE PAGE ---
+    full_text = STOP_MARKERS.cut(full_text)
+
+    return full_text.strip()
+
+
+def get_finma_article_content(driver, url):
+    """Charge l'article FINMA (HTTP ou navigateur) et en extrait le contenu."""
+    try:
+        html = fetch_page(driver, url, "finma", "content")
+        return extract_finma_article_content(html, url)
     except Exception as e:
         print(f"   ⚠️ Erreur contenu {url}: {e}")
         return ""
\ No newline at end of file
@@ -1,18 +1,11 @@
-import time
 import re
 from bs4 import BeautifulSoup
+from src.common.fetch import fetch_page
 
 
-def get_finma_articles_list(driver):
-    NB_ARTICLES = 5
-    print(f"   [FINMA] Récupération des {NB_ARTICLES} derniers articles...")
-
-    url = "https://www.finma.ch/fr/news/"
-
-    driver.get(url)
-    time.sleep(5)
-
-    soup = BeautifulSoup(driver.page_source, 'lxml')
+def parse_finma_articles_list(html, limit=None):
+    """Articles d'une page de liste FINMA (les `limit` premiers si précisé)."""
+    soup = BeautifulSoup(html, 'lxml')
 
     articles_list = []
 
@@ -20,7 +13,7 @@ def get_finma_articles_list(driver):
 
     count = 0
     for card in cards:
-        if count >= NB_ARTICLES: break
+        if limit is not None and count >= limit: break
 
         title_link = card.find('a', class_='teaser-content-title')
 
@@ -50,5 +43,17 @@ def get_finma_articles_list(driver):
             })
             count += 1
 
+    return articles_list
+
+
+def get_finma_articles_list(driver):
+    NB_ARTICLES = 5
+    print(f"   [FINMA] Récupération des {NB_ARTICLES} derniers articles...")
+
+    url = "https://www.finma.ch/fr/news/"
+
+    html = fetch_page(driver, url, "finma", "list")
+    articles_list = parse_finma_articles_list(html, NB_ARTICLES)
+
     print(f"   [FINMA] {len(articles_list)} articles trouvés.")
     return articles_list
\ No newline at end of file
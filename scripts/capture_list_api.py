@@ -0,0 +1,73 @@
+"""
+Capture de l'endpoint JSON d'une liste d'articles (ex. index Algolia de l'AFG)
+et enregistrement de réponses pour les rejouer sans réseau.
+Lance depuis la racine : python scripts/capture_list_api.py --source afg
+Enregistrer les N premières pages : python scripts/capture_list_api.py --source afg --record 3
+Rejouer les réponses enregistrées : python scripts/capture_list_api.py --source afg --replay
+"""
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import SOURCES_CONFIG
+from src.common.driver_setup import get_driver
+from src.common.list_api import capture_endpoint, get_api_config, get_transport, iter_api_pages, load_endpoint
+from src.scrapers.backfill import list_page_url
+from src.scrapers.registry import SCRAPER_FUNCTIONS
+
+
+def main():
+    """Point d'entrée principal."""
+    source_code = "afg"
+    record_pages = 0
+
+    if "--source" in sys.argv:
+        idx = sys.argv.index("--source")
+        if idx + 1 < len(sys.argv):
+            source_code = sys.argv[idx + 1].lower()
+
+    if "--record" in sys.argv:
+        idx = sys.argv.index("--record")
+        if idx + 1 < len(sys.argv):
+            record_pages = max(1, int(sys.argv[idx + 1]))
+
+    print("\n" + "=" * 60)
+    print(f"📡 API DE LISTE : {SOURCES_CONFIG[source_code]['name']}")
+    print("=" * 60)
+
+    if not get_api_config(source_code):
+        print(f"   ❌ Pas de list_api configurée pour {source_code}")
+        return
+
+    if "--replay" in sys.argv:
+        endpoint = load_endpoint(source_code)
+        if endpoint is None:
+            print("   ❌ Aucun endpoint enregistré : lancer d'abord la capture")
+            return
+        transport = get_transport(source_code, "replay")
+        parse = SCRAPER_FUNCTIONS[source_code]["parse_api"]
+        for page, hits in enumerate(iter_api_pages(source_code, endpoint, transport=transport), 1):
+            items = parse(hits)
+            print(f"   📄 Page {page} : {len(items)} articles")
+            for item in items[:3]:
+                print(f"      • {item['date']} | {item['title'][:60]}")
+        return
+
+    driver = get_driver()
+    try:
+        endpoint = capture_endpoint(driver, source_code, list_page_url(source_code, 1))
+    finally:
+        driver.quit()
+
+    if endpoint is None or not record_pages:
+        return
+
+    transport = get_transport(source_code, "record")
+    for page, hits in enumerate(iter_api_pages(source_code, endpoint, max_pages=record_pages, transport=transport), 1):
+        print(f"   💾 Page {page} enregistrée ({len(hits)} résultats)")
+
+
+if __name__ == "__main__":
+    main()
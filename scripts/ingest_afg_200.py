@@ -4,13 +4,14 @@ Lance : python scripts/ingest_afg_200.py
 """
 import sys
 from pathlib import Path
-import json
 from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
 from config.database import get_engine
+from src.database.manager import bulk_upsert_articles, print_batch
+from src.storage.results_stream import UnreadableArticles, iter_articles_file
 
 MONTHS_FR = {
     'janvier': 1, 'février': 2, 'mars': 3, 'avril': 4,
@@ -51,62 +52,21 @@ def ingest_afg_articles():
     print("📥 INJECTION DES ARTICLES AFG")
     print("=" * 60)
 
-    # 1. Charger le JSON
+    # 1. Ouvrir le JSON
     json_path = "dev_analysis/afg/afg_200_articles.json"
 
-    print(f"\n📂 Chargement : {json_path}")
-
-    with open(json_path, 'r', encoding='utf-8') as f:
-        articles = json.load(f)
-
-    print(f"   ✅ {len(articles)} articles chargés")
-
-    # 2. Injection
-    engine = get_engine()
-
-    insert_query = text("""
-                        INSERT INTO articles (source, title, url, date_published, content, language)
-                        VALUES (:source, :title, :url, :date_published, :content, :language)
-                        """)
-
-    inserted = 0
-    skipped = 0
-    errors = 0
+    # Lecture en flux : les premiers lots sont écrits avant la fin de la lecture du fichier
+    print(f"\n📂 Lecture en flux : {json_path}")
+    unreadable = UnreadableArticles()
+    articles = iter_articles_file(json_path, on_error=unreadable)
 
+    # 2. Injection par lots (dates françaises parsées, doublons mis à jour s'ils ont changé)
     print("\n💾 Injection en base...")
-
-    with engine.connect() as conn:
-        for i, article in enumerate(articles, 1):
-            title = article['title']
-            title_short = title[:50] + '...' if len(title) > 50 else title
-
-            print(f"   [{i}/{len(articles)}] {title_short}", end='')
-
-            # Parser la date
-            date_sql = parse_french_date(article['date'])
-
-            try:
-                conn.execute(insert_query, {
-                    'source': 'AFG',
-                    'title': article['title'],
-                    'url': article['url'],
-                    'date_published': date_sql,
-                    'content': article['content'],
-                    'language': 'fr'
-                })
-                conn.commit()
-                inserted += 1
-                print(f" ✅")
-
-            except Exception as e:
-                if "Duplicate entry" in str(e):
-                    skipped += 1
-                    print(f" ⏭️  (doublon)")
-                else:
-                    errors += 1
-                    print(f" ❌ {e}")
+    totals = bulk_upsert_articles(articles, "afg", "fr", date_parser=parse_french_date, on_batch=print_batch)
+    totals["errors"] += unreadable.count
 
     # 3. Vérification
+    engine = get_engine()
     with engine.connect() as conn:
         result = conn.execute(text("SELECT COUNT(*) FROM articles WHERE source='AFG'"))
         total_afg = result.fetchone()[0]
@@ -115,10 +75,11 @@ def ingest_afg_articles():
     print("\n" + "=" * 60)
     print("📊 RÉSUMÉ")
     print("=" * 60)
-    print(f"   • Articles traités : {len(articles)}")
-    print(f"   • Insérés : {inserted}")
-    print(f"   • Doublons : {skipped}")
-    print(f"   • Erreurs : {errors}")
+    print(f"   • Articles traités : {sum(totals.values())}")
+    print(f"   • Insérés : {totals['inserted']}")
+    print(f"   • Mis à jour : {totals['updated']}")
+    print(f"   • Doublons inchangés : {totals['skipped']}")
+    print(f"   • Erreurs : {totals['errors']}")
     print(f"\n   • Total AFG en base : {total_afg}")
     print("=" * 60)
 
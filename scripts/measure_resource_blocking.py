@@ -0,0 +1,83 @@
+"""
+Mesure du gain du filtrage des ressources navigateur (octets et temps par page).
+Charge quelques articles de chaque source sans puis avec filtrage et compare.
+Lance depuis la racine : python scripts/measure_resource_blocking.py
+Nombre d'articles par source : python scripts/measure_resource_blocking.py --n 5
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import SOURCES_CONFIG
+from src.common.driver_setup import get_driver
+from src.common.readiness import wait_for_page
+from src.common.resource_filter import apply_source_rules, collect_page_metrics
+from src.scrapers.pipeline import get_results_path
+
+
+def load_sample_urls(source_code, n):
+    """Premières URLs du dernier results.json de la source."""
+    path = get_results_path(source_code)
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [article['url'] for article in json.load(f)[:n]]
+
+
+def measure(driver, url, source_code):
+    """Charge une page et retourne ses métriques (octets, temps, requêtes bloquées)."""
+    if driver.resource_filtering:
+        apply_source_rules(driver, source_code)
+    driver.get(url)
+    wait_for_page(driver, source_code, "content")
+    return collect_page_metrics(driver)
+
+
+def main():
+    """Point d'entrée principal."""
+    n = 3
+    if "--n" in sys.argv:
+        idx = sys.argv.index("--n")
+        if idx + 1 < len(sys.argv):
+            n = int(sys.argv[idx + 1])
+
+    print("\n" + "=" * 60)
+    print("📏 GAIN DU FILTRAGE DES RESSOURCES")
+    print("=" * 60)
+
+    full_driver = get_driver(block_resources=False)
+    light_driver = get_driver(block_resources=True)
+
+    try:
+        for source_code, config in SOURCES_CONFIG.items():
+            if not config["enabled"]:
+                continue
+
+            urls = load_sample_urls(source_code, n)
+            if not urls:
+                print(f"\n⚠️  {config['name']} : aucun results.json, source ignorée")
+                continue
+
+            print(f"\n📂 {config['name']}")
+            for url in urls:
+                full = measure(full_driver, url, source_code)
+                light = measure(light_driver, url, source_code)
+                saved_kb = (full.get("transferred_bytes", 0) - light.get("transferred_bytes", 0)) / 1024
+                saved_ms = full.get("load_ms", 0) - light.get("load_ms", 0)
+                print(
+                    f"   • {saved_kb:>7.0f} Ko et {saved_ms:>5} ms économisés "
+                    f"({light.get('blocked_requests', 0)} requêtes bloquées) {url[-60:]}"
+                )
+    finally:
+        full_driver.quit()
+        light_driver.quit()
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
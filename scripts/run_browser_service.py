@@ -0,0 +1,41 @@
+"""
+Service navigateur local : garde un pool de sessions Chrome au chaud
+pour que les runs de scraping n'aient plus à lancer Chrome.
+Lance depuis la racine : python scripts/run_browser_service.py
+Taille du pool : python scripts/run_browser_service.py --size 6
+"""
+import sys
+from pathlib import Path
+
+# Ajouter le dossier racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.browser_service.server import BrowserService
+
+
+def main():
+    """Point d'entrée principal."""
+    print("\n" + "=" * 60)
+    print("🧭 SERVICE NAVIGATEUR")
+    print("=" * 60)
+
+    config = {}
+    if "--size" in sys.argv:
+        idx = sys.argv.index("--size")
+        if idx + 1 < len(sys.argv):
+            config["pool_size"] = int(sys.argv[idx + 1])
+
+    service = BrowserService(config)
+    service.start()
+
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Arrêt du service...")
+    finally:
+        service.shutdown()
+        print("🏁 Sessions fermées")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 """
 Script d'ingestion des fichiers JSON vers MySQL
+Lit le plus récent du flux scrapers/<source>/results.jsonl et de results.json,
+article par article dans les deux cas (mémoire constante), et écrit par lots (INGESTION_CONFIG["batch_size"]) :
+les articles déjà en base sont mis à jour s'ils ont changé.
 Lance depuis la racine : python scripts/run_ingestion.py
 """
 import sys
-import json
 import os
 from pathlib import Path
 
@@ -12,53 +14,49 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import SOURCES_CONFIG
 from config.database import test_connection
-from src.database.manager import insert_article, get_articles_count, get_articles_by_source
-
-
-def load_json_file(filepath):
-    """Charge un fichier JSON."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return []
-    except json.JSONDecodeError as e:
-        print(f"   ❌ Erreur JSON : {e}")
-        return []
-
-
-def ingest_source(source_code, language):
-    """Ingère tous les articles d'une source."""
+from src.database.manager import bulk_upsert_articles, get_articles_count, get_articles_by_source, print_batch
+from src.storage.results_stream import UnreadableArticles, find_stream_path, iter_articles_file, iter_results
+
+
+def iter_source_articles(source_code, on_error=None):
+    """
+    Articles d'une source, lus au fil de l'eau : le plus récent du flux JSONL (y compris
+    un run interrompu) et de results.json (tableau JSON lu élément par élément), pour ne
+    jamais ingérer un fichier laissé en arrière par une réécriture de l'autre.
+    on_error(chemin, position, erreur) : appelé pour chaque article illisible.
+    Retourne (chemin, itérable) ou (None, []) si aucun fichier.
+    """
+    stream_path = find_stream_path(source_code)
     json_path = f"scrapers/{source_code}/results.json"
-
     if not os.path.exists(json_path):
-        print(f"   ⚠️  Fichier non trouvé : {json_path}")
-        return 0, 0
+        json_path = None
 
-    articles = load_json_file(json_path)
+    if stream_path and (json_path is None or os.path.getmtime(stream_path) > os.path.getmtime(json_path)):
+        return stream_path, iter_results(stream_path, on_error=on_error)
+    if json_path:
+        return json_path, iter_articles_file(json_path, on_error=on_error)
+    return None, []
 
-    if not articles:
-        print(f"   ⚠️  Aucun article dans {json_path}")
-        return 0, 0
 
-    inserted = 0
-    skipped = 0
+def ingest_source(source_code, language):
+    """
+    Ingère tous les articles d'une source. Retourne les totaux {inserted, updated, skipped, errors}
+    (les articles illisibles du fichier comptent parmi les erreurs).
+    """
+    unreadable = UnreadableArticles()
+    path, articles = iter_source_articles(source_code, on_error=unreadable)
 
-    for i, article in enumerate(articles, 1):
-        title_preview = (article.get('title', 'Sans titre')[:40] + '..') \
-            if len(article.get('title', '')) > 40 \
-            else article.get('title', 'Sans titre')
+    if path is None:
+        print(f"   ⚠️  Fichier non trouvé : scrapers/{source_code}/results.json(l)")
+        return {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
 
-        if insert_article(article, source_code, language):
-            inserted += 1
-            status = "✅"
-        else:
-            skipped += 1
-            status = "⏭️ "
+    totals = bulk_upsert_articles(articles, source_code, language, on_batch=print_batch)
+    totals["errors"] += unreadable.count
 
-        print(f"      [{i}/{len(articles)}] {status} {title_preview}")
+    if not any(totals.values()):
+        print(f"   ⚠️  Aucun article dans {path}")
 
-    return inserted, skipped
+    return totals
 
 
 def main():
@@ -75,26 +73,31 @@ def main():
     print(f"📊 Articles actuellement en base : {get_articles_count()}")
     print("\n" + "-" * 60)
 
-    total_inserted = 0
-    total_skipped = 0
+    grand_totals = {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
 
     for source_code, config in SOURCES_CONFIG.items():
         if not config["enabled"]:
             continue
 
         print(f"\n📂 Source : {config['name']} (langue: {config['language']})")
-        inserted, skipped = ingest_source(source_code, config["language"])
+        totals = ingest_source(source_code, config["language"])
 
-        total_inserted += inserted
-        total_skipped += skipped
+        for key, value in totals.items():
+            grand_totals[key] += value
 
-        print(f"   ✅ Insérés : {inserted}")
-        print(f"   ⏭️  Ignorés : {skipped}")
+        print(f"   ✅ Insérés : {totals['inserted']}")
+        print(f"   🔁 Mis à jour : {totals['updated']}")
+        print(f"   ⏭️  Ignorés : {totals['skipped']}")
+        if totals["errors"]:
+            print(f"   ❌ En erreur : {totals['errors']}")
 
     print("\n" + "=" * 60)
     print(f"🏁 INGESTION TERMINÉE")
-    print(f"   📥 Total insérés : {total_inserted}")
-    print(f"   ⏭️  Total ignorés : {total_skipped}")
+    print(f"   📥 Total insérés : {grand_totals['inserted']}")
+    print(f"   🔁 Total mis à jour : {grand_totals['updated']}")
+    print(f"   ⏭️  Total ignorés : {grand_totals['skipped']}")
+    if grand_totals["errors"]:
+        print(f"   ❌ Total en erreur : {grand_totals['errors']}")
 
     print(f"\n📊 Répartition par source :")
     for row in get_articles_by_source():
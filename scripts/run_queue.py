@@ -0,0 +1,146 @@
+"""
+Scraping distribué via la file de tâches partagée (MySQL ou SQLite).
+Mettre en file les listes des sources : python scripts/run_queue.py --enqueue
+   (backfill : python scripts/run_queue.py --enqueue --backfill --max-pages 100 --since 2020-01-01)
+Lancer des workers (sur une ou plusieurs machines) : python scripts/run_queue.py --work --workers 2
+État de la file : python scripts/run_queue.py --status
+Exporter les articles terminés vers scrapers/<source>/results.json(l) : python scripts/run_queue.py --export
+Options communes : --mysql (file dans la base MySQL), --batch NOM (lot, défaut : date du jour),
+--include-known (ne pas ignorer les articles déjà en base)
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Ajouter le dossier racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import SOURCES_CONFIG
+from src.common import run_stats, timings
+from src.database.known_urls import KnownUrlIndex
+from src.jobs import QueueWorker, TaskQueue, default_batch, make_worker_id
+from src.scrapers.attachments import shutdown_attachment_pool
+from src.scrapers.backfill import list_page_url
+from src.scrapers.pipeline import get_results_path, print_run_summary, save_results, save_run_report
+from src.storage.results_stream import ResultsStreamWriter, get_stream_path
+from scripts.run_scraping import parse_backfill, parse_workers
+
+
+def parse_option(argv, name):
+    """Valeur d'une option --name VALEUR, ou None."""
+    if name in argv:
+        idx = argv.index(name)
+        if idx + 1 < len(argv):
+            return argv[idx + 1]
+    return None
+
+
+def enqueue_sources(task_queue, sources, batch, backfill=None):
+    """Met en file une tâche de liste par source."""
+    payload = {}
+    if backfill is not None:
+        payload["backfill"] = {
+            "max_pages": backfill["max_pages"],
+            "since": backfill["since"].isoformat() if backfill["since"] else None
+        }
+
+    for source_code in sources:
+        pagination = SOURCES_CONFIG[source_code]["pagination"]
+        url = list_page_url(source_code, pagination["first_page"])
+        added = task_queue.enqueue("list", source_code, url, payload, batch)
+        status = "mise en file" if added else "déjà dans le lot"
+        print(f"   📥 {source_code.upper():<6} liste {status} ({batch})")
+
+
+def run_workers(task_queue, nb_workers, known_urls):
+    """Vide la file avec N workers (un driver chacun) dans ce processus."""
+    workers = [QueueWorker(task_queue, make_worker_id(i), known_urls=known_urls) for i in range(1, nb_workers + 1)]
+    threads = [threading.Thread(target=worker.run, name=worker.worker_id, daemon=True) for worker in workers]
+
+    print(f"👷 {nb_workers} workers : {', '.join(worker.worker_id for worker in workers)}")
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"   ✅ {sum(worker.processed for worker in workers)} tâches traitées")
+
+
+def print_status(task_queue, batch=None):
+    """Affiche le nombre de tâches par source, type et statut."""
+    counts = task_queue.status_counts(batch)
+    if not counts:
+        print("   File vide")
+        return
+
+    statuses = ("pending", "leased", "done", "failed")
+    print(f"   {'Source':<8} {'Type':<8} " + " ".join(f"{s:>8}" for s in statuses))
+    for source_code, kind in sorted({(source, kind) for source, kind, _ in counts}):
+        print(
+            f"   {source_code.upper():<8} {kind:<8} "
+            + " ".join(f"{counts.get((source_code, kind, s), 0):>8}" for s in statuses)
+        )
+
+
+def export_results(task_queue, sources, batch=None):
+    """Écrit les articles terminés de chaque source (flux JSONL + results.json) pour l'ingestion."""
+    for source_code in sources:
+        source_batch = batch or task_queue.latest_batch(source_code)
+        if source_batch is None:
+            continue
+
+        articles = list(task_queue.iter_articles(source_code, source_batch))
+        if not articles:
+            print(f"   ⚠️  {source_code.upper()} : aucun article terminé dans le lot {source_batch}")
+            continue
+
+        writer = ResultsStreamWriter(get_stream_path(source_code), append=False)
+        try:
+            for article in articles:
+                writer.write(article)
+        finally:
+            writer.close()
+        save_results(articles, get_results_path(source_code))
+        print(f"   📤 {source_code.upper()} : {len(articles)} articles exportés (lot {source_batch})")
+
+
+def main():
+    """Point d'entrée principal."""
+    print("\n" + "#" * 60)
+    print("🗂️  FILE DE TÂCHES DE SCRAPING")
+    print("#" * 60)
+
+    batch = parse_option(sys.argv, "--batch")
+    task_queue = TaskQueue(backend="mysql" if "--mysql" in sys.argv else None)
+    sources = {code: config for code, config in SOURCES_CONFIG.items() if config["enabled"]}
+    start_time = time.time()
+
+    if "--enqueue" in sys.argv:
+        enqueue_sources(task_queue, sources, batch or default_batch(), parse_backfill(sys.argv))
+
+    if "--work" in sys.argv:
+        run_stats.reset()
+        timings.reset()
+        known_urls = None if "--include-known" in sys.argv else KnownUrlIndex.load()
+        try:
+            run_workers(task_queue, parse_workers(sys.argv), known_urls)
+        except KeyboardInterrupt:
+            print("\n🛑 Arrêt manuel détecté ! (les tâches en cours seront reprises à l'expiration de leur bail)")
+        finally:
+            shutdown_attachment_pool()
+            print_run_summary(sources)
+            save_run_report(start_time)
+
+    if "--export" in sys.argv:
+        export_results(task_queue, sources, batch)
+
+    print("\n📊 État de la file :")
+    print_status(task_queue, batch)
+
+    print("\n" + "-" * 30)
+    print(f"🏁 Terminé en {time.time() - start_time:.2f}s")
+    print("-" * 30)
+
+
+if __name__ == "__main__":
+    main()
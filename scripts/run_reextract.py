@@ -0,0 +1,127 @@
+"""
+Ré-extraction hors ligne du contenu des articles depuis l'archive HTML
+(après correction d'un extracteur, sans re-scraper les sites).
+Lance depuis la racine : python scripts/run_reextract.py
+Une seule source : python scripts/run_reextract.py --source esma
+Nombre de processus : python scripts/run_reextract.py --workers 8
+"""
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Ajouter le dossier racine au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import SOURCES_CONFIG
+from src.archive.html_archive import HtmlArchive
+from src.scrapers.attachments import (
+    attachments_metadata, collect_attachments, is_enabled as attachments_enabled, with_attachments
+)
+from src.scrapers.pipeline import get_results_path, save_results
+from src.scrapers.registry import SCRAPER_FUNCTIONS
+from src.storage.results_stream import ResultsStreamWriter, find_stream_path, get_stream_path
+
+# Archive ouverte une fois par processus worker
+_worker_archive = None
+
+
+def _reextract_one(task):
+    """Ré-extrait un article archivé (exécuté dans un processus du pool)."""
+    global _worker_archive
+    source_code, entry = task
+
+    if _worker_archive is None:
+        _worker_archive = HtmlArchive()
+
+    item = {"title": entry["title"], "url": entry["url"], "date": entry["date"]}
+    try:
+        html = _worker_archive.read(entry["sha256"])
+        content = SCRAPER_FUNCTIONS[source_code]["extract"](html, entry["url"])
+        if not attachments_enabled(source_code):
+            return {**item, "content": content}
+
+        # PDF liés : déjà téléchargés et extraits sous data/attachments, relus sans réseau
+        attachments = collect_attachments(source_code, entry["url"], html, offline=True)
+        if not attachments:
+            return {**item, "content": content}
+        return {**item, "content": with_attachments(content, attachments),
+                "attachments": attachments_metadata(attachments)}
+    except Exception as e:
+        return {**item, "content": "", "error": str(e)}
+
+
+def rewrite_stream(source_code, data):
+    """
+    Réécrit le flux JSONL de la source avec les articles ré-extraits, pour qu'il ne garde
+    pas l'ancien contenu (l'ingestion peut lire l'un ou l'autre fichier). Le flux est écrit
+    à côté puis remplace l'ancien d'un coup (format existant, compressé ou non).
+    """
+    path = find_stream_path(source_code) or get_stream_path(source_code)
+    tmp_path = os.path.join(os.path.dirname(path), f"reextract.{os.path.basename(path)}")
+    writer = ResultsStreamWriter(tmp_path, append=False)
+    try:
+        for article in data:
+            writer.write(article)
+    finally:
+        writer.close()
+    os.replace(tmp_path, path)
+    print(f"   💾 Flux réécrit : {path}")
+
+
+def reextract_source(source_code, config, archive, executor):
+    """Ré-extrait tous les articles archivés d'une source et réécrit son results.json et son flux JSONL."""
+    entries = archive.latest_articles(source_code)
+
+    if not entries:
+        print(f"   ⚠️  {config['name']} : aucun article archivé")
+        return 0
+
+    data = list(executor.map(_reextract_one, [(source_code, entry) for entry in entries], chunksize=16))
+    errors = sum(1 for article in data if article.get("error"))
+
+    print(f"   ✅ {config['name']} : {len(data)} articles ré-extraits ({errors} erreurs)")
+    save_results(data, get_results_path(source_code))
+    rewrite_stream(source_code, data)
+    return len(data)
+
+
+def main():
+    """Point d'entrée principal."""
+    print("\n" + "=" * 60)
+    print("♻️  RÉ-EXTRACTION DEPUIS L'ARCHIVE HTML")
+    print("=" * 60)
+
+    source_filter = None
+    nb_workers = os.cpu_count() or 1
+
+    if "--source" in sys.argv:
+        idx = sys.argv.index("--source")
+        if idx + 1 < len(sys.argv):
+            source_filter = sys.argv[idx + 1].lower()
+
+    if "--workers" in sys.argv:
+        idx = sys.argv.index("--workers")
+        if idx + 1 < len(sys.argv):
+            nb_workers = max(1, int(sys.argv[idx + 1]))
+
+    archive = HtmlArchive()
+    start_time = time.time()
+    total = 0
+
+    with ProcessPoolExecutor(max_workers=nb_workers) as executor:
+        for source_code, config in SOURCES_CONFIG.items():
+            if source_filter and source_code != source_filter:
+                continue
+            total += reextract_source(source_code, config, archive, executor)
+
+    archive.close()
+    duration = time.time() - start_time
+    print("\n" + "-" * 30)
+    print(f"🏁 {total} articles ré-extraits en {duration:.2f}s ({nb_workers} processus)")
+    print("-" * 30)
+
+
+if __name__ == "__main__":
+    main()
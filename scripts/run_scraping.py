@@ -1,126 +1,193 @@
 """
 Script de scraping des sources configurées
 Lance depuis la racine : python scripts/run_scraping.py
+Mode parallèle : python scripts/run_scraping.py --workers 4
+Contenu en asynchrone (HTTP) : python scripts/run_scraping.py --async
+Articles chargés dans 4 onglets du même Chrome (sources en stratégie browser) : python scripts/run_scraping.py --tabs 4
+Extraction dans le thread du driver (sans pool de processus) : python scripts/run_scraping.py --no-parse-pool
+Sans cache HTTP (tout re-télécharger) : python scripts/run_scraping.py --no-cache
+Re-scraper aussi les articles déjà en base : python scripts/run_scraping.py --include-known
+Ignorer un run interrompu et repartir de zéro : python scripts/run_scraping.py --no-resume
+Récupérer le contenu même si la liste d'une source n'a pas changé : python scripts/run_scraping.py --force
+Backfill de l'historique : python scripts/run_scraping.py --backfill --max-pages 100 --since 2020-01-01
 """
 import sys
-import json
-import os
 import time
+from datetime import date
 from pathlib import Path
 
 # Ajouter le dossier racine au path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.settings import SOURCES_CONFIG
-from src.common.driver_setup import get_driver
-
-# Imports dynamiques des scrapers
-from scrapers.afg.get_list import get_afg_articles_list
-from scrapers.afg.get_content import get_afg_article_content
-from scrapers.afm.get_list import get_afm_articles_list
-from scrapers.afm.get_content import get_afm_article_content
-from scrapers.alfi.get_list import get_alfi_articles_list
-from scrapers.alfi.get_content import get_alfi_article_content
-from scrapers.amf.get_list import get_amf_articles_list
-from scrapers.amf.get_content import get_amf_article_content
-from scrapers.cbi.get_list import get_cbi_articles_list
-from scrapers.cbi.get_content import get_cbi_article_content
-from scrapers.cssf.get_list import get_cssf_articles_list
-from scrapers.cssf.get_content import get_cssf_article_content
-from scrapers.esma.get_list import get_esma_articles_list
-from scrapers.esma.get_content import get_esma_article_content
-from scrapers.finma.get_list import get_finma_articles_list
-from scrapers.finma.get_content import get_finma_article_content
-
-SCRAPER_FUNCTIONS = {
-    "afg": {"list": get_afg_articles_list, "content": get_afg_article_content},
-    "afm": {"list": get_afm_articles_list, "content": get_afm_article_content},
-    "alfi": {"list": get_alfi_articles_list, "content": get_alfi_article_content},
-    "amf": {"list": get_amf_articles_list, "content": get_amf_article_content},
-    "cbi": {"list": get_cbi_articles_list, "content": get_cbi_article_content},
-    "cssf": {"list": get_cssf_articles_list, "content": get_cssf_article_content},
-    "esma": {"list": get_esma_articles_list, "content": get_esma_article_content},
-    "finma": {"list": get_finma_articles_list, "content": get_finma_article_content},
-}
-
-
-def save_results(data, filepath):
-    """Sauvegarde les données en JSON."""
-    if data:
-        try:
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-            print(f"   💾 Sauvegardé : {filepath}")
-        except Exception as e:
-            print(f"   ❌ Erreur sauvegarde : {e}")
-
-
-def scrape_source(source_code, config, driver):
-    """Scrape une source donnée."""
+from config.settings import PARSE_POOL_CONFIG, SELENIUM_CONFIG, SOURCES_CONFIG
+from src.common import run_stats, timings
+from src.browser_service.client import connect_driver
+from src.common.driver_setup import SupervisedDriver
+from src.common.fetch import get_fetch_strategy
+from src.common.http_cache import set_cache_enabled
+from src.database.known_urls import KnownUrlIndex
+
+from src.scrapers.pipeline import (
+    open_source_run, finish_source_run, scrape_article, scrape_articles_async, scrape_articles_tabs,
+    print_run_summary, save_run_report
+)
+from src.scrapers.attachments import shutdown_attachment_pool
+from src.scrapers.parse_pool import scrape_articles_staged, shutdown_parse_pool
+from src.scrapers.worker_pool import ScrapeWorkerPool
+
+
+def scrape_source(source_code, config, driver, use_async=False, known_urls=None, resume=True, backfill=None,
+                  force=False):
+    """
+    Scrape une source donnée (contenu en passe asynchrone HTTP si use_async, sinon
+    chargement par le driver et extraction en parallèle dans le pool de processus ;
+    articles des sources en stratégie "browser" chargés dans plusieurs onglets si --tabs N).
+    Les articles déjà en base (known_urls) sont ignorés avant tout chargement, et toute
+    la source si sa liste n'a pas changé depuis le dernier run (sauf force).
+    Chaque article est écrit dans le flux JSONL de la source dès qu'il est extrait.
+    """
     print(f"\n{'=' * 60}")
     print(f"🚀 LANCEMENT : {config['name']}")
     print("=" * 60)
 
-    functions = SCRAPER_FUNCTIONS[source_code]
-    result_path = f"scrapers/{source_code}/results.json"
-
     try:
-        # Récupération de la liste
+        # Récupération de la liste (ou reprise du run interrompu)
         print(f"   ... Récupération de la liste des articles")
-        items = functions["list"](driver)
+        checkpoint, items = open_source_run(source_code, driver, known_urls, resume, backfill, force)
 
-        if not items:
-            print(f"   ⚠️  Aucun article trouvé")
+        if checkpoint is None:
+            print(f"   ⚠️  Aucun nouvel article")
             return
 
-        data = []
         print(f"   ... Extraction du contenu pour {len(items)} articles")
 
         # Récupération du contenu
-        for i, item in enumerate(items, 1):
-            title_preview = (item['title'][:50] + '..') if len(item['title']) > 50 else item['title']
-            print(f"      [{i}/{len(items)}] {title_preview}")
-
-            try:
-                content = functions["content"](driver, item['url'])
-                status = "✅" if content and len(content) > 50 else "⚠️"
-                print(f"          {status} Contenu récupéré ({len(content)} cars)")
-                data.append({**item, "content": content})
-            except Exception as e:
-                print(f"          ❌ Erreur : {e}")
-                data.append({**item, "content": "", "error": str(e)})
+        if use_async and items:
+            scrape_articles_async(source_code, items, driver, on_result=checkpoint.record)
+        elif SELENIUM_CONFIG["tabs"] > 1 and get_fetch_strategy(source_code, "content") == "browser" and items:
+            scrape_articles_tabs(source_code, items, driver, on_result=checkpoint.record)
+        elif PARSE_POOL_CONFIG["enabled"] and items:
+            scrape_articles_staged(source_code, items, driver, on_result=checkpoint.record)
+        else:
+            for i, item in enumerate(items, 1):
+                checkpoint.record(scrape_article(source_code, driver, item, i, len(items)))
 
         # Sauvegarde
-        save_results(data, result_path)
+        finish_source_run(checkpoint)
         print(f"✅ Module {config['name']} terminé")
 
     except Exception as e:
         print(f"❌ ERREUR : {e}")
 
 
+def parse_workers(argv):
+    """Lit l'option --workers N (1 par défaut = mode séquentiel)."""
+    if "--workers" in argv:
+        idx = argv.index("--workers")
+        if idx + 1 < len(argv):
+            return max(1, int(argv[idx + 1]))
+    return 1
+
+
+def parse_tabs(argv):
+    """Lit l'option --tabs N (onglets par navigateur, défaut : SELENIUM_CONFIG["tabs"])."""
+    if "--tabs" in argv:
+        idx = argv.index("--tabs")
+        if idx + 1 < len(argv):
+            return max(1, int(argv[idx + 1]))
+    return SELENIUM_CONFIG["tabs"]
+
+
+def parse_backfill(argv):
+    """
+    Lit les options de backfill (--backfill, --max-pages N, --since AAAA-MM-JJ).
+    Retourne None hors backfill.
+    """
+    if "--backfill" not in argv:
+        return None
+
+    backfill = {"max_pages": None, "since": None}
+    if "--max-pages" in argv:
+        idx = argv.index("--max-pages")
+        if idx + 1 < len(argv):
+            backfill["max_pages"] = max(1, int(argv[idx + 1]))
+    if "--since" in argv:
+        idx = argv.index("--since")
+        if idx + 1 < len(argv):
+            backfill["since"] = date.fromisoformat(argv[idx + 1])
+    return backfill
+
+
+def run_with_pool(sources, nb_workers, use_async=False, known_urls=None, resume=True, backfill=None, force=False):
+    """Scrape les sources avec un pool de N drivers."""
+    print(f"👷 Mode pool : {nb_workers} workers")
+    start_time = time.time()
+
+    try:
+        ScrapeWorkerPool(
+            nb_workers, use_async=use_async, known_urls=known_urls, resume=resume, backfill=backfill, force=force
+        ).run(sources)
+    except KeyboardInterrupt:
+        print("\n🛑 Arrêt manuel détecté !")
+    finally:
+        duration = time.time() - start_time
+        print_run_summary(sources)
+        save_run_report(start_time)
+        print("\n" + "-" * 30)
+        print(f"🏁 Terminé en {duration:.2f}s")
+        print("-" * 30)
+
+
 def main():
     """Point d'entrée principal."""
     print("\n" + "#" * 60)
     print("🚀 PIPELINE DE SCRAPING AMUNDI")
     print("#" * 60)
 
-    driver = get_driver()
+    nb_workers = parse_workers(sys.argv)
+    use_async = "--async" in sys.argv
+    resume = "--no-resume" not in sys.argv
+    backfill = parse_backfill(sys.argv)
+    force = "--force" in sys.argv
+    if "--no-cache" in sys.argv:
+        set_cache_enabled(False)
+    SELENIUM_CONFIG["tabs"] = parse_tabs(sys.argv)
+    if "--no-parse-pool" in sys.argv:
+        PARSE_POOL_CONFIG["enabled"] = False
+    sources = {code: config for code, config in SOURCES_CONFIG.items() if config["enabled"]}
+
+    run_stats.reset()
+    timings.reset()
+
+    # Index des URLs déjà en base, chargé une seule fois pour tout le run
+    known_urls = None if "--include-known" in sys.argv else KnownUrlIndex.load()
+
+    if nb_workers > 1:
+        run_with_pool(sources, nb_workers, use_async, known_urls, resume, backfill, force)
+        return
+
+    # Chrome n'est sollicité que si une page l'exige (stratégie "browser" ou secours),
+    # via le service navigateur s'il tourne (scripts/run_browser_service.py) ; recyclé après
+    # DRIVER_SUPERVISION_CONFIG pages / Mo de RSS et relancé si Chrome meurt
+    driver = SupervisedDriver(connect_driver)
     start_time = time.time()
 
     try:
-        for source_code, config in SOURCES_CONFIG.items():
-            if config["enabled"]:
-                scrape_source(source_code, config, driver)
+        for source_code, config in sources.items():
+            scrape_source(source_code, config, driver, use_async, known_urls, resume, backfill, force)
 
     except KeyboardInterrupt:
         print("\n🛑 Arrêt manuel détecté !")
     except Exception as e:
         print(f"\n❌ Erreur globale : {e}")
     finally:
+        print_run_summary(sources)
+        save_run_report(start_time)
         print("\n" + "-" * 30)
         print("🧹 Fermeture du driver...")
         driver.quit()
+        shutdown_parse_pool()
+        shutdown_attachment_pool()
         duration = time.time() - start_time
         print(f"🏁 Terminé en {duration:.2f}s")
         print("-" * 30)
@@ -0,0 +1,4 @@
+"""Archive package"""
+from .html_archive import HtmlArchive, get_html_archive
+
+__all__ = ['HtmlArchive', 'get_html_archive']
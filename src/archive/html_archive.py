@@ -0,0 +1,136 @@
+"""
+Archive du HTML brut des pages scrapées, pour ré-extraire sans re-scraper.
+
+- chaque page est compressée en zstd et stockée sous son hash SHA-256
+  (data/html_archive/objects/ab/<sha256>.html.zst) : une page identique
+  n'est stockée qu'une fois
+- un index SQLite garde, pour chaque récupération, l'URL, la source, le
+  type de page, le hash et la date, ainsi que le titre / la date des articles
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import zstandard
+from config.settings import ARCHIVE_CONFIG
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    page_type TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_url ON pages (url, fetched_at);
+CREATE INDEX IF NOT EXISTS idx_pages_source ON pages (source, page_type);
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    title TEXT,
+    date TEXT
+);
+"""
+
+
+class HtmlArchive:
+    """Stockage des pages HTML adressé par contenu (zstd + index SQLite)."""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory or ARCHIVE_CONFIG["directory"])
+        self.objects_dir = self.directory / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.directory / "index.sqlite", check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def _object_path(self, sha256):
+        return self.objects_dir / sha256[:2] / f"{sha256}.html.zst"
+
+    def store(self, url, source_code, page_type, html):
+        """Archive une page et retourne son hash (l'objet n'est écrit que s'il est nouveau)."""
+        data = html.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self._object_path(sha256)
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            compressed = zstandard.ZstdCompressor(level=ARCHIVE_CONFIG["compression_level"]).compress(data)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO pages (url, source, page_type, sha256, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (url, source_code, page_type, sha256, time.time())
+            )
+            self._conn.commit()
+        return sha256
+
+    def remember_article(self, source_code, item):
+        """Garde le titre et la date d'un article (nécessaires pour la ré-extraction)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles (url, source, title, date) VALUES (?, ?, ?, ?)",
+                (item['url'], source_code, item.get('title'), item.get('date'))
+            )
+            self._conn.commit()
+
+    def read(self, sha256):
+        """Retourne le HTML d'un objet archivé."""
+        with open(self._object_path(sha256), 'rb') as f:
+            return zstandard.ZstdDecompressor().decompress(f.read()).decode("utf-8")
+
+    def latest_articles(self, source_code):
+        """
+        Dernière version archivée de chaque article d'une source.
+        Retourne une liste de dicts {url, title, date, sha256}, du plus récent au plus ancien.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT p.url, a.title, a.date, p.sha256
+                FROM pages p
+                JOIN articles a ON a.url = p.url
+                WHERE p.source = ? AND p.page_type = 'content'
+                  AND p.fetched_at = (SELECT MAX(fetched_at) FROM pages WHERE url = p.url AND page_type = 'content')
+                ORDER BY p.fetched_at DESC
+                """,
+                (source_code,)
+            ).fetchall()
+        return [{"url": url, "title": title, "date": date, "sha256": sha256} for url, title, date, sha256 in rows]
+
+    def latest_list_page(self, source_code):
+        """Dernière page de liste archivée d'une source : {url, sha256}, ou None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, sha256 FROM pages WHERE source = ? AND page_type = 'list' "
+                "ORDER BY fetched_at DESC LIMIT 1",
+                (source_code,)
+            ).fetchone()
+        return {"url": row[0], "sha256": row[1]} if row else None
+
+    def close(self):
+        self._conn.close()
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_html_archive():
+    """Retourne l'archive partagée, ou None si l'archivage est désactivé."""
+    global _archive
+    if not ARCHIVE_CONFIG["enabled"]:
+        return None
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                _archive = HtmlArchive()
+    return _archive
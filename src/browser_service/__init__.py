@@ -0,0 +1,5 @@
+"""Browser service package"""
+from .client import BrowserServiceClient, AttachedDriver, connect_driver
+from .server import BrowserService
+
+__all__ = ['BrowserServiceClient', 'AttachedDriver', 'connect_driver', 'BrowserService']
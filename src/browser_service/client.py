@@ -0,0 +1,124 @@
+"""
+Client du service navigateur : se rattache à une session Chrome déjà chaude
+au lieu de lancer un nouveau navigateur.
+"""
+import threading
+
+import requests
+from config.settings import BROWSER_SERVICE_CONFIG
+from src.browser_service.session import ChromeSession
+from src.common.driver_setup import build_chrome_options, get_driver
+
+
+class _LeaseHeartbeat:
+    """Prolonge le bail d'une session empruntée tant que le client la garde (thread)."""
+
+    def __init__(self, client, session_id):
+        self.client = client
+        self.session_id = session_id
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"lease-{session_id[:8]}", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(BROWSER_SERVICE_CONFIG["heartbeat_interval"]):
+            try:
+                if not self.client.renew(self.session_id):
+                    print(f"   ⚠️ Bail de la session {self.session_id[:8]} perdu")
+                    return
+            except requests.RequestException as e:
+                print(f"   ⚠️ Heartbeat de la session {self.session_id[:8]} en échec ({e})")
+
+    def stop(self):
+        self._stop.set()
+
+
+class AttachedDriver(ChromeSession):
+    """Session empruntée au service ; quit() la rend au pool au lieu de fermer Chrome.
+    Un heartbeat prolonge le bail tant que la session n'est pas rendue."""
+
+    def __init__(self, client, lease):
+        self._client = client
+        self.pages_served = 0
+        self.resource_filtering = lease["resource_filtering"]
+        super().__init__(
+            lease["executor_url"],
+            build_chrome_options(lease["resource_filtering"]),
+            session_id=lease["session_id"]
+        )
+        self._heartbeat = _LeaseHeartbeat(client, lease["session_id"])
+
+    def get(self, url):
+        self.pages_served += 1
+        super().get(url)
+
+    def quit(self):
+        self._heartbeat.stop()
+        try:
+            self._client.release(self.session_id, self.pages_served)
+        finally:
+            self.detach()
+
+    def discard(self):
+        """Rend une session dont le Chrome ne répond plus : le service la remplace."""
+        self._heartbeat.stop()
+        try:
+            self._client.release(self.session_id, self.pages_served, dead=True)
+        finally:
+            self.detach()
+
+
+class BrowserServiceClient:
+    """Accès à l'API HTTP du service navigateur."""
+
+    def __init__(self, base_url=None):
+        self.base_url = base_url or f"http://{BROWSER_SERVICE_CONFIG['host']}:{BROWSER_SERVICE_CONFIG['port']}"
+
+    def health(self, timeout=2):
+        response = requests.get(f"{self.base_url}/health", timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def is_available(self):
+        """True si le service répond."""
+        try:
+            return self.health(timeout=1)["status"] == "ok"
+        except requests.RequestException:
+            return False
+
+    def acquire(self):
+        response = requests.post(f"{self.base_url}/acquire", timeout=BROWSER_SERVICE_CONFIG["acquire_timeout"] + 5)
+        response.raise_for_status()
+        return response.json()
+
+    def renew(self, session_id):
+        """Prolonge le bail d'une session. Retourne False si le service ne la prête plus à ce client."""
+        response = requests.post(f"{self.base_url}/renew", json={"session_id": session_id}, timeout=10)
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return True
+
+    def release(self, session_id, pages=0, dead=False):
+        requests.post(
+            f"{self.base_url}/release", json={"session_id": session_id, "pages": pages, "dead": dead}, timeout=10
+        )
+
+    def attach(self):
+        """Emprunte une session au pool et retourne un driver Selenium prêt à l'emploi."""
+        return AttachedDriver(self, self.acquire())
+
+
+def connect_driver():
+    """
+    Driver pour les scrapers : session du service navigateur s'il tourne,
+    sinon un Chrome local classique (get_driver). Si le service ne peut pas prêter
+    de session (toutes empruntées, plus de workers que pool_size), on repasse aussi en local.
+    """
+    client = BrowserServiceClient()
+    if client.is_available():
+        try:
+            return client.attach()
+        except requests.RequestException as e:
+            print(f"   ⚠️ Service navigateur sans session disponible ({e}), Chrome local")
+    return get_driver()
@@ -0,0 +1,259 @@
+"""
+Service navigateur local : un chromedriver et un pool de sessions Chrome
+gardées au chaud entre les runs.
+
+API HTTP (JSON) :
+- GET  /health  : état du pool
+- POST /acquire : réserve une session -> {session_id, executor_url, resource_filtering}
+- POST /renew   : prolonge le bail d'une session {session_id} (heartbeat du client)
+- POST /release : rend une session {session_id, pages, dead}
+
+Les sessions sont recyclées (Chrome relancé) après un nombre de pages ou une
+durée de vie maximale, si elles ne répondent plus aux vérifications de santé,
+ou si leur client n'a plus donné signe de vie (ni heartbeat ni retour) pendant
+lease_timeout secondes.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from config.settings import BROWSER_SERVICE_CONFIG, RESOURCE_BLOCKING_CONFIG
+from src.browser_service.session import ChromeSession
+from src.common.driver_setup import build_chrome_options
+from src.common.resource_filter import enable_resource_filtering
+
+
+class _PooledSession:
+    """Session Chrome du pool et son usage."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.time()
+        self.pages = 0
+        self.leased_at = None
+
+    @property
+    def busy(self):
+        return self.leased_at is not None
+
+
+class BrowserService:
+    """Pool de sessions Chrome partagées, exposé via une petite API HTTP locale."""
+
+    def __init__(self, config=None):
+        self.config = {**BROWSER_SERVICE_CONFIG, **(config or {})}
+        self.block_resources = RESOURCE_BLOCKING_CONFIG["enabled"]
+        self._sessions = {}
+        self._condition = threading.Condition()
+        self._stopping = threading.Event()
+        self._recycled = 0
+        self._chromedriver = None
+        self._http_server = None
+        self.executor_url = None
+
+    # --- Cycle de vie ---------------------------------------------------
+
+    def start(self):
+        """Démarre chromedriver (résolu une seule fois) et ouvre le pool de sessions."""
+        self._chromedriver = Service(ChromeDriverManager().install())
+        self._chromedriver.start()
+        self.executor_url = self._chromedriver.service_url
+
+        for _ in range(self.config["pool_size"]):
+            self._add_session()
+
+        threading.Thread(target=self._health_loop, name="browser-health", daemon=True).start()
+        print(f"   🟢 {len(self._sessions)} sessions Chrome prêtes ({self.executor_url})")
+
+    def serve_forever(self):
+        """Expose l'API HTTP jusqu'à l'arrêt du service."""
+        service = self
+
+        class Handler(_ApiHandler):
+            browser_service = service
+
+        self._http_server = ThreadingHTTPServer((self.config["host"], self.config["port"]), Handler)
+        print(f"   🌐 API : http://{self.config['host']}:{self.config['port']}")
+        self._http_server.serve_forever()
+
+    def shutdown(self):
+        """Ferme toutes les sessions et chromedriver."""
+        self._stopping.set()
+        if self._http_server:
+            self._http_server.shutdown()
+        with self._condition:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for pooled in sessions:
+            self._quit(pooled)
+        if self._chromedriver:
+            self._chromedriver.stop()
+
+    # --- Pool -------------------------------------------------------------
+
+    def _new_session(self):
+        driver = ChromeSession(self.executor_url, build_chrome_options(self.block_resources))
+        if self.block_resources:
+            enable_resource_filtering(driver)
+        return _PooledSession(driver)
+
+    def _add_session(self):
+        pooled = self._new_session()
+        with self._condition:
+            self._sessions[pooled.driver.session_id] = pooled
+            self._condition.notify()
+
+    def _quit(self, pooled):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            print(f"   ⚠️  Fermeture session {pooled.driver.session_id[:8]} : {e}")
+
+    def _recycle(self, pooled, reason):
+        """Remplace une session par une session neuve."""
+        with self._condition:
+            self._sessions.pop(pooled.driver.session_id, None)
+            self._recycled += 1
+        print(f"   ♻️  Session {pooled.driver.session_id[:8]} recyclée ({reason})")
+        self._quit(pooled)
+        if not self._stopping.is_set():
+            try:
+                self._add_session()
+            except Exception as e:
+                print(f"   ❌ Impossible de recréer une session : {e}")
+
+    def acquire(self):
+        """Réserve une session libre (attend jusqu'à acquire_timeout)."""
+        deadline = time.time() + self.config["acquire_timeout"]
+        with self._condition:
+            while True:
+                for session_id, pooled in self._sessions.items():
+                    if not pooled.busy:
+                        pooled.leased_at = time.time()
+                        return {
+                            "session_id": session_id,
+                            "executor_url": self.executor_url,
+                            "resource_filtering": self.block_resources,
+                        }
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise TimeoutError("Aucune session libre")
+                self._condition.wait(remaining)
+
+    def renew(self, session_id):
+        """Prolonge le bail d'une session empruntée. Retourne False si elle n'est plus au client."""
+        with self._condition:
+            pooled = self._sessions.get(session_id)
+            if pooled is None or not pooled.busy:
+                return False
+            pooled.leased_at = time.time()
+            return True
+
+    def release(self, session_id, pages=0, dead=False):
+        """
+        Rend une session au pool. Elle est recyclée si elle a atteint ses limites, si le
+        client la signale morte (dead) ou si elle ne répond plus au retour sur about:blank ;
+        elle reste réservée jusqu'à cette vérification pour n'être jamais prêtée morte.
+        """
+        with self._condition:
+            pooled = self._sessions.get(session_id)
+            if pooled is None:
+                return
+            pooled.pages += pages
+            worn_out = (
+                pooled.pages >= self.config["max_pages_per_session"]
+                or time.time() - pooled.created_at >= self.config["max_session_age"]
+            )
+
+        reason = "signalée morte par le client" if dead else (f"{pooled.pages} pages" if worn_out else None)
+        if reason is None:
+            try:
+                pooled.driver.get("about:blank")
+            except Exception:
+                reason = "ne répond plus"
+        if reason is not None:
+            threading.Thread(target=self._recycle, args=(pooled, reason), daemon=True).start()
+            return
+
+        with self._condition:
+            pooled.leased_at = None
+            self._condition.notify()
+
+    def health(self):
+        """État du pool."""
+        with self._condition:
+            busy = sum(1 for pooled in self._sessions.values() if pooled.busy)
+            return {
+                "status": "ok",
+                "sessions": len(self._sessions),
+                "busy": busy,
+                "free": len(self._sessions) - busy,
+                "recycled": self._recycled,
+                "pages_served": sum(pooled.pages for pooled in self._sessions.values()),
+            }
+
+    def _health_loop(self):
+        """Vérifie périodiquement les sessions libres et récupère les baux sans heartbeat."""
+        while not self._stopping.wait(self.config["health_interval"]):
+            with self._condition:
+                sessions = list(self._sessions.values())
+
+            for pooled in sessions:
+                if pooled.busy:
+                    if time.time() - pooled.leased_at > self.config["lease_timeout"]:
+                        self._recycle(pooled, "bail expiré, client silencieux")
+                    continue
+                try:
+                    pooled.driver.execute_script("return 1")
+                except Exception:
+                    self._recycle(pooled, "ne répond plus")
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    """Routes JSON de l'API du service."""
+
+    browser_service = None
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, self.browser_service.health())
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        try:
+            if self.path == "/acquire":
+                self._send(200, self.browser_service.acquire())
+            elif self.path == "/renew":
+                if self.browser_service.renew(self._read_json()["session_id"]):
+                    self._send(200, {"status": "ok"})
+                else:
+                    self._send(404, {"error": "session inconnue ou déjà rendue"})
+            elif self.path == "/release":
+                payload = self._read_json()
+                self.browser_service.release(
+                    payload["session_id"], payload.get("pages", 0), payload.get("dead", False)
+                )
+                self._send(200, {"status": "ok"})
+            else:
+                self._send(404, {"error": "not found"})
+        except TimeoutError as e:
+            self._send(503, {"error": str(e)})
+
+    def log_message(self, format, *args):
+        pass
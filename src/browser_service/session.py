@@ -0,0 +1,33 @@
+"""
+Session Chrome pilotée à travers un chromedriver partagé.
+Une même classe sert à créer une session (côté service) et à se rattacher
+à une session existante (côté scrapers), sans relancer Chrome.
+"""
+from selenium import webdriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+
+class ChromeSession(webdriver.Remote):
+    """webdriver.Remote + commandes Chrome (DevTools), avec rattachement optionnel."""
+
+    def __init__(self, executor_url, options, session_id=None):
+        self._attach_session_id = session_id
+        connection = ChromiumRemoteConnection(
+            remote_server_addr=executor_url,
+            vendor_prefix="goog",
+            browser_name="chrome"
+        )
+        super().__init__(command_executor=connection, options=options)
+
+    def start_session(self, capabilities):
+        """Crée une nouvelle session, ou reprend la session existante demandée."""
+        if self._attach_session_id is None:
+            super().start_session(capabilities)
+            return
+        self.session_id = self._attach_session_id
+        self.caps = dict(capabilities)
+
+    def detach(self):
+        """Ferme la connexion locale sans supprimer la session côté chromedriver."""
+        self.stop_client()
+        self.command_executor.close()
@@ -1,4 +1,6 @@
 """Common utilities"""
-from .driver_setup import get_driver
+from .driver_setup import get_driver, LazyDriver
+from .readiness import wait_for_page, load_page
+from .fetch import fetch_page
 
-__all__ = ['get_driver']
+__all__ = ['get_driver', 'LazyDriver', 'wait_for_page', 'load_page', 'fetch_page']
@@ -0,0 +1,99 @@
+"""
+Récupération asynchrone de nombreuses pages (asyncio + httpx).
+
+- un sémaphore par hôte limite le nombre de requêtes simultanées sur un même site
+- l'ordonnanceur de politesse cadence les requêtes de chaque hôte (429 / 5xx : pause puis nouvel essai)
+- chaque requête a son propre délai maximal
+- les résultats sont renvoyés dans l'ordre des URLs demandées
+- les pages déjà en cache sont revalidées (requêtes conditionnelles)
+"""
+import asyncio
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import httpx
+from config.settings import HTTP_CONFIG, SELENIUM_CONFIG
+from src.common.http_cache import get_http_cache
+from src.common.http_client import FetchResult, not_modified_result
+from src.common.politeness import get_scheduler, is_retryable, max_retries, parse_retry_after
+
+
+async def _fetch_one(client, semaphores, url):
+    """Télécharge une URL en respectant la limite et le débit de son hôte (revalidation si en cache)."""
+    host = urlsplit(url).netloc
+    cache = get_http_cache()
+    entry = cache.get(url) if cache else None
+    headers = cache.conditional_headers(entry) if entry else {}
+
+    scheduler = get_scheduler()
+    retries = max_retries()
+    elapsed = 0.0
+
+    for attempt in range(retries + 1):
+        await scheduler.acquire_async(url)
+        async with semaphores[host]:
+            start = time.monotonic()
+            try:
+                response = await client.get(url, headers=headers)
+            except httpx.HTTPError as e:
+                scheduler.report(url, None, time.monotonic() - start)
+                elapsed += time.monotonic() - start
+                if attempt == retries:
+                    result = FetchResult(url, error=f"{type(e).__name__}: {e}")
+                    result.elapsed = elapsed
+                    return result
+                continue
+            elapsed += time.monotonic() - start
+
+        scheduler.report(
+            url, response.status_code, time.monotonic() - start,
+            parse_retry_after(response.headers.get("Retry-After"))
+        )
+        if not is_retryable(response.status_code):
+            break
+
+    if response.status_code == 304 and entry is not None:
+        cache.mark_validated(url)
+        result = not_modified_result(entry)
+    elif response.status_code >= 400:
+        result = FetchResult(url, status=response.status_code, error=f"HTTP {response.status_code}")
+    else:
+        if cache:
+            cache.store(url, response.text, response.headers)
+        result = FetchResult(url, html=response.text, status=response.status_code)
+
+    # Pas de page en cours dans la boucle asyncio : la durée est reportée par l'appelant
+    result.elapsed = elapsed
+    return result
+
+
+async def fetch_many_async(urls, per_host_limit=None, timeout=None):
+    """Télécharge toutes les URLs en parallèle. Retourne les FetchResult dans l'ordre des URLs."""
+    per_host_limit = per_host_limit or HTTP_CONFIG["async_per_host_limit"]
+    timeout = timeout or HTTP_CONFIG["timeout"]
+    semaphores = defaultdict(lambda: asyncio.Semaphore(per_host_limit))
+
+    limits = httpx.Limits(
+        max_connections=HTTP_CONFIG["async_max_connections"],
+        max_keepalive_connections=HTTP_CONFIG["async_max_connections"]
+    )
+    headers = {
+        "User-Agent": SELENIUM_CONFIG["user_agent"],
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    }
+
+    async with httpx.AsyncClient(
+        headers=headers,
+        limits=limits,
+        timeout=httpx.Timeout(timeout),
+        follow_redirects=True
+    ) as client:
+        return await asyncio.gather(*(_fetch_one(client, semaphores, url) for url in urls))
+
+
+def fetch_many(urls, per_host_limit=None, timeout=None):
+    """Version synchrone de fetch_many_async (lance sa propre boucle asyncio)."""
+    if not urls:
+        return []
+    return asyncio.run(fetch_many_async(urls, per_host_limit, timeout))
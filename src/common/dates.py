@@ -0,0 +1,58 @@
+"""
+Lecture des dates affichées dans les listes d'articles.
+
+Chaque source a son format ("Mis en ligne le 3 décembre 2025", "03/12/25",
+"14 October 2025", "05/12/2025"...) : on cherche la première date reconnaissable
+dans le texte, en français ou en anglais.
+"""
+import re
+from datetime import date
+
+MONTHS = {
+    'janvier': 1, 'février': 2, 'fevrier': 2, 'mars': 3, 'avril': 4,
+    'mai': 5, 'juin': 6, 'juillet': 7, 'août': 8, 'aout': 8,
+    'septembre': 9, 'octobre': 10, 'novembre': 11, 'décembre': 12, 'decembre': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+_DAY_MONTH_YEAR = re.compile(r"(\d{1,2})(?:er)?\s+([A-Za-zéûÉÛ]+)\.?\s+(\d{4})")
+_MONTH_DAY_YEAR = re.compile(r"([A-Za-z]+)\.?\s+(\d{1,2}),\s*(\d{4})")
+_NUMERIC = re.compile(r"(\d{1,2})[/.](\d{1,2})[/.](\d{4}|\d{2})\b")
+_ISO = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
+def _safe_date(year, month, day):
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_list_date(text):
+    """Première date reconnue dans le texte (datetime.date), ou None."""
+    if not text:
+        return None
+
+    match = _ISO.search(text)
+    if match:
+        return _safe_date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+    match = _DAY_MONTH_YEAR.search(text)
+    if match and match.group(2).lower() in MONTHS:
+        return _safe_date(int(match.group(3)), MONTHS[match.group(2).lower()], int(match.group(1)))
+
+    match = _MONTH_DAY_YEAR.search(text)
+    if match and match.group(1).lower() in MONTHS:
+        return _safe_date(int(match.group(3)), MONTHS[match.group(1).lower()], int(match.group(2)))
+
+    match = _NUMERIC.search(text)
+    if match:
+        year = int(match.group(3))
+        if year < 100:
+            year += 2000
+        return _safe_date(year, int(match.group(2)), int(match.group(1)))
+
+    return None
@@ -1,15 +1,20 @@
 """
 Configuration du driver Selenium pour le scraping
 """
+import os
+
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
-from config.settings import SELENIUM_CONFIG
+from config.settings import DRIVER_SUPERVISION_CONFIG, SELENIUM_CONFIG, RESOURCE_BLOCKING_CONFIG
+from src.common import run_stats
+from src.common.resource_filter import enable_resource_filtering
 
 
-def get_driver():
-    """Configure et renvoie le driver Selenium standardisé pour le projet."""
+def build_chrome_options(block_resources):
+    """Options Chrome standardisées du projet (partagées avec le service navigateur)."""
     chrome_options = Options()
 
     if SELENIUM_CONFIG["headless"]:
@@ -20,5 +25,242 @@ def get_driver():
     chrome_options.add_argument(f"--window-size={SELENIUM_CONFIG['window_size']}")
     chrome_options.add_argument(f"user-agent={SELENIUM_CONFIG['user_agent']}")
 
+    if block_resources:
+        chrome_options.page_load_strategy = RESOURCE_BLOCKING_CONFIG["page_load_strategy"]
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        # Logs réseau : permettent de compter les requêtes bloquées par page
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    return chrome_options
+
+
+def get_driver(block_resources=None):
+    """
+    Configure et renvoie le driver Selenium standardisé pour le projet.
+    block_resources : bloque images, polices, CSS et trackers (défaut : RESOURCE_BLOCKING_CONFIG).
+    """
+    if block_resources is None:
+        block_resources = RESOURCE_BLOCKING_CONFIG["enabled"]
+
     service = Service(ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=chrome_options)
\ No newline at end of file
+    driver = webdriver.Chrome(service=service, options=build_chrome_options(block_resources))
+
+    driver.resource_filtering = block_resources
+    if block_resources:
+        enable_resource_filtering(driver)
+    return driver
+
+
+def open_tabs(driver, count):
+    """
+    Ouvre des onglets jusqu'à en avoir `count` dans le navigateur du driver.
+    Retourne leurs handles (le premier est l'onglet courant) ; le filtrage des
+    ressources est activé dans chaque nouvel onglet.
+    """
+    original = driver.current_window_handle
+    handles = [original] + [handle for handle in driver.window_handles if handle != original]
+
+    while len(handles) < count:
+        driver.switch_to.new_window("tab")
+        if getattr(driver, "resource_filtering", False):
+            enable_resource_filtering(driver)
+        handles.append(driver.current_window_handle)
+
+    driver.switch_to.window(original)
+    return handles[:count]
+
+
+def close_tabs(driver, keep):
+    """Ferme tous les onglets sauf `keep` et revient dessus."""
+    for handle in driver.window_handles:
+        if handle != keep:
+            driver.switch_to.window(handle)
+            driver.close()
+    driver.switch_to.window(keep)
+
+
+class LazyDriver:
+    """
+    Driver démarré uniquement au premier usage.
+    Permet aux runs en HTTP pur de ne jamais lancer Chrome.
+    """
+
+    def __init__(self, factory=get_driver):
+        self._factory = factory
+        self._driver = None
+
+    @property
+    def started(self):
+        return self._driver is not None
+
+    def __getattr__(self, name):
+        if self._driver is None:
+            self._driver = self._factory()
+        return getattr(self._driver, name)
+
+    def quit(self):
+        """Ferme le navigateur s'il a été démarré."""
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
+
+
+# Compteurs du driver dans run_stats (rapport de run), hors des sources
+DRIVER_STATS = "driver"
+
+
+def process_tree_rss_mb(pid):
+    """
+    Mémoire résidente (Mo) d'un processus et de tous ses descendants, lue dans /proc.
+    Retourne None hors Linux ou si le processus n'existe plus.
+    """
+    try:
+        children = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", 'r') as f:
+                    # Le nom du processus (2e champ) peut contenir des espaces : on lit après la parenthèse
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+
+        page_kb = os.sysconf("SC_PAGE_SIZE") / 1024
+        total_kb, stack = 0.0, [pid]
+        while stack:
+            current = stack.pop()
+            try:
+                with open(f"/proc/{current}/statm", 'r') as f:
+                    total_kb += int(f.read().split()[1]) * page_kb
+            except (OSError, IndexError, ValueError):
+                if current == pid:
+                    return None
+                continue
+            stack.extend(children.get(current, []))
+        return total_kb / 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def driver_rss_mb(driver):
+    """RSS (Mo) de chromedriver et des processus Chrome d'un driver local, ou None."""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None:
+        return None
+    return process_tree_rss_mb(process.pid)
+
+
+class SupervisedDriver(LazyDriver):
+    """
+    Driver paresseux surveillé pour les runs longs.
+    - recyclé (Chrome fermé puis relancé) après DRIVER_SUPERVISION_CONFIG["max_pages"] pages
+      ou au-delà de "max_rss_mb" de mémoire résidente
+    - si Chrome ne répond plus après une WebDriverException (crash, session perdue),
+      il est relancé et la page est rejouée (jusqu'à "max_restarts" fois)
+    Relances et recyclages sont comptés dans run_stats (entrée "driver" du rapport de run).
+    """
+
+    def __init__(self, factory=get_driver, config=None):
+        super().__init__(factory)
+        self.config = {**DRIVER_SUPERVISION_CONFIG, **(config or {})}
+        self.pages = 0
+
+    def run(self, func, *args):
+        """Exécute func(driver, *args) pour une page, avec recyclage et relance si Chrome meurt."""
+        self._maybe_recycle()
+        self.pages += 1
+        restarts = 0
+        while True:
+            try:
+                return func(self, *args)
+            except WebDriverException as e:
+                if not self.recover(e, restarts):
+                    raise
+                restarts += 1
+
+    def recover(self, error, restarts):
+        """
+        Après une WebDriverException : si Chrome ne répond plus et que moins de
+        max_restarts relances ont eu lieu pour cette opération, le relance et retourne True.
+        """
+        if self.is_alive() or restarts >= self.config["max_restarts"]:
+            return False
+        run_stats.increment(DRIVER_STATS, "restarts")
+        print(f"   🔁 Chrome ne répond plus ({type(error).__name__}) : "
+              f"relance {restarts + 1}/{self.config['max_restarts']}")
+        self._restart(dead=True)
+        return True
+
+    def is_alive(self):
+        """Vrai si Chrome répond (ou n'est pas encore démarré)."""
+        if self._driver is None:
+            return True
+        try:
+            self._driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _restart(self, dead=False):
+        """
+        Ferme le navigateur (sans échouer s'il est déjà mort) ; le suivant démarre au prochain usage.
+        dead : Chrome ne répond plus. Une session du service navigateur est alors rendue
+        comme morte (discard) pour que le service la remplace au lieu de la prêter à nouveau.
+        """
+        try:
+            if dead and hasattr(self._driver, "discard"):
+                self._driver.discard()
+                self._driver = None
+            else:
+                self.quit()
+        except Exception:
+            self._driver = None
+        self.pages = 0
+
+    def recycle_reason(self):
+        """Raison de recycler Chrome avant la page suivante (pages, mémoire), ou None."""
+        if self._driver is None:
+            return None
+        if self.pages >= self.config["max_pages"]:
+            return f"{self.pages} pages"
+        if self.pages and self.pages % self.config["rss_check_every"] == 0:
+            rss = driver_rss_mb(self._driver)
+            if rss is not None and rss >= self.config["max_rss_mb"]:
+                return f"{rss:.0f} Mo de RSS"
+        return None
+
+    def recycle(self, reason):
+        """Ferme Chrome (relancé au prochain usage) et compte le recyclage."""
+        run_stats.increment(DRIVER_STATS, "recycled")
+        print(f"   ♻️  Chrome recyclé ({reason})")
+        self._restart()
+
+    def _maybe_recycle(self):
+        reason = self.recycle_reason()
+        if reason:
+            self.recycle(reason)
+
+
+def count_page(driver):
+    """
+    Compte une page chargée sans driver.get (onglets) : seuil de recyclage du driver
+    supervisé et usure de la session empruntée au service navigateur.
+    """
+    if isinstance(driver, SupervisedDriver):
+        driver.pages += 1
+        driver = driver._driver
+    if driver is not None and hasattr(driver, "pages_served"):
+        driver.pages_served += 1
+
+
+def run_supervised(driver, func, *args):
+    """func(driver, *args), supervisé si le driver est un SupervisedDriver."""
+    if isinstance(driver, SupervisedDriver):
+        return driver.run(func, *args)
+    return func(driver, *args)
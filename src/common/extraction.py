@@ -0,0 +1,212 @@
+"""
+Noyau d'extraction rapide (lxml) partagé par les extracteurs des scrapers.
+
+Les extracteurs construisaient un arbre BeautifulSoup complet de chaque page
+pour n'en lire qu'un conteneur. Ici :
+- la page est parsée par lxml (en C) et le conteneur retrouvé par XPath compilé
+- le texte n'est parcouru que dans ce conteneur
+- les marqueurs (paywall, bruit) sont cherchés en une passe par regex compilée
+
+get_text reproduit Tag.get_text de BeautifulSoup avec le parseur 'lxml' : mêmes
+chaînes, même normalisation des blancs, textes de <script>, <style>, <template>,
+<rt> et <rp> ignorés. La sortie des extracteurs est donc inchangée
+(vérifié par dev_analysis/bench_extraction.py sur les pages archivées).
+"""
+import re
+import threading
+import time
+
+from lxml import etree
+from src.common import timings
+
+# Balises dont BeautifulSoup range le texte dans une classe à part (exclue de get_text)
+_STRING_CONTAINERS = frozenset(("script", "style", "template", "rt", "rp"))
+# Balises où BeautifulSoup conserve les chaînes de blancs telles quelles
+_PRESERVE_WHITESPACE = frozenset(("pre", "textarea"))
+_ASCII_SPACES = " \n\t\x0c\r"
+
+# Un parseur lxml ne doit pas être partagé entre threads (pool de workers)
+_local = threading.local()
+
+
+def _parser():
+    if not hasattr(_local, "parser"):
+        _local.parser = etree.HTMLParser()
+    return _local.parser
+
+
+def parse_html(html):
+    """Arbre lxml d'une page (même parseur que BeautifulSoup(html, 'lxml')), ou None si vide."""
+    if not html:
+        return None
+    start = time.perf_counter()
+    try:
+        return etree.fromstring(html, _parser())
+    except ValueError:
+        # Chaîne unicode avec déclaration d'encodage XML : on repasse en octets
+        return etree.fromstring(html.encode('utf-8'), etree.HTMLParser(encoding='utf-8'))
+    except etree.XMLSyntaxError:
+        return None
+    finally:
+        timings.add("parse", time.perf_counter() - start)
+
+
+def by_class(tag, class_name):
+    """XPath compilé : premier <tag> dont l'attribut class contient la classe `class_name`."""
+    return etree.XPath(
+        f"(//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')])[1]"
+    )
+
+
+def all_by_class(tag, class_name):
+    """XPath compilé : tous les <tag> ayant la classe `class_name`, dans l'ordre du document."""
+    return etree.XPath(f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]")
+
+
+def by_tag(tag):
+    """XPath compilé : premier élément <tag> du document."""
+    return etree.XPath(f"(//{tag})[1]")
+
+
+def find_first(root, xpath):
+    """Premier élément trouvé par un XPath compilé, ou None."""
+    if root is None:
+        return None
+    start = time.perf_counter()
+    found = xpath(root)
+    timings.add("extract", time.perf_counter() - start)
+    return found[0] if found else None
+
+
+def find_all(root, xpath):
+    """Tous les éléments trouvés par un XPath compilé."""
+    if root is None:
+        return []
+    start = time.perf_counter()
+    found = xpath(root)
+    timings.add("extract", time.perf_counter() - start)
+    return found
+
+
+def _normalize(text, preserve):
+    """Chaîne de blancs ASCII -> "\\n" ou " " (comme BeautifulSoup hors <pre>/<textarea>)."""
+    if preserve or text.strip(_ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def iter_strings(elem):
+    """Chaînes de texte d'un élément, dans l'ordre, telles que BeautifulSoup les découpe."""
+    excluded = preserve = 0
+    for ancestor in elem.iterancestors():
+        excluded += ancestor.tag in _STRING_CONTAINERS
+        preserve += ancestor.tag in _PRESERVE_WHITESPACE
+
+    # Parcours en profondeur explicite : iterwalk ne visite pas les commentaires,
+    # dont le texte qui suit (tail) fait pourtant partie du contenu
+    stack = [(elem, False)]
+    while stack:
+        el, closing = stack.pop()
+        tag = el.tag
+
+        if closing:
+            excluded -= tag in _STRING_CONTAINERS
+            preserve -= tag in _PRESERVE_WHITESPACE
+        elif isinstance(tag, str):
+            excluded += tag in _STRING_CONTAINERS
+            preserve += tag in _PRESERVE_WHITESPACE
+            if el.text and not excluded:
+                yield _normalize(el.text, preserve)
+            stack.append((el, True))
+            stack.extend((child, False) for child in reversed(el))
+            continue
+
+        # Texte qui suit un élément ou un commentaire : il appartient au parent
+        if el is not elem and el.tail and not excluded:
+            yield _normalize(el.tail, preserve)
+
+
+def get_text(elem, separator="", strip=False):
+    """Équivalent de Tag.get_text(separator, strip) de BeautifulSoup."""
+    if elem is None:
+        return ""
+    start = time.perf_counter()
+    if not strip:
+        text = separator.join(iter_strings(elem))
+    else:
+        text = separator.join(s for s in (s.strip() for s in iter_strings(elem)) if s)
+    timings.add("extract", time.perf_counter() - start)
+    return text
+
+
+def text_length(elem):
+    """Équivalent de len(tag.get_text()), sans construire la chaîne."""
+    start = time.perf_counter()
+    length = sum(len(s) for s in iter_strings(elem))
+    timings.add("extract", time.perf_counter() - start)
+    return length
+
+
+class Markers:
+    """Ensemble de marqueurs de texte, compilés en une seule regex."""
+
+    def __init__(self, markers):
+        self.markers = tuple(markers)
+        self._regex = re.compile("|".join(re.escape(m) for m in self.markers))
+
+    def search(self, text):
+        """Vrai si le texte contient l'un des marqueurs (une seule passe)."""
+        return self._regex.search(text) is not None
+
+    def cut(self, text):
+        """
+        Coupe le texte avant les marqueurs, à l'identique de
+        `for m in markers: if m in text: text = text.split(m)[0]`,
+        mais sans découper le texte : une recherche bornée par marqueur.
+        """
+        if not self._regex.search(text):
+            return text
+        end = len(text)
+        for marker in self.markers:
+            position = text.find(marker, 0, end)
+            if position != -1:
+                end = position
+        return text[:end]
+
+
+# Métadonnées d'une page d'article, par ordre de préférence
+_TITLE_XPATHS = (
+    etree.XPath("//meta[@property='og:title']/@content"),
+    etree.XPath("//meta[@name='twitter:title']/@content"),
+    etree.XPath("(//h1)[1]"),
+    etree.XPath("(//title)[1]"),
+)
+_DATE_XPATHS = (
+    etree.XPath("//meta[@property='article:published_time']/@content"),
+    etree.XPath("//meta[@name='dcterms.date' or @name='DC.date' or @name='date']/@content"),
+    etree.XPath("(//time[@datetime])[1]/@datetime"),
+)
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def page_metadata(html):
+    """Titre et date de publication (YYYY-MM-DD) d'une page d'article : {title, date}, "" si absents."""
+    metadata = {"title": "", "date": ""}
+    root = parse_html(html)
+    if root is None:
+        return metadata
+
+    for xpath in _TITLE_XPATHS:
+        found = find_all(root, xpath)
+        if found:
+            value = found[0] if isinstance(found[0], str) else get_text(found[0], separator=" ", strip=True)
+            metadata["title"] = " ".join(value.split())
+            if metadata["title"]:
+                break
+
+    for xpath in _DATE_XPATHS:
+        match = next((_ISO_DATE.match(value.strip()) for value in find_all(root, xpath) if value), None)
+        if match:
+            metadata["date"] = match.group(0)
+            break
+    return metadata
@@ -0,0 +1,94 @@
+"""
+Couche de récupération des pages : HTTP d'abord, navigateur en secours.
+
+La stratégie de chaque source est déclarée dans SOURCES_CONFIG["fetch_strategy"]
+pour la liste et pour les articles :
+- "http"    : requête HTTP simple uniquement
+- "browser" : Selenium uniquement (pages rendues en JavaScript)
+- "auto"    : HTTP, puis Selenium si le sélecteur attendu est absent du HTML
+"""
+from bs4 import BeautifulSoup
+from config.settings import SOURCES_CONFIG
+from src.archive.html_archive import get_html_archive
+from src.common import run_stats
+from src.common.http_client import FetchResult, http_get
+from src.common.readiness import get_readiness_rule, load_page
+
+FETCH_STRATEGIES = ("http", "browser", "auto")
+
+
+def get_fetch_strategy(source_code, page_type):
+    """Retourne la stratégie de fetch d'une source pour 'list' ou 'content'."""
+    strategy = SOURCES_CONFIG[source_code].get("fetch_strategy", {}).get(page_type, "browser")
+    if strategy not in FETCH_STRATEGIES:
+        raise ValueError(f"Stratégie de fetch inconnue pour {source_code}/{page_type} : {strategy}")
+    return strategy
+
+
+def has_expected_content(html, source_code, page_type):
+    """Vérifie que le HTML contient le conteneur attendu (sélecteur de readiness)."""
+    selector = get_readiness_rule(source_code, page_type)["selector"]
+    return BeautifulSoup(html, 'lxml').select_one(selector) is not None
+
+
+def is_usable(result, source_code, page_type, strategy):
+    """
+    Le HTML obtenu en HTTP est exploitable : stratégie "http", page inchangée
+    déjà extraite (304), ou conteneur attendu présent.
+    """
+    if not result.ok:
+        return False
+    if strategy == "http" or (result.not_modified and result.extracted_before):
+        return True
+    return has_expected_content(result.html, source_code, page_type)
+
+
+def archive_result(source_code, page_type, result):
+    """Archive le HTML brut d'une page récupérée (sauf page inchangée, déjà archivée)."""
+    archive = get_html_archive()
+    if archive and result.ok and not result.not_modified:
+        archive.store(result.url, source_code, page_type, result.html)
+
+
+def record_http_result(source_code, result):
+    """Compte les succès du cache HTTP (304) et les téléchargements complets."""
+    if result.not_modified:
+        run_stats.increment(source_code, "cache_hits")
+    elif result.ok:
+        run_stats.increment(source_code, "cache_misses")
+
+
+def fetch_document(driver, url, source_code, page_type):
+    """
+    Récupère une page selon la stratégie de la source et retourne un FetchResult.
+    Le driver n'est sollicité que si la stratégie l'exige (ou en secours).
+    """
+    strategy = get_fetch_strategy(source_code, page_type)
+
+    if strategy != "browser":
+        result = http_get(url)
+        record_http_result(source_code, result)
+
+        if is_usable(result, source_code, page_type, strategy):
+            run_stats.increment(source_code, "fetch_http")
+            archive_result(source_code, page_type, result)
+            return result
+
+        if strategy == "http":
+            run_stats.increment(source_code, "fetch_http_failed")
+            return result
+
+        run_stats.increment(source_code, "fetch_fallback")
+
+    if driver is None:
+        raise RuntimeError(f"Navigateur requis pour {url} mais aucun driver disponible")
+
+    run_stats.increment(source_code, "fetch_browser")
+    result = FetchResult(url, html=load_page(driver, url, source_code, page_type), via="browser")
+    archive_result(source_code, page_type, result)
+    return result
+
+
+def fetch_page(driver, url, source_code, page_type):
+    """Récupère le HTML d'une page selon la stratégie de la source ("" si échec)."""
+    return fetch_document(driver, url, source_code, page_type).html or ""
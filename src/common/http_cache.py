@@ -0,0 +1,172 @@
+"""
+Cache HTTP persistant des pages scrapées (sous data/http_cache).
+
+Pour chaque URL on garde le HTML, ses validateurs (ETag / Last-Modified) et,
+pour les articles, le contenu extrait. Les requêtes suivantes sont
+conditionnelles (If-None-Match / If-Modified-Since) : une réponse 304 évite
+à la fois le téléchargement et la ré-extraction.
+"""
+import hashlib
+import json
+import marshal
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from config.settings import HTTP_CACHE_CONFIG
+
+
+# Sources dont dépend tout extracteur (helpers lxml partagés), en plus de son propre module
+_EXTRACTOR_DEPENDENCIES = (Path(__file__).with_name("extraction.py"),)
+
+_extractor_versions = {}
+
+
+def extractor_version(func):
+    """Empreinte d'un extracteur : un contenu extrait en cache n'est réutilisé que si
+    l'extracteur n'a pas changé depuis. On hache le source complet du module de
+    l'extracteur (constantes STOP_MARKERS, sélecteurs...) et de src/common/extraction.py,
+    pas seulement le bytecode de la fonction."""
+    key = (func.__module__, func.__qualname__)
+    if key not in _extractor_versions:
+        digest = hashlib.sha1()
+        module_file = getattr(sys.modules.get(func.__module__), "__file__", None)
+        if module_file:
+            for path in (Path(module_file), *_EXTRACTOR_DEPENDENCIES):
+                digest.update(path.read_bytes())
+        else:
+            digest.update(marshal.dumps(func.__code__))
+        _extractor_versions[key] = digest.hexdigest()[:16]
+    return _extractor_versions[key]
+
+
+class CacheEntry:
+    """Entrée du cache : HTML + métadonnées."""
+
+    def __init__(self, url, body, meta):
+        self.url = url
+        self.body = body
+        self.meta = meta
+
+    @property
+    def etag(self):
+        return self.meta.get("etag")
+
+    @property
+    def last_modified(self):
+        return self.meta.get("last_modified")
+
+
+class HttpCache:
+    """Cache disque indexé par URL (un fichier HTML + un fichier JSON de métadonnées)."""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory or HTTP_CACHE_CONFIG["directory"])
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        folder = self.directory / key[:2]
+        return folder / f"{key}.html", folder / f"{key}.json"
+
+    def _read_meta(self, url):
+        _, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_atomic(self, path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + f".{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _write_meta(self, url, meta):
+        _, meta_path = self._paths(url)
+        self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False))
+
+    def get(self, url):
+        """Retourne l'entrée en cache de l'URL, ou None."""
+        meta = self._read_meta(url)
+        if meta is None:
+            return None
+        body_path, _ = self._paths(url)
+        try:
+            with open(body_path, 'r', encoding='utf-8') as f:
+                return CacheEntry(url, f.read(), meta)
+        except FileNotFoundError:
+            return None
+
+    def conditional_headers(self, entry):
+        """En-têtes de revalidation pour une entrée du cache."""
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, url, body, headers):
+        """Enregistre une réponse 200 (remplace l'entrée et oublie l'ancien contenu extrait)."""
+        body_path, _ = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "validated_at": time.time(),
+        }
+        with self._lock:
+            self._write_atomic(body_path, body)
+            self._write_meta(url, meta)
+
+    def mark_validated(self, url):
+        """Note une revalidation réussie (réponse 304)."""
+        with self._lock:
+            meta = self._read_meta(url)
+            if meta is not None:
+                meta["validated_at"] = time.time()
+                self._write_meta(url, meta)
+
+    def get_extracted(self, url, version):
+        """Contenu extrait en cache pour cette version d'extracteur, ou None."""
+        meta = self._read_meta(url)
+        if meta and meta.get("extractor_version") == version:
+            return meta.get("extracted")
+        return None
+
+    def set_extracted(self, url, content, version):
+        """Mémorise le contenu extrait d'une page en cache."""
+        with self._lock:
+            meta = self._read_meta(url)
+            if meta is not None:
+                meta["extracted"] = content
+                meta["extractor_version"] = version
+                self._write_meta(url, meta)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache():
+    """Retourne le cache HTTP partagé, ou None s'il est désactivé."""
+    global _cache
+    if not HTTP_CACHE_CONFIG["enabled"]:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = HttpCache()
+    return _cache
+
+
+def set_cache_enabled(enabled):
+    """Active / désactive le cache HTTP pour le run courant (ex : option --no-cache)."""
+    HTTP_CACHE_CONFIG["enabled"] = enabled
@@ -0,0 +1,132 @@
+"""
+Client HTTP partagé pour le scraping (connexions keep-alive + compression gzip,
+requêtes conditionnelles via le cache HTTP persistant, politesse par hôte).
+"""
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from config.settings import HTTP_CONFIG, SELENIUM_CONFIG
+from src.common import timings
+from src.common.http_cache import get_http_cache
+from src.common.politeness import get_scheduler, is_retryable, max_retries, parse_retry_after
+
+class FetchResult:
+    """Résultat du téléchargement d'une URL."""
+
+    def __init__(self, url, html=None, status=None, error=None, not_modified=False, via="http"):
+        self.url = url
+        self.html = html
+        self.status = status
+        self.error = error
+        self.not_modified = not_modified  # True si servi depuis le cache après un 304
+        self.via = via                    # "http" ou "browser"
+        self.elapsed = 0.0                # durée des requêtes (s), hors attentes de politesse
+        self.extracted_before = False     # page inchangée dont le contenu a déjà été extrait
+
+    @property
+    def ok(self):
+        return self.html is not None
+
+
+def not_modified_result(entry):
+    """FetchResult servi depuis le cache après une réponse 304."""
+    result = FetchResult(entry.url, html=entry.body, status=304, not_modified=True)
+    result.extracted_before = "extracted" in entry.meta
+    return result
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """Retourne la session requests partagée (singleton, pool de connexions)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_CONFIG["pool_connections"],
+                    pool_maxsize=HTTP_CONFIG["pool_maxsize"]
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({
+                    "User-Agent": SELENIUM_CONFIG["user_agent"],
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Encoding": "gzip, deflate",
+                    "Connection": "keep-alive",
+                })
+                _session = session
+    return _session
+
+
+def polite_request(method, url, **kwargs):
+    """
+    Requête via la session partagée, cadencée par l'ordonnanceur de politesse.
+    Sur 429 / 5xx ou erreur réseau, l'hôte est mis en pause et la requête retentée
+    (POLITENESS_CONFIG["max_retries"] fois). Retourne la dernière réponse ;
+    l'erreur réseau de la dernière tentative est relevée.
+    """
+    scheduler = get_scheduler()
+    retries = max_retries()
+
+    for attempt in range(retries + 1):
+        scheduler.acquire(url)
+        start = time.monotonic()
+        try:
+            response = get_http_session().request(method, url, **kwargs)
+        except requests.RequestException:
+            scheduler.report(url, None, time.monotonic() - start)
+            if attempt == retries:
+                raise
+            continue
+        finally:
+            timings.add("navigate", time.monotonic() - start)
+
+        scheduler.report(
+            url, response.status_code, time.monotonic() - start,
+            parse_retry_after(response.headers.get("Retry-After"))
+        )
+        if not is_retryable(response.status_code) or attempt == retries:
+            return response
+        response.close()
+
+
+def http_get(url):
+    """
+    Télécharge une page en HTTP simple, avec revalidation si elle est en cache.
+    Retourne un FetchResult (html à None si la requête échoue).
+    """
+    cache = get_http_cache()
+    entry = cache.get(url) if cache else None
+    headers = cache.conditional_headers(entry) if entry else {}
+
+    try:
+        response = polite_request("GET", url, headers=headers, timeout=HTTP_CONFIG["timeout"])
+    except requests.RequestException as e:
+        print(f"   ⚠️ Erreur HTTP {url}: {e}")
+        return FetchResult(url, error=f"{type(e).__name__}: {e}")
+
+    if response.status_code == 304 and entry is not None:
+        cache.mark_validated(url)
+        return not_modified_result(entry)
+
+    if response.status_code >= 400:
+        print(f"   ⚠️ HTTP {response.status_code} sur {url}")
+        return FetchResult(url, status=response.status_code, error=f"HTTP {response.status_code}")
+
+    if cache:
+        cache.store(url, response.text, response.headers)
+    return FetchResult(url, html=response.text, status=response.status_code)
+
+
+def http_get_html(url):
+    """
+    Télécharge une page en HTTP simple.
+    Retourne le HTML, ou None si la requête échoue (statut >= 400, timeout...).
+    """
+    return http_get(url).html
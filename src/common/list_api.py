@@ -0,0 +1,225 @@
+"""
+Listes d'articles servies par une API JSON (XHR) plutôt que rendues en HTML.
+
+Pour une source qui déclare SOURCES_CONFIG[...]["list_api"] (ex. l'index Algolia de l'AFG) :
+1. capture unique : la page de liste est chargée une fois dans le navigateur, la requête
+   XHR vers l'API (URL, clés publiques, paramètres) est relevée puis enregistrée dans
+   data/list_api/<source>.json
+2. ensuite la liste est paginée directement en JSON, des centaines de résultats par requête
+
+Le transport est interchangeable (LIST_API_CONFIG["mode"]) :
+- "live"   : requêtes réelles
+- "record" : requêtes réelles, réponses enregistrées dans data/list_api/<source>/responses/
+- "replay" : réponses enregistrées uniquement, sans réseau (pour tester les parseurs)
+"""
+import hashlib
+import json
+import os
+import time
+from urllib.parse import parse_qsl, urlencode
+
+import requests
+from selenium.common.exceptions import WebDriverException
+from config.settings import HTTP_CONFIG, LIST_API_CONFIG, SOURCES_CONFIG
+from src.common.http_client import polite_request
+from src.common.readiness import navigate, wait_for_page
+
+# URLs des requêtes XHR déjà émises par la page (Resource Timing API)
+_XHR_URLS_JS = """
+return performance.getEntriesByType('resource')
+    .filter(r => r.initiatorType === 'xmlhttprequest' || r.initiatorType === 'fetch')
+    .map(r => r.name);
+"""
+
+
+def get_api_config(source_code):
+    """Configuration de l'API de liste d'une source, ou None."""
+    return SOURCES_CONFIG[source_code].get("list_api")
+
+
+def get_endpoint_path(source_code):
+    """Fichier où est enregistré l'endpoint capturé d'une source."""
+    return os.path.join(str(LIST_API_CONFIG["directory"]), f"{source_code}.json")
+
+
+def load_endpoint(source_code):
+    """Endpoint capturé d'une source ({url, index, params}), ou None."""
+    try:
+        with open(get_endpoint_path(source_code), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def save_endpoint(source_code, endpoint):
+    """Enregistre l'endpoint capturé d'une source."""
+    path = get_endpoint_path(source_code)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(endpoint, f, ensure_ascii=False, indent=2)
+
+
+def _captured_requests(driver, url_pattern):
+    """
+    Requêtes de la page vers l'API : [(url, corps POST ou None)].
+    Les logs réseau (si activés) donnent aussi le corps ; sinon seules les URLs sont connues.
+    """
+    found = []
+    try:
+        for entry in driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") != "Network.requestWillBeSent":
+                continue
+            request = message["params"]["request"]
+            if url_pattern in request["url"]:
+                found.append((request["url"], request.get("postData")))
+    except WebDriverException:
+        pass
+
+    if not found:
+        found = [(url, None) for url in driver.execute_script(_XHR_URLS_JS) or [] if url_pattern in url]
+    return found
+
+
+def capture_endpoint(driver, source_code, list_url):
+    """
+    Charge la page de liste dans le navigateur et relève la requête XHR vers l'API.
+    L'index et les paramètres envoyés par la page sont repris tels quels (complétés par
+    ceux de la config) ; l'endpoint est enregistré pour les runs suivants.
+    """
+    api = get_api_config(source_code)
+
+    navigate(driver, list_url)
+    wait_for_page(driver, source_code, "list")
+
+    captured = _captured_requests(driver, api["url_pattern"])
+    if not captured:
+        print(f"   ⚠️ [{source_code.upper()}] Aucune requête '{api['url_pattern']}' relevée sur {list_url}")
+        return None
+
+    url, post_data = captured[0]
+    index, params = api["index"], {}
+
+    if post_data:
+        for request in json.loads(post_data).get("requests", []):
+            if request.get("indexName") == api["index"]:
+                params = dict(parse_qsl(request.get("params", "")))
+                break
+
+    endpoint = {
+        "url": url,
+        "index": index,
+        "params": {**params, **api.get("params", {})},
+        "captured_at": time.strftime("%Y-%m-%d %H:%M:%S")
+    }
+    save_endpoint(source_code, endpoint)
+    print(f"   📡 [{source_code.upper()}] Endpoint API capturé : {url.split('?')[0]} (index {index})")
+    return endpoint
+
+
+def get_endpoint(source_code, driver=None, list_url=None):
+    """Endpoint de la source : enregistré, sinon capturé (si un driver est fourni), sinon None."""
+    endpoint = load_endpoint(source_code)
+    if endpoint is None and driver is not None and list_url and LIST_API_CONFIG["mode"] != "replay":
+        endpoint = capture_endpoint(driver, source_code, list_url)
+    return endpoint
+
+
+def build_request(endpoint, page, hits_per_page):
+    """Corps d'une requête Algolia multi-index pour une page de résultats."""
+    params = {**endpoint["params"], "page": page, "hitsPerPage": hits_per_page}
+    return {"requests": [{"indexName": endpoint["index"], "params": urlencode(params)}]}
+
+
+def _response_key(body):
+    """Nom de fichier d'une réponse enregistrée (hash du corps de la requête)."""
+    return hashlib.sha1(json.dumps(body, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+class HttpTransport:
+    """Requêtes réelles vers l'API (session HTTP partagée, cadencée par hôte)."""
+
+    def post(self, url, body):
+        response = polite_request("POST", url, json=body, timeout=HTTP_CONFIG["timeout"])
+        response.raise_for_status()
+        return response.json()
+
+
+class RecordingTransport:
+    """Requêtes réelles, chaque réponse étant enregistrée pour un rejeu ultérieur."""
+
+    def __init__(self, directory, inner=None):
+        self.directory = directory
+        self.inner = inner or HttpTransport()
+        os.makedirs(directory, exist_ok=True)
+
+    def post(self, url, body):
+        data = self.inner.post(url, body)
+        path = os.path.join(self.directory, f"{_response_key(body)}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"request": body, "response": data}, f, ensure_ascii=False, indent=2)
+        return data
+
+
+class ReplayTransport:
+    """Réponses enregistrées uniquement (aucune requête réseau)."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def post(self, url, body):
+        path = os.path.join(self.directory, f"{_response_key(body)}.json")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)["response"]
+        except FileNotFoundError:
+            raise LookupError(f"Aucune réponse enregistrée pour cette requête ({path})")
+
+
+def get_transport(source_code, mode=None):
+    """Transport selon le mode ("live", "record" ou "replay")."""
+    mode = mode or LIST_API_CONFIG["mode"]
+    directory = os.path.join(str(LIST_API_CONFIG["directory"]), source_code, "responses")
+    if mode == "record":
+        return RecordingTransport(directory)
+    if mode == "replay":
+        return ReplayTransport(directory)
+    return HttpTransport()
+
+
+def iter_api_pages(source_code, endpoint, hits_per_page=None, max_pages=None, transport=None):
+    """Itère sur les pages de résultats de l'API (liste de hits par page)."""
+    hits_per_page = hits_per_page or get_api_config(source_code)["hits_per_page"]
+    transport = transport or get_transport(source_code)
+    page = 0
+
+    while max_pages is None or page < max_pages:
+        data = transport.post(endpoint["url"], build_request(endpoint, page, hits_per_page))
+        result = data["results"][0]
+        yield result.get("hits", [])
+
+        page += 1
+        if page >= result.get("nbPages", 0):
+            break
+
+
+def fetch_api_list(source_code, parse_hits, driver=None, list_url=None, limit=None, transport=None):
+    """
+    Premiers articles de la liste d'une source via son API JSON.
+    Retourne None si l'API n'est pas disponible (pas de config, capture ou requête en échec) :
+    l'appelant repasse alors par la page HTML.
+    """
+    if not get_api_config(source_code):
+        return None
+
+    try:
+        endpoint = get_endpoint(source_code, driver, list_url)
+        if endpoint is None:
+            return None
+
+        hits_per_page = min(limit, get_api_config(source_code)["hits_per_page"]) if limit else None
+        hits = next(iter_api_pages(source_code, endpoint, hits_per_page, 1, transport), [])
+        return parse_hits(hits, limit)
+    except (requests.RequestException, LookupError, KeyError, ValueError, WebDriverException) as e:
+        print(f"   ⚠️ [{source_code.upper()}] API de liste indisponible ({e}), repli sur la page HTML")
+        return None
@@ -0,0 +1,217 @@
+"""
+Ordonnanceur de politesse par hôte, utilisé par tous les chemins de fetch
+(requests, httpx asynchrone, Selenium).
+
+Pour chaque hôte :
+- seau à jetons : `rate` requêtes/s en moyenne, rafales limitées à `burst`
+- montée en charge : le débit augmente tant que le serveur répond vite,
+  et redescend doucement s'il ralentit
+- repli : sur 429 / 5xx (ou erreur réseau) le débit est divisé par deux et l'hôte
+  est mis en pause (Retry-After si fourni, sinon délai exponentiel avec gigue)
+
+Le débit atteint est donc le plus élevé que chaque autorité supporte, au lieu
+d'un time.sleep fixé à la main.
+"""
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from config.settings import POLITENESS_CONFIG
+
+RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+def get_host(url):
+    """Hôte d'une URL (clé de l'ordonnanceur)."""
+    return urlsplit(url).netloc.lower()
+
+
+def parse_retry_after(value):
+    """Délai d'un en-tête Retry-After (secondes ou date HTTP), ou None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(status):
+    """Statut (ou erreur réseau : None) qui justifie un repli puis une nouvelle tentative."""
+    return status is None or status in RETRYABLE_STATUSES
+
+
+class HostPolicy:
+    """Seau à jetons adaptatif d'un hôte (thread-safe)."""
+
+    def __init__(self, host, config):
+        self.host = host
+        self.config = config
+        self.rate = config["initial_rate"]
+        self.tokens = float(config["burst"])
+        self.refill_from = time.monotonic()  # pas de jetons avant cet instant (pause)
+        self.failures = 0
+        self.stats = {"requests": 0, "waits": 0, "wait_s": 0.0, "backoffs": 0}
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """Prend un jeton si possible. Retourne 0, ou le temps à attendre avant de réessayer."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.refill_from:
+                return self.refill_from - now
+
+            self.tokens = min(self.config["burst"], self.tokens + (now - self.refill_from) * self.rate)
+            self.refill_from = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self.stats["requests"] += 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+    def record_wait(self, seconds):
+        with self._lock:
+            self.stats["waits"] += 1
+            self.stats["wait_s"] += seconds
+
+    def report(self, status, elapsed, retry_after=None):
+        """
+        Ajuste le débit d'après une réponse (status None : erreur réseau).
+        Retourne la durée de la pause imposée à l'hôte (0 si aucune).
+        """
+        config = self.config
+        with self._lock:
+            if not is_retryable(status):
+                self.failures = 0
+                if elapsed <= config["fast_response_s"]:
+                    self.rate = min(config["max_rate"], self.rate * config["ramp_up_factor"])
+                elif elapsed >= config["slow_response_s"]:
+                    self.rate = max(config["min_rate"], self.rate / config["ramp_up_factor"])
+                return 0
+
+            self.failures += 1
+            self.rate = max(config["min_rate"], self.rate * config["backoff_rate_factor"])
+            if retry_after is None:
+                delay = config["backoff_base_s"] * 2 ** (self.failures - 1)
+                delay *= random.uniform(1, 1 + config["backoff_jitter"])
+            else:
+                delay = retry_after
+            delay = min(config["backoff_max_s"], delay)
+
+            # Un seul jeton à la fin de la pause : la nouvelle tentative part, les autres attendent
+            self.tokens = 1.0
+            self.refill_from = max(self.refill_from, time.monotonic() + delay)
+            self.stats["backoffs"] += 1
+            return delay
+
+    def summary(self):
+        with self._lock:
+            return {**self.stats, "rate": self.rate}
+
+
+class PolitenessScheduler:
+    """Politiques par hôte, créées à la première requête."""
+
+    def __init__(self, config=None):
+        self.config = config or POLITENESS_CONFIG
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def policy(self, url):
+        """Politique de l'hôte d'une URL (réglages généraux + surcharges de l'hôte)."""
+        host = get_host(url)
+        with self._lock:
+            if host not in self._hosts:
+                config = {**self.config, **self.config["host_overrides"].get(host, {})}
+                self._hosts[host] = HostPolicy(host, config)
+            return self._hosts[host]
+
+    def acquire(self, url):
+        """Bloque jusqu'à ce que l'hôte de l'URL accepte une requête."""
+        policy = self.policy(url)
+        waited = 0.0
+        while True:
+            wait = policy.try_acquire()
+            if not wait:
+                break
+            waited += wait
+            time.sleep(wait)
+        if waited:
+            policy.record_wait(waited)
+
+    def try_acquire(self, url):
+        """Version non bloquante de acquire : 0 si la requête peut partir, sinon l'attente restante (s)."""
+        return self.policy(url).try_acquire()
+
+    async def acquire_async(self, url):
+        """Version asynchrone de acquire (ne bloque pas la boucle asyncio)."""
+        policy = self.policy(url)
+        waited = 0.0
+        while True:
+            wait = policy.try_acquire()
+            if not wait:
+                break
+            waited += wait
+            await asyncio.sleep(wait)
+        if waited:
+            policy.record_wait(waited)
+
+    def report(self, url, status, elapsed, retry_after=None):
+        """Transmet le résultat d'une requête à la politique de son hôte. Retourne la pause imposée."""
+        delay = self.policy(url).report(status, elapsed, retry_after)
+        if delay:
+            reason = f"HTTP {status}" if status else "erreur réseau"
+            print(f"   ⏳ {get_host(url)} : {reason}, pause de {delay:.1f}s")
+        return delay
+
+    def summary(self):
+        """Statistiques par hôte {hôte: {requests, waits, wait_s, backoffs, rate}}."""
+        with self._lock:
+            policies = list(self._hosts.values())
+        return {policy.host: policy.summary() for policy in policies}
+
+
+class _NoScheduler:
+    """Ordonnanceur inactif (POLITENESS_CONFIG["enabled"] à False)."""
+
+    def acquire(self, url):
+        pass
+
+    def try_acquire(self, url):
+        return 0
+
+    async def acquire_async(self, url):
+        pass
+
+    def report(self, url, status, elapsed, retry_after=None):
+        return 0
+
+    def summary(self):
+        return {}
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """Retourne l'ordonnanceur partagé par tous les fetchs du processus."""
+    global _scheduler
+    if not POLITENESS_CONFIG["enabled"]:
+        return _NoScheduler()
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = PolitenessScheduler()
+    return _scheduler
+
+
+def max_retries():
+    """Nombre de nouvelles tentatives après un 429 / 5xx (0 si l'ordonnanceur est désactivé)."""
+    return POLITENESS_CONFIG["max_retries"] if POLITENESS_CONFIG["enabled"] else 0
@@ -0,0 +1,234 @@
+"""
+Attente conditionnelle des pages (remplace les time.sleep fixes des scrapers).
+Chaque source déclare dans SOURCES_CONFIG le sélecteur CSS de son conteneur
+et le délai maximal d'attente, pour la liste et pour les articles.
+"""
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from config.settings import SOURCES_CONFIG, SELENIUM_CONFIG, RESOURCE_BLOCKING_CONFIG
+from src.common import run_stats, timings
+from src.common.driver_setup import SupervisedDriver, close_tabs, count_page, open_tabs, run_supervised
+from src.common.politeness import get_scheduler
+from src.common.resource_filter import apply_source_rules, collect_page_metrics
+
+
+def get_readiness_rule(source_code, page_type):
+    """Retourne la règle d'attente {selector, timeout} d'une source ('list' ou 'content')."""
+    return SOURCES_CONFIG[source_code]["readiness"][page_type]
+
+
+def wait_for_page(driver, source_code, page_type):
+    """
+    Attend que le conteneur attendu soit présent dans le DOM.
+    Retourne True si la page est prête, False si le délai est dépassé.
+    """
+    rule = get_readiness_rule(source_code, page_type)
+    start = time.perf_counter()
+
+    try:
+        WebDriverWait(
+            driver,
+            rule["timeout"],
+            poll_frequency=SELENIUM_CONFIG["ready_poll_frequency"]
+        ).until(EC.presence_of_element_located((By.CSS_SELECTOR, rule["selector"])))
+        return True
+    except TimeoutException:
+        print(f"   ⚠️ [{source_code.upper()}] '{rule['selector']}' absent après {rule['timeout']}s")
+        return False
+    finally:
+        timings.add("wait", time.perf_counter() - start)
+
+
+def record_page_metrics(driver, source_code):
+    """Ajoute le poids et le temps de chargement de la page courante aux stats du run."""
+    try:
+        metrics = collect_page_metrics(driver)
+    except Exception:
+        return
+    run_stats.increment(source_code, "browser_pages")
+    run_stats.increment(source_code, "browser_bytes", metrics.get("transferred_bytes", 0))
+    run_stats.increment(source_code, "browser_load_ms", metrics.get("load_ms", 0))
+    run_stats.increment(source_code, "browser_blocked_requests", metrics.get("blocked_requests", 0))
+
+
+def navigate(driver, url):
+    """
+    driver.get cadencé par l'ordonnanceur de politesse de l'hôte.
+    Le navigateur ne donne pas le statut HTTP : seul le temps de chargement règle le débit.
+    """
+    scheduler = get_scheduler()
+    scheduler.acquire(url)
+    start = time.monotonic()
+    try:
+        driver.get(url)
+    except WebDriverException:
+        scheduler.report(url, None, time.monotonic() - start)
+        raise
+    finally:
+        timings.add("navigate", time.monotonic() - start)
+    scheduler.report(url, 200, time.monotonic() - start)
+
+
+def load_page(driver, url, source_code, page_type):
+    """
+    Charge une URL, attend que la page soit prête et retourne son HTML.
+    Avec un driver supervisé, Chrome est relancé et la page rejouée s'il meurt en cours de route.
+    """
+    return run_supervised(driver, _load_page, url, source_code, page_type)
+
+
+def _load_page(driver, url, source_code, page_type):
+    if getattr(driver, "resource_filtering", False):
+        apply_source_rules(driver, source_code)
+
+    navigate(driver, url)
+    wait_for_page(driver, source_code, page_type)
+
+    if RESOURCE_BLOCKING_CONFIG["measure"]:
+        record_page_metrics(driver, source_code)
+    return driver.page_source
+
+
+# Navigation d'un onglet sans attendre son chargement (quelle que soit la page_load_strategy
+# de la session, locale ou prêtée par le service navigateur). Le marqueur posé sur l'ancien
+# document disparaît avec lui : une page n'est prête que dans le nouveau document.
+_START_NAVIGATION = "window.__tabLoading = true; window.location.href = arguments[0];"
+_READY_STATE = (
+    "return window.__tabLoading === true ? 'loading' "
+    ": (document.querySelector(arguments[0]) !== null ? 'ready' : 'waiting');"
+)
+
+
+def _tab_state(driver, selector):
+    """'loading' (ancien document), 'waiting' (conteneur absent) ou 'ready'."""
+    return driver.execute_script(_READY_STATE, selector)
+
+
+def _chrome_died(supervisor):
+    """Vrai si le driver supervisé ne répond plus (l'erreur concerne tout le navigateur)."""
+    return supervisor is not None and not supervisor.is_alive()
+
+
+def load_pages_in_tabs(driver, urls, source_code, page_type, tabs=None):
+    """
+    Charge plusieurs URLs en parallèle dans des onglets du même navigateur.
+
+    Chaque onglet libre reçoit l'URL suivante (cadencée par l'ordonnanceur de politesse) ;
+    la navigation passe par window.location et ne bloque pas. Les onglets sont ensuite
+    sondés tour à tour jusqu'à l'apparition du conteneur attendu ou l'expiration de
+    SELENIUM_CONFIG["tab_timeout"] (le HTML est alors pris tel quel).
+
+    Avec un driver supervisé, chaque onglet compte comme une page : Chrome est recyclé
+    entre deux pages une fois tous les onglets terminés, et relancé s'il meurt (les pages
+    en cours sont alors rechargées).
+
+    Générateur : (index, html, erreur, durée) dans l'ordre de fin de chargement ;
+    html vaut None et erreur est renseignée si le navigateur a échoué sur la page.
+    """
+    tabs = tabs or SELENIUM_CONFIG["tabs"]
+    selector = get_readiness_rule(source_code, page_type)["selector"]
+    scheduler = get_scheduler()
+    supervisor = driver if isinstance(driver, SupervisedDriver) else None
+    count = min(tabs, len(urls)) or 1
+
+    handles = open_tabs(driver, count)
+    free = list(handles)
+    busy = {}                  # handle -> (index, url, début)
+    pending = list(enumerate(urls))[::-1]
+    recycle_reason = None
+    checked_pages = None
+    restarts = 0
+
+    try:
+        while pending or busy:
+            finished = False
+            try:
+                # Recyclage demandé : on a attendu la fin des onglets en cours, Chrome est relancé
+                if recycle_reason is not None and not busy:
+                    close_tabs(driver, handles[0])
+                    supervisor.recycle(recycle_reason)
+                    recycle_reason = None
+                    handles = open_tabs(driver, count)
+                    free = list(handles)
+
+                # Lancement des pages dans les onglets libres
+                while free and pending:
+                    if supervisor is not None and recycle_reason is None and checked_pages != supervisor.pages:
+                        checked_pages = supervisor.pages
+                        recycle_reason = supervisor.recycle_reason()
+                    if recycle_reason is not None:
+                        break
+                    index, url = pending[-1]
+                    if scheduler.try_acquire(url):
+                        break
+                    pending.pop()
+                    handle = free.pop()
+                    start = time.monotonic()
+                    try:
+                        driver.switch_to.window(handle)
+                        if getattr(driver, "resource_filtering", False):
+                            apply_source_rules(driver, source_code)
+                        driver.execute_script(_START_NAVIGATION, url)
+                        count_page(driver)
+                        busy[handle] = (index, url, start)
+                    except WebDriverException as e:
+                        if _chrome_died(supervisor):
+                            pending.append((index, url))
+                            raise
+                        scheduler.report(url, None, time.monotonic() - start)
+                        free.append(handle)
+                        finished = True
+                        yield index, None, str(e), time.monotonic() - start
+
+                # Sondage des onglets en cours de chargement
+                for handle, (index, url, start) in list(busy.items()):
+                    elapsed = time.monotonic() - start
+                    try:
+                        driver.switch_to.window(handle)
+                        state = _tab_state(driver, selector)
+                        if state != "ready" and elapsed < SELENIUM_CONFIG["tab_timeout"]:
+                            continue
+                        if state == "loading":
+                            raise TimeoutException(f"page non chargée après {elapsed:.0f}s (onglet)")
+                        if state != "ready":
+                            print(f"   ⚠️ [{source_code.upper()}] '{selector}' absent après {elapsed:.0f}s (onglet)")
+                            driver.execute_script("window.stop();")
+                        html = driver.page_source
+                        if RESOURCE_BLOCKING_CONFIG["measure"]:
+                            record_page_metrics(driver, source_code)
+                        scheduler.report(url, 200, elapsed)
+                        result = (index, html, None, elapsed)
+                    except WebDriverException as e:
+                        if _chrome_died(supervisor):
+                            raise
+                        scheduler.report(url, None, elapsed)
+                        result = (index, None, str(e), elapsed)
+
+                    del busy[handle]
+                    free.append(handle)
+                    finished = True
+                    yield result
+            except WebDriverException as e:
+                # Chrome mort : relancé par le superviseur, les pages en cours sont remises en file
+                if supervisor is None or not supervisor.recover(e, restarts):
+                    raise
+                restarts += 1
+                for index, url, _ in sorted(busy.values(), reverse=True):
+                    pending.append((index, url))
+                busy = {}
+                recycle_reason = None
+                handles = open_tabs(driver, count)
+                free = list(handles)
+                continue
+
+            if not finished:
+                time.sleep(SELENIUM_CONFIG["ready_poll_frequency"])
+    finally:
+        try:
+            close_tabs(driver, handles[0])
+        except WebDriverException:
+            pass
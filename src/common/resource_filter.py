@@ -0,0 +1,61 @@
+"""
+Filtrage des ressources chargées par le navigateur (via le DevTools Protocol)
+et mesure du poids / temps de chargement de chaque page.
+"""
+import json
+
+from config.settings import RESOURCE_BLOCKING_CONFIG, SOURCES_CONFIG
+
+# Octets transférés et durée de chargement de la page courante (Resource Timing API)
+_PAGE_METRICS_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let bytes = nav ? nav.transferSize : 0;
+for (const r of resources) { bytes += r.transferSize || 0; }
+return {
+    transferred_bytes: bytes,
+    load_ms: nav ? Math.round(nav.domContentLoadedEventEnd) : 0,
+    resources: resources.length
+};
+"""
+
+
+def get_blocked_patterns(source_code=None):
+    """Motifs d'URL bloqués pour une source (liste globale + deny - allow de la source)."""
+    patterns = list(RESOURCE_BLOCKING_CONFIG["blocked_patterns"])
+
+    if source_code:
+        rules = SOURCES_CONFIG[source_code].get("resources", {})
+        patterns += [p for p in rules.get("deny", []) if p not in patterns]
+        patterns = [p for p in patterns if p not in rules.get("allow", [])]
+
+    return patterns
+
+
+def enable_resource_filtering(driver):
+    """Active l'interception réseau DevTools sur un driver Chrome fraîchement créé."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": get_blocked_patterns()})
+
+
+def apply_source_rules(driver, source_code):
+    """Applique les listes allow/deny d'une source avant de naviguer."""
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": get_blocked_patterns(source_code)})
+
+
+def count_blocked_requests(driver):
+    """Nombre de requêtes bloquées depuis la dernière lecture des logs de performance."""
+    blocked = 0
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message.get("method") == "Network.loadingFailed" and message["params"].get("blockedReason"):
+            blocked += 1
+    return blocked
+
+
+def collect_page_metrics(driver):
+    """Octets transférés, temps de chargement et nombre de ressources de la page courante."""
+    metrics = driver.execute_script(_PAGE_METRICS_JS) or {}
+    if getattr(driver, "resource_filtering", False):
+        metrics["blocked_requests"] = count_blocked_requests(driver)
+    return metrics
@@ -0,0 +1,33 @@
+"""
+Compteurs du run de scraping, par source (thread-safe).
+Alimentés par les couches de fetch et affichés dans le résumé de fin de run.
+"""
+import threading
+from collections import defaultdict
+
+_lock = threading.Lock()
+_counters = defaultdict(lambda: defaultdict(int))
+
+
+def increment(source_code, metric, value=1):
+    """Ajoute value au compteur metric de la source."""
+    with _lock:
+        _counters[source_code][metric] += value
+
+
+def get_stats(source_code):
+    """Retourne une copie des compteurs d'une source."""
+    with _lock:
+        return dict(_counters.get(source_code, {}))
+
+
+def snapshot():
+    """Retourne une copie de tous les compteurs {source: {metric: valeur}}."""
+    with _lock:
+        return {source: dict(metrics) for source, metrics in _counters.items()}
+
+
+def reset():
+    """Remet tous les compteurs à zéro (début de run)."""
+    with _lock:
+        _counters.clear()
@@ -0,0 +1,240 @@
+"""
+Chronométrage du scraping par phase, par source et par URL (thread-safe).
+
+Phases mesurées pour chaque page :
+- navigate : chargement (driver.get ou requête HTTP)
+- wait     : attente du conteneur attendu dans le navigateur
+- parse    : parsing du HTML (lxml)
+- extract  : recherche du conteneur et lecture du texte
+- clean    : reste de l'extracteur (nettoyage du texte, marqueurs)
+- attach   : téléchargement et extraction des pièces jointes PDF
+
+Les mesures d'une page sont accumulées dans un contexte propre au thread
+(`with page(source, url):`), puis ajoutées au run. En fin de run, le rapport
+(p50 / p95 / max par source et par phase) est écrit en JSON et au format texte
+Prometheus dans RUN_REPORT_CONFIG["directory"].
+"""
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from config.settings import RUN_REPORT_CONFIG
+from src.common import run_stats
+
+PHASES = ("navigate", "wait", "parse", "extract", "clean", "attach")
+
+_local = threading.local()
+_lock = threading.Lock()
+_records = []
+
+
+def _current():
+    return getattr(_local, "phases", None)
+
+
+def add(phase, seconds):
+    """Ajoute une durée à une phase de la page en cours (sans effet hors d'une page)."""
+    phases = _current()
+    if phases is not None:
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+
+@contextmanager
+def timed(phase):
+    """Chronomètre un bloc dans une phase de la page en cours."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add(phase, time.perf_counter() - start)
+
+
+@contextmanager
+def remainder(phase):
+    """Attribue à `phase` le temps du bloc non déjà compté dans une autre phase."""
+    phases = _current()
+    if phases is None:
+        yield
+        return
+    before = sum(phases.values())
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        counted = sum(phases.values()) - before
+        add(phase, max(0.0, time.perf_counter() - start - counted))
+
+
+@contextmanager
+def page(source_code, url, kind="article", fetched_in=0.0):
+    """
+    Contexte de mesure d'une page ; les pages imbriquées sont comptées dans la page englobante.
+    fetched_in : durée d'un téléchargement fait avant le contexte (passe asynchrone), comptée en navigate.
+    """
+    if _current() is not None:
+        yield
+        return
+
+    _local.phases = {"navigate": fetched_in} if fetched_in else {}
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record = {
+            "source": source_code,
+            "kind": kind,
+            "url": url,
+            "total": time.perf_counter() - start + fetched_in,
+            "phases": _local.phases,
+        }
+        _local.phases = None
+        with _lock:
+            _records.append(record)
+
+
+@contextmanager
+def collect():
+    """
+    Mesure les phases d'un bloc sans créer de page : le dict rempli est rendu à l'appelant
+    (étage de fetch ou processus d'extraction), qui l'enregistre ensuite avec record().
+    """
+    saved = _current()
+    _local.phases = {}
+    try:
+        yield _local.phases
+    finally:
+        _local.phases = saved
+
+
+def record(source_code, url, phases, total, kind="article"):
+    """Ajoute au run une page mesurée en plusieurs morceaux (collect)."""
+    with _lock:
+        _records.append({"source": source_code, "kind": kind, "url": url, "total": total, "phases": phases})
+
+
+def records():
+    """Copie des mesures du run, page par page."""
+    with _lock:
+        return list(_records)
+
+
+def reset():
+    """Efface les mesures (début de run)."""
+    with _lock:
+        _records.clear()
+
+
+def percentile(sorted_values, q):
+    """Percentile (rang le plus proche) d'une liste triée."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _distribution(values):
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "sum": sum(values),
+        "p50": percentile(values, 0.50),
+        "p95": percentile(values, 0.95),
+        "max": values[-1] if values else 0.0,
+    }
+
+
+def summarize(run_records=None):
+    """{source: {phase|"total": {count, sum, p50, p95, max}}} en secondes, pages d'articles et de listes."""
+    run_records = records() if run_records is None else run_records
+    by_source = {}
+    for record in run_records:
+        source = by_source.setdefault(record["source"], {"total": []})
+        source["total"].append(record["total"])
+        for phase, seconds in record["phases"].items():
+            source.setdefault(phase, []).append(seconds)
+
+    return {
+        source: {phase: _distribution(values) for phase, values in phases.items()}
+        for source, phases in by_source.items()
+    }
+
+
+def dominant_phase(source_summary):
+    """Phase qui pèse le plus dans le temps total d'une source (ou None)."""
+    phases = {phase: stats["sum"] for phase, stats in source_summary.items() if phase != "total"}
+    return max(phases, key=phases.get) if phases else None
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def to_prometheus(summary, counters):
+    """Rapport au format texte d'exposition Prometheus."""
+    series = [
+        (f'source="{_label(source)}",phase="{_label(phase)}"', stats)
+        for source, phases in sorted(summary.items()) for phase, stats in sorted(phases.items())
+    ]
+
+    lines = [
+        "# HELP scrape_phase_seconds Durée des phases de scraping par page",
+        "# TYPE scrape_phase_seconds summary",
+    ]
+    for labels, stats in series:
+        lines.append(f'scrape_phase_seconds{{{labels},quantile="0.5"}} {stats["p50"]:.6f}')
+        lines.append(f'scrape_phase_seconds{{{labels},quantile="0.95"}} {stats["p95"]:.6f}')
+        lines.append(f"scrape_phase_seconds_sum{{{labels}}} {stats['sum']:.6f}")
+        lines.append(f"scrape_phase_seconds_count{{{labels}}} {stats['count']}")
+
+    lines += [
+        "# HELP scrape_phase_max_seconds Durée maximale d'une phase sur une page",
+        "# TYPE scrape_phase_max_seconds gauge",
+    ]
+    for labels, stats in series:
+        lines.append(f"scrape_phase_max_seconds{{{labels}}} {stats['max']:.6f}")
+
+    lines += [
+        "# HELP scrape_run_counter Compteurs du run de scraping par source",
+        "# TYPE scrape_run_counter gauge",
+    ]
+    for source, metrics in sorted(counters.items()):
+        for metric, value in sorted(metrics.items()):
+            lines.append(f'scrape_run_counter{{source="{_label(source)}",metric="{_label(metric)}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def write_report(directory=None, started_at=None):
+    """
+    Écrit le rapport du run (run_<date>.json et run_<date>.prom) et retourne le chemin du JSON.
+    Retourne None si aucune page n'a été mesurée ou si le rapport est désactivé.
+    """
+    if not RUN_REPORT_CONFIG["enabled"]:
+        return None
+    run_records = records()
+    if not run_records:
+        return None
+
+    directory = str(directory or RUN_REPORT_CONFIG["directory"])
+    os.makedirs(directory, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    summary = summarize(run_records)
+    counters = run_stats.snapshot()
+
+    report = {
+        "started_at": started_at,
+        "finished_at": time.time(),
+        "summary": summary,
+        "dominant_phase": {source: dominant_phase(phases) for source, phases in summary.items()},
+        "counters": counters,
+        "pages": run_records if RUN_REPORT_CONFIG["per_url"] else [],
+    }
+
+    json_path = os.path.join(directory, f"run_{stamp}.json")
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    with open(os.path.join(directory, f"run_{stamp}.prom"), 'w', encoding='utf-8') as f:
+        f.write(to_prometheus(summary, counters))
+    return json_path
@@ -1,4 +1,6 @@
 """Database package"""
-from .manager import insert_article, get_articles_count, get_articles_by_source
+from .manager import insert_article, bulk_upsert_articles, print_batch, get_articles_count, get_articles_by_source
+from .known_urls import KnownUrlIndex
 
-__all__ = ['insert_article', 'get_articles_count', 'get_articles_by_source']
\ No newline at end of file
+__all__ = ['insert_article', 'bulk_upsert_articles', 'print_batch', 'get_articles_count', 'get_articles_by_source',
+           'KnownUrlIndex']
\ No newline at end of file
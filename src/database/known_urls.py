@@ -0,0 +1,78 @@
+"""
+Index des URLs déjà ingérées, pour éviter de re-scraper des articles connus.
+
+L'index est chargé une seule fois depuis la table `articles`, puis gardé en
+mémoire sous forme d'empreintes de 8 octets (compact, ~16 octets par URL).
+Une copie est écrite sur disque et sert de secours si MySQL est injoignable.
+"""
+import hashlib
+import os
+
+from sqlalchemy import text
+from config.database import get_engine
+from config.settings import KNOWN_URLS_PATH
+
+DIGEST_SIZE = 8
+
+
+def url_digest(url):
+    """Empreinte compacte (8 octets) d'une URL."""
+    return hashlib.blake2b(url.strip().encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+
+class KnownUrlIndex:
+    """Ensemble d'empreintes d'URLs déjà présentes en base."""
+
+    def __init__(self, urls=()):
+        self._digests = {url_digest(url) for url in urls if url}
+
+    def __contains__(self, url):
+        return url_digest(url) in self._digests
+
+    def __len__(self):
+        return len(self._digests)
+
+    def add(self, url):
+        self._digests.add(url_digest(url))
+
+    def filter_new(self, items):
+        """Retourne (items dont l'URL est inconnue, nombre d'items ignorés)."""
+        new_items = [item for item in items if item['url'] not in self]
+        return new_items, len(items) - len(new_items)
+
+    def save(self, path=KNOWN_URLS_PATH):
+        """Écrit les empreintes sur disque (fichier binaire, 8 octets par URL)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(b"".join(sorted(self._digests)))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_file(cls, path=KNOWN_URLS_PATH):
+        """Recharge un index depuis sa copie disque (vide si absente)."""
+        index = cls()
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+            index._digests = {data[i:i + DIGEST_SIZE] for i in range(0, len(data), DIGEST_SIZE)}
+        return index
+
+    @classmethod
+    def load(cls, path=KNOWN_URLS_PATH):
+        """
+        Charge l'index depuis la table articles (et rafraîchit la copie disque).
+        Si la base est injoignable, utilise la dernière copie disque.
+        """
+        try:
+            engine = get_engine()
+            with engine.connect() as conn:
+                result = conn.execute(text("SELECT url FROM articles"))
+                index = cls(row[0] for row in result)
+            index.save(path)
+            print(f"   📚 {len(index)} URLs connues chargées depuis la base")
+            return index
+        except Exception as e:
+            index = cls.from_file(path)
+            print(f"   ⚠️  Base injoignable ({e}), {len(index)} URLs connues lues depuis {path}")
+            return index
@@ -1,11 +1,33 @@
 """
 Database Manager - Gestion des opérations de base de données
 """
-from sqlalchemy import text
+import hashlib
+from itertools import count, islice
+
+from sqlalchemy import bindparam, text
 from sqlalchemy.exc import IntegrityError
 from config.database import get_engine
+from config.settings import INGESTION_CONFIG
 from datetime import datetime
 
+# Un article existant n'est mis à jour que si ses valeurs changent ; un titre ou un contenu
+# vides, ou une date absente, n'écrasent pas ceux déjà en base
+_UPSERT_QUERY = text("""
+                     INSERT INTO articles (source, title, url, date_published, content, language)
+                     VALUES (:source, :title, :url, :date_published, :content, :language)
+                     ON DUPLICATE KEY UPDATE
+                         title = IF(VALUES(title) != '', VALUES(title), title),
+                         date_published = COALESCE(VALUES(date_published), date_published),
+                         content = IF(VALUES(content) != '', VALUES(content), content),
+                         language = VALUES(language)
+                     """)
+
+_EXISTING_QUERY = text("""
+                       SELECT url, title, date_published, language, MD5(content)
+                       FROM articles
+                       WHERE url IN :urls
+                       """).bindparams(bindparam("urls", expanding=True))
+
 
 def clean_date(date_str):
     """
@@ -66,6 +88,128 @@ def insert_article(article_data, source_code, language):
         return False
 
 
+def _article_row(article_data, source_code, language, date_parser):
+    """Paramètres d'insertion d'un article (mêmes valeurs par défaut que insert_article)."""
+    return {
+        "source": source_code.upper(),
+        "title": article_data.get("title", "Sans titre"),
+        "url": article_data.get("url", ""),
+        "date_published": date_parser(article_data.get("date", "")),
+        "content": article_data.get("content", "") or "",
+        "language": language
+    }
+
+
+def _is_unchanged(row, existing):
+    """True si l'upsert de row ne modifierait pas la ligne existante (url, title, date, language, md5)."""
+    _, title, date_published, language, content_md5 = existing
+    old_date = date_published.strftime("%Y-%m-%d") if date_published else None
+    new_date = row["date_published"] or old_date
+    new_md5 = hashlib.md5(row["content"].encode("utf-8")).hexdigest() if row["content"] else content_md5
+    return (
+        (row["title"] or title) == title
+        and new_date == old_date
+        and row["language"] == language
+        and new_md5 == content_md5
+    )
+
+
+def _upsert_batch(conn, rows):
+    """Écrit un lot d'articles. Retourne {inserted, updated, skipped}."""
+    counts = {"inserted": 0, "updated": 0, "skipped": 0}
+
+    # Une URL présente plusieurs fois dans le lot : la dernière version l'emporte
+    by_url = {}
+    for row in rows:
+        if not row["url"]:
+            counts["skipped"] += 1
+            continue
+        if row["url"] in by_url:
+            counts["skipped"] += 1
+        by_url[row["url"]] = row
+
+    if not by_url:
+        return counts
+
+    existing = {record[0]: record for record in conn.execute(_EXISTING_QUERY, {"urls": list(by_url)})}
+    to_write = []
+    for url, row in by_url.items():
+        if url not in existing:
+            counts["inserted"] += 1
+        elif _is_unchanged(row, existing[url]):
+            counts["skipped"] += 1
+            continue
+        else:
+            counts["updated"] += 1
+        to_write.append(row)
+
+    if to_write:
+        conn.execute(_UPSERT_QUERY, to_write)
+    conn.commit()
+    return counts
+
+
+def _upsert_rows_one_by_one(conn, rows):
+    """
+    Reprise d'un lot en échec, un article par transaction : seuls les articles
+    réellement en erreur (valeur trop longue, encodage...) sont perdus.
+    """
+    counts = {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
+    for row in rows:
+        try:
+            for key, value in _upsert_batch(conn, [row]).items():
+                counts[key] += value
+        except Exception as e:
+            conn.rollback()
+            counts["errors"] += 1
+            print(f"❌ Erreur DB ({row['url']}) : {e}")
+    return counts
+
+
+def bulk_upsert_articles(articles, source_code, language, batch_size=None, date_parser=clean_date, on_batch=None):
+    """
+    Insère ou met à jour des articles par lots : pour chaque lot, une lecture des URLs
+    déjà en base, un INSERT ... ON DUPLICATE KEY UPDATE en executemany et un commit.
+    articles : itérable quelconque (liste, flux JSONL), consommé lot par lot.
+    on_batch(numéro, nombre d'articles, compteurs) est appelé après chaque lot.
+    Retourne les totaux {inserted, updated, skipped, errors}.
+    """
+    batch_size = batch_size or INGESTION_CONFIG["batch_size"]
+    totals = {"inserted": 0, "updated": 0, "skipped": 0, "errors": 0}
+    articles = iter(articles)
+
+    engine = get_engine()
+    with engine.connect() as conn:
+        for number in count(1):
+            batch = list(islice(articles, batch_size))
+            if not batch:
+                break
+
+            rows = [_article_row(a, source_code, language, date_parser) for a in batch]
+            try:
+                counts = _upsert_batch(conn, rows)
+                counts["errors"] = 0
+            except Exception as e:
+                conn.rollback()
+                print(f"❌ Erreur DB (lot {number}) : {e} — reprise article par article")
+                counts = _upsert_rows_one_by_one(conn, rows)
+
+            for key, value in counts.items():
+                totals[key] += value
+            if on_batch:
+                on_batch(number, len(batch), counts)
+    return totals
+
+
+def print_batch(number, size, counts):
+    """Affiche les compteurs d'un lot écrit en base (on_batch de bulk_upsert_articles)."""
+    line = (f"      [lot {number}] {size} articles : ✅ {counts['inserted']} insérés | "
+            f"🔁 {counts['updated']} mis à jour | ⏭️  {counts['skipped']} ignorés")
+    if counts["errors"]:
+        line += f" | ❌ {counts['errors']} en erreur"
+    print(line)
+
+
 def get_articles_count():
     """Retourne le nombre total d'articles en base."""
     engine = get_engine()
@@ -0,0 +1,5 @@
+"""Jobs package (file de tâches de scraping partagée)"""
+from .task_queue import TaskQueue, Task, default_batch
+from .worker import QueueWorker, make_worker_id
+
+__all__ = ['TaskQueue', 'Task', 'default_batch', 'QueueWorker', 'make_worker_id']
@@ -0,0 +1,298 @@
+"""
+File de tâches de scraping durable, partagée par plusieurs workers (processus ou machines).
+
+Table `scrape_tasks` dans MySQL (base existante) ou dans un fichier SQLite (run local) :
+- tâches "list" (liste d'une source) et "article" (contenu d'une URL), regroupées par lot
+- mise en file idempotente : une tâche est identifiée par (type, source, URL, lot)
+- bail : un worker réserve une tâche pour JOB_QUEUE_CONFIG["lease_s"] secondes et le
+  prolonge par heartbeat ; un bail expiré (worker planté) rend la tâche à la file
+- échecs : nouvelle tentative après retry_delay_s, abandon après max_attempts
+- terminaison idempotente : seul le détenteur du bail courant peut terminer une tâche,
+  une seconde terminaison est ignorée
+
+La réservation est une mise à jour conditionnelle (UPDATE ... WHERE status / bail) :
+elle est atomique sur les deux bases, sans verrou applicatif.
+"""
+import hashlib
+import json
+import time
+from datetime import date
+
+from sqlalchemy import create_engine, event, text
+from config.database import get_engine
+from config.settings import JOB_QUEUE_CONFIG
+
+_SQLITE_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS scrape_tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task_key CHAR(40) NOT NULL UNIQUE,
+        batch VARCHAR(32) NOT NULL,
+        kind VARCHAR(16) NOT NULL,
+        source VARCHAR(16) NOT NULL,
+        url TEXT NOT NULL,
+        payload TEXT,
+        status VARCHAR(16) NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        lease_owner VARCHAR(128),
+        lease_until DOUBLE,
+        result TEXT,
+        error TEXT,
+        created_at DOUBLE NOT NULL,
+        updated_at DOUBLE NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_scrape_tasks_claim ON scrape_tasks (status, lease_until)",
+    "CREATE INDEX IF NOT EXISTS idx_scrape_tasks_source ON scrape_tasks (source, batch, kind)",
+]
+
+_MYSQL_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS scrape_tasks (
+        id BIGINT AUTO_INCREMENT PRIMARY KEY,
+        task_key CHAR(40) NOT NULL UNIQUE,
+        batch VARCHAR(32) NOT NULL,
+        kind VARCHAR(16) NOT NULL,
+        source VARCHAR(16) NOT NULL,
+        url VARCHAR(1024) NOT NULL,
+        payload MEDIUMTEXT,
+        status VARCHAR(16) NOT NULL DEFAULT 'pending',
+        attempts INT NOT NULL DEFAULT 0,
+        lease_owner VARCHAR(128),
+        lease_until DOUBLE,
+        result MEDIUMTEXT,
+        error TEXT,
+        created_at DOUBLE NOT NULL,
+        updated_at DOUBLE NOT NULL,
+        INDEX idx_scrape_tasks_claim (status, lease_until),
+        INDEX idx_scrape_tasks_source (source, batch, kind)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+]
+
+# Tâche réservable : en attente (après son délai de nouvelle tentative) ou bail expiré
+_CLAIMABLE = "status IN ('pending', 'leased') AND (lease_until IS NULL OR lease_until < :now)"
+# Garde des opérations d'un worker : il détient toujours le bail de cette tentative
+_HELD = "id = :id AND status = 'leased' AND lease_owner = :owner AND attempts = :attempts"
+
+
+def task_key(kind, source_code, url, batch):
+    """Identifiant idempotent d'une tâche."""
+    return hashlib.sha1(f"{kind}|{source_code}|{url}|{batch}".encode("utf-8")).hexdigest()
+
+
+def default_batch():
+    """Lot par défaut : le jour du run."""
+    return date.today().isoformat()
+
+
+class Task:
+    """Tâche réservée par un worker (identifiée par son id et sa tentative)."""
+
+    def __init__(self, row, owner):
+        self.id = row.id
+        self.batch = row.batch
+        self.kind = row.kind
+        self.source_code = row.source
+        self.url = row.url
+        self.payload = json.loads(row.payload) if row.payload else {}
+        self.attempts = row.attempts
+        self.owner = owner
+
+    def _held(self):
+        return {"id": self.id, "owner": self.owner, "attempts": self.attempts}
+
+
+class TaskQueue:
+    """File de tâches de scraping (MySQL ou SQLite)."""
+
+    def __init__(self, backend=None, engine=None, config=None):
+        self.config = config or JOB_QUEUE_CONFIG
+        self.backend = backend or self.config["backend"]
+        self.engine = engine or self._create_engine()
+        self._insert = "INSERT IGNORE" if self.backend == "mysql" else "INSERT OR IGNORE"
+        with self.engine.begin() as conn:
+            for statement in (_MYSQL_SCHEMA if self.backend == "mysql" else _SQLITE_SCHEMA):
+                conn.execute(text(statement))
+
+    def _create_engine(self):
+        if self.backend == "mysql":
+            return get_engine()
+
+        path = self.config["sqlite_path"]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        engine = create_engine(f"sqlite:///{path}", connect_args={"timeout": 30})
+
+        @event.listens_for(engine, "connect")
+        def _wal(dbapi_conn, _):
+            # Lecteurs et écrivain simultanés (plusieurs processus workers)
+            dbapi_conn.execute("PRAGMA journal_mode=WAL")
+
+        return engine
+
+    # --- Mise en file -------------------------------------------------------
+
+    def _enqueue(self, conn, kind, source_code, url, payload, batch):
+        now = time.time()
+        result = conn.execute(
+            text(
+                f"{self._insert} INTO scrape_tasks "
+                "(task_key, batch, kind, source, url, payload, status, attempts, created_at, updated_at) "
+                "VALUES (:key, :batch, :kind, :source, :url, :payload, 'pending', 0, :now, :now)"
+            ),
+            {
+                "key": task_key(kind, source_code, url, batch), "batch": batch, "kind": kind,
+                "source": source_code, "url": url, "payload": json.dumps(payload, ensure_ascii=False), "now": now
+            }
+        )
+        return result.rowcount
+
+    def enqueue(self, kind, source_code, url, payload=None, batch=None):
+        """Ajoute une tâche (ignorée si elle existe déjà dans le lot). Retourne 1 si ajoutée, 0 sinon."""
+        with self.engine.begin() as conn:
+            return self._enqueue(conn, kind, source_code, url, payload or {}, batch or default_batch())
+
+    # --- Réservation et bail ------------------------------------------------
+
+    def claim(self, owner):
+        """
+        Réserve la prochaine tâche disponible (listes d'abord, puis ordre d'arrivée).
+        Retourne une Task, ou None si aucune tâche n'est disponible.
+        """
+        now = time.time()
+        with self.engine.begin() as conn:
+            # Baux expirés sans tentative restante : abandon
+            conn.execute(
+                text(
+                    "UPDATE scrape_tasks SET status = 'failed', error = COALESCE(error, 'Bail expiré'), "
+                    "lease_owner = NULL, updated_at = :now "
+                    "WHERE status = 'leased' AND lease_until < :now AND attempts >= :max_attempts"
+                ),
+                {"now": now, "max_attempts": self.config["max_attempts"]}
+            )
+            candidates = conn.execute(
+                text(
+                    f"SELECT id FROM scrape_tasks WHERE {_CLAIMABLE} AND attempts < :max_attempts "
+                    "ORDER BY CASE kind WHEN 'list' THEN 0 ELSE 1 END, id LIMIT 10"
+                ),
+                {"now": now, "max_attempts": self.config["max_attempts"]}
+            ).fetchall()
+
+        # Un autre worker peut prendre le même candidat : seule la mise à jour conditionnelle fait foi
+        for (task_id,) in candidates:
+            with self.engine.begin() as conn:
+                claimed = conn.execute(
+                    text(
+                        "UPDATE scrape_tasks SET status = 'leased', lease_owner = :owner, "
+                        "lease_until = :until, attempts = attempts + 1, updated_at = :now "
+                        f"WHERE id = :id AND {_CLAIMABLE}"
+                    ),
+                    {"id": task_id, "owner": owner, "until": now + self.config["lease_s"], "now": now}
+                ).rowcount
+                if claimed:
+                    row = conn.execute(text("SELECT * FROM scrape_tasks WHERE id = :id"), {"id": task_id}).fetchone()
+                    return Task(row, owner)
+        return None
+
+    def heartbeat(self, task):
+        """Prolonge le bail d'une tâche. Retourne False si le bail a été perdu."""
+        now = time.time()
+        with self.engine.begin() as conn:
+            return conn.execute(
+                text(f"UPDATE scrape_tasks SET lease_until = :until, updated_at = :now WHERE {_HELD}"),
+                {**task._held(), "until": now + self.config["lease_s"], "now": now}
+            ).rowcount == 1
+
+    # --- Fin de tâche -------------------------------------------------------
+
+    def complete(self, task, result=None, children=()):
+        """
+        Termine une tâche et met en file ses tâches filles [(kind, source, url, payload)]
+        dans la même transaction. Retourne False si la tâche n'est plus détenue par ce
+        worker (bail perdu ou déjà terminée) : rien n'est alors écrit.
+        """
+        now = time.time()
+        with self.engine.begin() as conn:
+            done = conn.execute(
+                text(
+                    "UPDATE scrape_tasks SET status = 'done', result = :result, error = NULL, "
+                    f"lease_owner = NULL, lease_until = NULL, updated_at = :now WHERE {_HELD}"
+                ),
+                {
+                    **task._held(), "now": now,
+                    "result": json.dumps(result, ensure_ascii=False) if result is not None else None
+                }
+            ).rowcount
+            if not done:
+                return False
+            for kind, source_code, url, payload in children:
+                self._enqueue(conn, kind, source_code, url, payload, task.batch)
+        return True
+
+    def fail(self, task, error):
+        """
+        Signale l'échec d'une tentative : la tâche repart en file après retry_delay_s,
+        ou passe en échec définitif après max_attempts. Retourne False si le bail était perdu.
+        """
+        now = time.time()
+        with self.engine.begin() as conn:
+            return conn.execute(
+                text(
+                    "UPDATE scrape_tasks SET "
+                    "status = CASE WHEN attempts >= :max_attempts THEN 'failed' ELSE 'pending' END, "
+                    "error = :error, lease_owner = NULL, lease_until = :retry_at, updated_at = :now "
+                    f"WHERE {_HELD}"
+                ),
+                {
+                    **task._held(), "error": str(error)[:2000], "now": now,
+                    "retry_at": now + self.config["retry_delay_s"], "max_attempts": self.config["max_attempts"]
+                }
+            ).rowcount == 1
+
+    # --- Suivi --------------------------------------------------------------
+
+    def is_drained(self):
+        """Vrai si plus aucune tâche n'est en attente ni en cours."""
+        with self.engine.connect() as conn:
+            return conn.execute(
+                text("SELECT COUNT(*) FROM scrape_tasks WHERE status IN ('pending', 'leased')")
+            ).scalar() == 0
+
+    def status_counts(self, batch=None):
+        """Nombre de tâches par (source, type, statut) : {(source, kind, status): n}."""
+        query = "SELECT source, kind, status, COUNT(*) FROM scrape_tasks"
+        params = {}
+        if batch:
+            query += " WHERE batch = :batch"
+            params["batch"] = batch
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(query + " GROUP BY source, kind, status"), params).fetchall()
+        return {(source, kind, status): count for source, kind, status, count in rows}
+
+    def latest_batch(self, source_code):
+        """Dernier lot mis en file pour une source, ou None."""
+        with self.engine.connect() as conn:
+            return conn.execute(
+                text("SELECT MAX(batch) FROM scrape_tasks WHERE source = :source"), {"source": source_code}
+            ).scalar()
+
+    def iter_articles(self, source_code, batch):
+        """
+        Articles terminés (ou abandonnés) d'un lot, dans l'ordre de la liste :
+        les articles en échec définitif sont rendus avec leur erreur, comme dans results.json.
+        """
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    "SELECT payload, status, result, error FROM scrape_tasks "
+                    "WHERE source = :source AND batch = :batch AND kind = 'article' "
+                    "AND status IN ('done', 'failed') ORDER BY id"
+                ),
+                {"source": source_code, "batch": batch}
+            ).fetchall()
+
+        for payload, status, result, error in rows:
+            if status == "done":
+                yield json.loads(result)
+            else:
+                yield {**json.loads(payload)["item"], "content": "", "error": error}
@@ -0,0 +1,125 @@
+"""
+Worker de la file de tâches : réserve une tâche, la traite, la termine.
+
+- tâche "list" : récupère la liste de la source et met ses articles en file
+  (dans la même transaction que la fin de la tâche)
+- tâche "article" : récupère et extrait le contenu, stocké comme résultat de la tâche
+
+Pendant le traitement, un thread prolonge le bail (heartbeat). Un worker planté
+cesse de le prolonger : sa tâche est reprise par un autre worker à l'expiration.
+Plusieurs workers (threads, processus ou machines) peuvent vider la même file.
+"""
+import os
+import socket
+import threading
+import time
+from datetime import date
+
+from config.settings import JOB_QUEUE_CONFIG
+from src.scrapers.pipeline import fetch_articles_list, scrape_article
+from src.scrapers.worker_pool import default_driver_factory
+
+
+def make_worker_id(index=1):
+    """Identifiant unique d'un worker : machine, processus, numéro."""
+    return f"{socket.gethostname()}-{os.getpid()}-{index}"
+
+
+class _Heartbeat:
+    """Prolonge le bail d'une tâche tant qu'elle est en cours de traitement."""
+
+    def __init__(self, task_queue, task):
+        self.task_queue = task_queue
+        self.task = task
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{task.id}", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(JOB_QUEUE_CONFIG["heartbeat_s"]):
+            try:
+                if not self.task_queue.heartbeat(self.task):
+                    self.lost = True
+                    return
+            except Exception as e:
+                print(f"   ⚠️ Heartbeat de la tâche {self.task.id} en échec ({e})")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+class QueueWorker:
+    """Vide la file de tâches avec un driver (créé à la demande)."""
+
+    def __init__(self, task_queue, worker_id=None, driver_factory=default_driver_factory, known_urls=None):
+        self.task_queue = task_queue
+        self.worker_id = worker_id or make_worker_id()
+        self.driver_factory = driver_factory
+        self.known_urls = known_urls
+        self.processed = 0
+
+    def run(self, wait_for_others=True):
+        """
+        Traite les tâches jusqu'à ce que la file soit vide.
+        wait_for_others : tant que des tâches sont en cours chez d'autres workers (elles peuvent
+        produire des articles, ou être reprises si leur worker plante), on attend au lieu de s'arrêter.
+        """
+        driver = self.driver_factory()
+        try:
+            while True:
+                task = self.task_queue.claim(self.worker_id)
+                if task is None:
+                    if not wait_for_others or self.task_queue.is_drained():
+                        break
+                    time.sleep(JOB_QUEUE_CONFIG["poll_s"])
+                    continue
+
+                self._process(driver, task)
+                self.processed += 1
+        finally:
+            driver.quit()
+        return self.processed
+
+    def _process(self, driver, task):
+        """Traite une tâche sous heartbeat puis la termine (ou la signale en échec)."""
+        if task.attempts > 1:
+            print(f"   ♻️  [{self.worker_id}] Tâche {task.id} : tentative {task.attempts}")
+
+        with _Heartbeat(self.task_queue, task) as heartbeat:
+            try:
+                if task.kind == "list":
+                    completed = self._process_list(driver, task)
+                else:
+                    completed = self._process_article(driver, task)
+            except Exception as e:
+                completed = self.task_queue.fail(task, f"{type(e).__name__}: {e}")
+
+        if heartbeat.lost or not completed:
+            print(f"   ⚠️ [{self.worker_id}] Tâche {task.id} : bail perdu, résultat ignoré")
+
+    def _process_list(self, driver, task):
+        """Liste d'une source : met en file une tâche par article."""
+        backfill = task.payload.get("backfill")
+        if backfill and backfill.get("since"):
+            backfill = {**backfill, "since": date.fromisoformat(backfill["since"])}
+
+        items = fetch_articles_list(task.source_code, driver, self.known_urls, backfill)
+        children = [
+            ("article", task.source_code, item['url'], {"item": item, "position": i, "total": len(items)})
+            for i, item in enumerate(items, 1)
+        ]
+        print(f"   📥 [{task.source_code.upper()}] {len(children)} articles mis en file")
+        return self.task_queue.complete(task, children=children)
+
+    def _process_article(self, driver, task):
+        """Contenu d'un article : résultat de la tâche, ou échec (nouvelle tentative plus tard)."""
+        payload = task.payload
+        article = scrape_article(task.source_code, driver, payload["item"], payload["position"], payload["total"])
+        if "error" in article:
+            return self.task_queue.fail(task, article["error"])
+        return self.task_queue.complete(task, result=article)
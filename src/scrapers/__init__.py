@@ -1 +1,17 @@
-# Auto-generated __init__.py
+"""Scrapers package"""
+from .registry import SCRAPER_FUNCTIONS
+from .pipeline import (
+    get_results_path, save_results, fetch_articles_list, open_source_run, finish_source_run,
+    scrape_article, scrape_articles_async, scrape_articles_tabs, print_run_summary, save_run_report
+)
+from .parse_pool import scrape_articles_staged, shutdown_parse_pool
+from .backfill import backfill_articles_list
+from .worker_pool import ScrapeWorkerPool
+
+__all__ = [
+    'SCRAPER_FUNCTIONS', 'get_results_path', 'save_results',
+    'fetch_articles_list', 'open_source_run', 'finish_source_run', 'scrape_article', 'scrape_articles_async',
+    'scrape_articles_tabs',
+    'print_run_summary', 'save_run_report', 'scrape_articles_staged', 'shutdown_parse_pool',
+    'backfill_articles_list', 'ScrapeWorkerPool'
+]
@@ -0,0 +1,225 @@
+"""
+Pièces jointes PDF des articles (ESMA, CBI : le texte réglementaire est souvent
+dans les documents liés plutôt que dans la page).
+
+- les liens vers des PDF sont repérés dans le corps de l'article (zones par source,
+  ATTACHMENTS_CONFIG["scopes"]), pas dans l'en-tête ni le pied de page du site
+- chaque document est téléchargé en flux vers le disque (data/attachments/),
+  abandonné au-delà de ATTACHMENTS_CONFIG["max_bytes"]
+- le texte est extrait par tranches de pages dans un pool de processus : un
+  processus n'ouvre qu'une tranche à la fois, le PDF n'est jamais chargé en entier
+- le texte de chaque document est gardé sur disque à côté du PDF (pas de
+  ré-extraction au run suivant) et ajouté au contenu de l'article pour le chunking
+"""
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin, urlparse
+
+from pypdf import PdfReader
+from config.settings import ATTACHMENTS_CONFIG
+from src.common import run_stats, timings
+from src.common.extraction import parse_html, get_text
+from src.common.http_client import polite_request
+
+_CHUNK_SIZE = 64 * 1024
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class AttachmentTooLarge(Exception):
+    """Document au-delà de la taille maximale autorisée."""
+
+
+def is_enabled(source_code):
+    return ATTACHMENTS_CONFIG["enabled"] and source_code in ATTACHMENTS_CONFIG["sources"]
+
+
+def _link_scopes(source_code, root):
+    """Éléments de la page où chercher les PDF : ceux du premier XPath de la source qui trouve quelque chose."""
+    for xpath in ATTACHMENTS_CONFIG["scopes"].get(source_code, []):
+        scopes = root.xpath(xpath)
+        if scopes:
+            return scopes
+    return []
+
+
+def find_attachment_links(source_code, html, url):
+    """
+    Liens PDF du corps d'un article (ATTACHMENTS_CONFIG["scopes"]) : [{url, title}], sans
+    doublons, dans l'ordre de la page. Les liens hors de ces zones (en-tête, pied de page,
+    colonnes : rapport annuel, politique de confidentialité...) sont ignorés.
+    """
+    root = parse_html(html)
+    if root is None:
+        return []
+
+    links, seen = [], set()
+    for scope in _link_scopes(source_code, root):
+        for anchor in scope.iter("a"):
+            href = (anchor.get("href") or "").strip()
+            if not href:
+                continue
+            target = urljoin(url, href).split("#")[0]
+            if not urlparse(target).path.lower().endswith(".pdf") or target in seen:
+                continue
+            seen.add(target)
+            title = get_text(anchor, separator=" ", strip=True) or target.rsplit("/", 1)[-1]
+            links.append({"url": target, "title": title})
+            if len(links) >= ATTACHMENTS_CONFIG["max_per_article"]:
+                return links
+    return links
+
+
+def _megabytes(size):
+    return f"{size / 1024 / 1024:.1f} Mo"
+
+
+def _local_path(url, suffix):
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(str(ATTACHMENTS_CONFIG["directory"]), digest[:2], f"{digest}{suffix}")
+
+
+def download_attachment(url, offline=False):
+    """
+    Télécharge un document en flux vers le disque et retourne son chemin
+    (le fichier déjà téléchargé lors d'un run précédent est réutilisé).
+    Lève AttachmentTooLarge au-delà de max_bytes (le fichier partiel est supprimé).
+    offline : sans réseau, seul un fichier déjà téléchargé est accepté (FileNotFoundError sinon).
+    """
+    path = _local_path(url, ".pdf")
+    if os.path.exists(path):
+        return path
+    if offline:
+        raise FileNotFoundError("document jamais téléchargé (ré-extraction hors ligne)")
+
+    max_bytes = ATTACHMENTS_CONFIG["max_bytes"]
+    response = polite_request("GET", url, stream=True, timeout=ATTACHMENTS_CONFIG["timeout"])
+    try:
+        response.raise_for_status()
+        if int(response.headers.get("Content-Length") or 0) > max_bytes:
+            raise AttachmentTooLarge(f"{_megabytes(int(response.headers['Content-Length']))} annoncés")
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.part"
+        size = 0
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise AttachmentTooLarge(f"plus de {_megabytes(max_bytes)}")
+                    f.write(chunk)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    finally:
+        response.close()
+    return path
+
+
+def _extract_pages(path, start, stop):
+    """Texte des pages [start, stop) d'un PDF (exécuté dans un processus du pool)."""
+    reader = PdfReader(path)
+    texts = []
+    for index in range(start, min(stop, len(reader.pages))):
+        text = (reader.pages[index].extract_text() or "").strip()
+        if text:
+            texts.append(text)
+    return "\n\n".join(texts)
+
+
+def get_attachment_pool():
+    """Pool de processus d'extraction des PDF (créé au premier document)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = ATTACHMENTS_CONFIG["workers"] or os.cpu_count() or 1
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def shutdown_attachment_pool():
+    """Arrête le pool d'extraction des PDF (fin de run)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+def extract_attachment_text(path, in_process=False):
+    """
+    Texte d'un PDF, extrait par tranches de pages en parallèle et écrit sur disque
+    au fil de l'eau (chemin .txt à côté du PDF). Retourne (texte, nombre de pages).
+    in_process : extraction dans le processus courant, sans le pool (appel depuis un
+    processus worker, ex. run_reextract.py).
+    """
+    text_path = path[:-len(".pdf")] + ".txt"
+    pages = min(len(PdfReader(path).pages), ATTACHMENTS_CONFIG["max_pages"])
+
+    if not os.path.exists(text_path) and in_process:
+        tmp_path = f"{text_path}.part"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(_extract_pages(path, 0, pages))
+        os.replace(tmp_path, text_path)
+    elif not os.path.exists(text_path):
+        step = ATTACHMENTS_CONFIG["pages_per_task"]
+        pool = get_attachment_pool()
+        futures = [pool.submit(_extract_pages, path, start, start + step) for start in range(0, pages, step)]
+        tmp_path = f"{text_path}.part"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for future in futures:
+                part = future.result()
+                if part:
+                    f.write(part + "\n\n")
+        os.replace(tmp_path, text_path)
+
+    with open(text_path, 'r', encoding='utf-8') as f:
+        return f.read().strip(), pages
+
+
+def collect_attachments(source_code, url, html, offline=False):
+    """
+    Télécharge et extrait les PDF liés à un article.
+    Retourne [{url, title, pages, chars, text}] ou, pour un document en échec, {url, title, error}.
+    offline : réutilise uniquement les .pdf / .txt déjà présents sous data/attachments, sans
+    réseau ni pool de processus (ré-extraction depuis l'archive HTML).
+    """
+    attachments = []
+    try:
+        links = find_attachment_links(source_code, html, url)
+    except Exception as e:
+        print(f"   ⚠️ Pièces jointes non recherchées {url} : {e}")
+        return attachments
+
+    with timings.timed("attach"):
+        for link in links:
+            try:
+                text, pages = extract_attachment_text(download_attachment(link["url"], offline), in_process=offline)
+                attachments.append({**link, "pages": pages, "chars": len(text), "text": text})
+                run_stats.increment(source_code, "attachments")
+                run_stats.increment(source_code, "attachment_pages", pages)
+            except Exception as e:
+                run_stats.increment(source_code, "attachments_failed")
+                print(f"   ⚠️ Pièce jointe ignorée {link['url']} : {e}")
+                attachments.append({**link, "error": str(e)})
+    return attachments
+
+
+def with_attachments(content, attachments):
+    """Contenu de l'article suivi du texte de ses pièces jointes (une section par document)."""
+    sections = [content] if content else []
+    for attachment in attachments:
+        if attachment.get("text"):
+            sections.append(f"Pièce jointe : {attachment['title']}\n\n{attachment['text']}")
+    return "\n\n".join(sections)
+
+
+def attachments_metadata(attachments):
+    """Métadonnées des pièces jointes gardées dans les résultats (leur texte est dans le contenu)."""
+    return [{k: v for k, v in attachment.items() if k != "text"} for attachment in attachments]
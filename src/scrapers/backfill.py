@@ -0,0 +1,196 @@
+"""
+Backfill : parcours profond des pages de liste d'une source.
+
+Les URLs des pages suivent SOURCES_CONFIG[source]["pagination"]["template"].
+Les pages sont récupérées par lots (HTTP asynchrone en parallèle, navigateur
+en secours page par page) puis lues dans l'ordre ; le parcours s'arrête :
+- à la profondeur maximale (max_pages)
+- sur une page vide (fin de la pagination)
+- sur une page dont toutes les URLs sont déjà en base ou déjà vues
+- sur une page dont tous les articles sont antérieurs à la date limite (since)
+
+Les sources dont un sitemap couvre tout l'historique (feeds marqués "archive")
+sont parcourues dans ce sitemap, filtré sur la date limite et découpé en pages de
+feed_page_size articles ; les flux RSS, limités aux derniers articles, ne servent
+pas au backfill. Les sources dont la liste est servie par une API JSON (list_api)
+sont paginées directement dans l'API. Mêmes règles d'arrêt dans tous les cas.
+"""
+from datetime import date
+
+from config.settings import BACKFILL_CONFIG, SOURCES_CONFIG
+from src.common import run_stats
+from src.common.async_fetch import fetch_many
+from src.common.dates import parse_list_date
+from src.common.fetch import archive_result, fetch_page, get_fetch_strategy, is_usable, record_http_result
+from src.common.http_client import FetchResult
+from src.common.list_api import get_api_config, get_endpoint, iter_api_pages
+from src.common.readiness import load_page
+from src.scrapers.discovery import complete_from_known, discover_articles
+from src.scrapers.registry import SCRAPER_FUNCTIONS
+
+
+def list_page_url(source_code, page):
+    """URL de la page de liste numéro `page` d'une source."""
+    return SOURCES_CONFIG[source_code]["pagination"]["template"].format(page=page)
+
+
+def fetch_list_pages(source_code, urls, driver=None):
+    """HTML des pages de liste données, dans l'ordre ("" si échec)."""
+    strategy = get_fetch_strategy(source_code, "list")
+
+    # Un seul driver : les pages rendues en JavaScript sont chargées l'une après l'autre
+    if strategy == "browser":
+        return [fetch_page(driver, url, source_code, "list") for url in urls]
+
+    pages = []
+    for url, result in zip(urls, fetch_many(urls)):
+        record_http_result(source_code, result)
+        if is_usable(result, source_code, "list", strategy):
+            run_stats.increment(source_code, "fetch_http")
+            archive_result(source_code, "list", result)
+            pages.append(result.html)
+        elif strategy == "auto" and driver is not None:
+            run_stats.increment(source_code, "fetch_fallback")
+            run_stats.increment(source_code, "fetch_browser")
+            html = load_page(driver, url, source_code, "list")
+            archive_result(source_code, "list", FetchResult(url, html=html, via="browser"))
+            pages.append(html)
+        else:
+            run_stats.increment(source_code, "fetch_http_failed")
+            pages.append("")
+    return pages
+
+
+def page_stop_reason(page_items, seen, known_urls=None, since=None):
+    """Raison d'arrêter le parcours après cette page, ou None pour continuer."""
+    if not page_items:
+        return "page vide"
+
+    new_urls = [
+        item['url'] for item in page_items
+        if item['url'] not in seen and (known_urls is None or item['url'] not in known_urls)
+    ]
+    if not new_urls:
+        return "aucune URL nouvelle"
+
+    if since is not None:
+        dates = [d for d in (parse_list_date(item['date']) for item in page_items) if d]
+        if dates and max(dates) < since:
+            return f"articles antérieurs au {since.isoformat()}"
+
+    return None
+
+
+def _collect_page(items, seen, page_items, since):
+    """Ajoute les articles nouveaux (et pas trop anciens) d'une page à la liste."""
+    for item in page_items:
+        if item['url'] in seen:
+            continue
+        item_date = parse_list_date(item['date']) if since else None
+        if item_date and item_date < since:
+            continue
+        seen.add(item['url'])
+        items.append(item)
+
+
+def backfill_from_api(source_code, endpoint, known_urls=None, max_pages=None, since=None):
+    """Backfill via l'API JSON de la liste (pages de plusieurs centaines d'articles)."""
+    parse = SCRAPER_FUNCTIONS[source_code]["parse_api"]
+    items = []
+    seen = set()
+
+    for page, hits in enumerate(iter_api_pages(source_code, endpoint, max_pages=max_pages), 1):
+        page_items = parse(hits)
+        reason = page_stop_reason(page_items, seen, known_urls, since)
+        _collect_page(items, seen, page_items, since)
+
+        print(f"      📡 Page API {page} : {len(page_items)} articles ({len(items)} au total)")
+
+        if reason:
+            print(f"   [{source_code.upper()}] Arrêt du backfill page API {page} : {reason}")
+            break
+
+    return items
+
+
+def backfill_from_feeds(source_code, known_urls=None, max_pages=None, since=None):
+    """
+    Backfill via les sitemaps d'archive de la source, du plus récent au plus ancien.
+    Retourne None si la source n'en a pas ou s'ils sont illisibles (repli sur la pagination).
+    """
+    page_size = max(1, BACKFILL_CONFIG["feed_page_size"])
+    entries = discover_articles(source_code, since=since or date.min, limit=max_pages * page_size, archive_only=True)
+    if entries is None:
+        return None
+    complete_from_known(source_code, entries)
+
+    items = []
+    seen = set()
+    for page, start in enumerate(range(0, max_pages * page_size, page_size), 1):
+        page_items = entries[start:start + page_size]
+        reason = page_stop_reason(page_items, seen, known_urls, since)
+        _collect_page(items, seen, page_items, since)
+
+        print(f"      🗺️  Page sitemap {page} : {len(page_items)} articles ({len(items)} au total)")
+
+        if reason:
+            print(f"   [{source_code.upper()}] Arrêt du backfill page sitemap {page} : {reason}")
+            return items
+
+    print(f"   [{source_code.upper()}] Profondeur maximale atteinte ({max_pages} pages)")
+    return items
+
+
+def backfill_articles_list(source_code, driver, known_urls=None, max_pages=None, since=None):
+    """
+    Liste des articles d'une source sur plusieurs pages (sans doublons, ordre du site).
+    Les articles datés d'avant `since` (datetime.date) sont écartés ; les URLs déjà en
+    base sont gardées ici et retirées ensuite par filter_known_articles.
+    """
+    max_pages = max_pages or BACKFILL_CONFIG["max_pages"]
+
+    # Sitemap d'archive : tout l'historique sans charger les pages de liste
+    items = backfill_from_feeds(source_code, known_urls, max_pages, since)
+    if items is not None:
+        return items
+
+    pagination = SOURCES_CONFIG[source_code].get("pagination")
+    if not pagination:
+        print(f"   ⚠️  {source_code.upper()} : pas de pagination configurée, liste simple")
+        return SCRAPER_FUNCTIONS[source_code]["list"](driver) or []
+
+    parse = SCRAPER_FUNCTIONS[source_code]["parse_list"]
+    batch_size = max(1, BACKFILL_CONFIG["parallel_pages"])
+    first_page = pagination.get("first_page", 1)
+
+    print(f"   [{source_code.upper()}] Backfill : jusqu'à {max_pages} pages"
+          + (f", articles depuis le {since.isoformat()}" if since else ""))
+
+    if get_api_config(source_code) and SCRAPER_FUNCTIONS[source_code].get("parse_api"):
+        try:
+            endpoint = get_endpoint(source_code, driver, list_page_url(source_code, first_page))
+            if endpoint is not None:
+                return backfill_from_api(source_code, endpoint, known_urls, max_pages, since)
+        except Exception as e:
+            print(f"   ⚠️ [{source_code.upper()}] API de liste indisponible ({e}), repli sur les pages HTML")
+
+    items = []
+    seen = set()
+
+    for batch_start in range(0, max_pages, batch_size):
+        pages = [first_page + i for i in range(batch_start, min(batch_start + batch_size, max_pages))]
+        htmls = fetch_list_pages(source_code, [list_page_url(source_code, page) for page in pages], driver)
+
+        for page, html in zip(pages, htmls):
+            page_items = parse(html) if html else []
+            reason = page_stop_reason(page_items, seen, known_urls, since)
+            _collect_page(items, seen, page_items, since)
+
+            print(f"      📄 Page {page} : {len(page_items)} articles ({len(items)} au total)")
+
+            if reason:
+                print(f"   [{source_code.upper()}] Arrêt du backfill page {page} : {reason}")
+                return items
+
+    print(f"   [{source_code.upper()}] Profondeur maximale atteinte ({max_pages} pages)")
+    return items
@@ -0,0 +1,256 @@
+"""
+Découverte des articles par les flux des sites (RSS/Atom et sitemap.xml).
+
+Une source qui déclare SOURCES_CONFIG[...]["feeds"] voit sa liste construite à
+partir de ses flux au lieu des pages HTML : une petite requête par source suffit
+à détecter les nouveaux articles.
+
+- le XML est lu en flux (lxml.iterparse sur la réponse HTTP), élément par élément,
+  sans charger tout le document : les gros sitemaps restent bon marché
+- les entrées (et les sous-sitemaps d'un index) plus anciennes que la date limite
+  (lastmod / pubDate) sont ignorées sans être lues plus avant
+- seules les URLs correspondant au motif de la source sont gardées
+- un sitemap ne donne ni titre ni date de publication : ils sont repris des runs
+  précédents pour les URLs déjà vues, sinon lus dans la page de l'article à l'extraction
+
+Si aucun flux n'est déclaré, ou si tous échouent, l'appelant repasse par la liste HTML.
+"""
+import os
+import re
+from datetime import date, timedelta
+from email.utils import parsedate_to_datetime
+
+import requests
+from lxml import etree
+from config.settings import DISCOVERY_CONFIG, HTTP_CONFIG, SOURCES_CONFIG
+from src.common import run_stats
+from src.common.extraction import page_metadata
+from src.common.http_client import polite_request
+from src.storage.results_stream import find_stream_path, iter_articles_file
+
+# Date des articles dont ni la liste ni le flux ne donnent la date (même valeur que les scrapers)
+MISSING_DATE = "Date non trouvée"
+
+_ENTRY_TAGS = ("url", "sitemap", "item", "entry")
+
+
+def get_feeds(source_code, archive_only=False):
+    """Flux déclarés pour une source ([{type, url, pattern, archive}]).
+    archive_only : seulement les flux qui couvrent tout l'historique (backfill)."""
+    feeds = SOURCES_CONFIG[source_code].get("feeds", [])
+    return [feed for feed in feeds if feed.get("archive")] if archive_only else feeds
+
+
+def _localname(elem):
+    return etree.QName(elem).localname
+
+
+def _child(elem, name):
+    """Premier enfant de nom local `name` (quel que soit l'espace de noms)."""
+    for child in elem:
+        if isinstance(child.tag, str) and _localname(child) == name:
+            return child
+    return None
+
+
+def _child_text(elem, name):
+    child = _child(elem, name)
+    return (child.text or "").strip() if child is not None else ""
+
+
+def parse_feed_date(text):
+    """Date d'un lastmod (ISO 8601) ou d'un pubDate (RFC 822), ou None."""
+    if not text:
+        return None
+    try:
+        return date.fromisoformat(text[:10])
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(text).date()
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_xml_entries(url):
+    """
+    Itère en flux sur les entrées d'un document XML distant : (type, élément).
+    type : "url" / "sitemap" (sitemaps) ou "item" / "entry" (RSS / Atom).
+    Chaque élément est libéré après usage.
+    """
+    response = polite_request(
+        "GET", url, stream=True, timeout=HTTP_CONFIG["timeout"],
+        headers={"Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8"}
+    )
+    response.raise_for_status()
+    response.raw.decode_content = True
+
+    try:
+        for _, elem in etree.iterparse(response.raw, events=("end",), resolve_entities=False, no_network=True):
+            if not isinstance(elem.tag, str):
+                continue
+            kind = _localname(elem)
+            if kind not in _ENTRY_TAGS:
+                continue
+
+            yield kind, elem
+
+            elem.clear()
+            parent = elem.getparent()
+            while parent is not None and elem.getprevious() is not None:
+                del parent[0]
+    finally:
+        response.close()
+
+
+def _entry_to_item(kind, elem):
+    """
+    Convertit une entrée de flux en article {title, url} et retourne (item, date de
+    publication, date de filtrage). Un sitemap sans extension news ne donne ni titre
+    ni date de publication : son lastmod (date de modification) ne sert qu'au filtre
+    sur la date limite, le titre et la date sont complétés ensuite.
+    """
+    if kind == "url":
+        url = _child_text(elem, "loc")
+        news = _child(elem, "news")
+        title = _child_text(news, "title") if news is not None else ""
+        published = parse_feed_date(_child_text(news, "publication_date")) if news is not None else None
+        return {"title": title, "url": url}, published, published or parse_feed_date(_child_text(elem, "lastmod"))
+
+    if kind == "item":
+        url = _child_text(elem, "link") or _child_text(elem, "guid")
+        published = parse_feed_date(_child_text(elem, "pubDate") or _child_text(elem, "date"))
+        return {"title": _child_text(elem, "title"), "url": url}, published, published
+
+    # Atom
+    link = _child(elem, "link")
+    url = link.get("href", "") if link is not None else ""
+    published = parse_feed_date(_child_text(elem, "published") or _child_text(elem, "updated"))
+    return {"title": _child_text(elem, "title"), "url": url}, published, published
+
+
+def read_feed(source_code, url, pattern=None, since=None, depth=0):
+    """
+    Articles d'un flux (RSS, Atom, sitemap ou index de sitemaps), postérieurs à `since`.
+    Retourne [(item, date de publication, date de filtrage)].
+    """
+    matcher = re.compile(pattern) if pattern else None
+    found = []
+    sub_sitemaps = []
+
+    run_stats.increment(source_code, "discovery_requests")
+    for kind, elem in iter_xml_entries(url):
+        if kind == "sitemap":
+            lastmod = parse_feed_date(_child_text(elem, "lastmod"))
+            if since is None or lastmod is None or lastmod >= since:
+                sub_sitemaps.append(_child_text(elem, "loc"))
+            continue
+
+        item, published, seen_date = _entry_to_item(kind, elem)
+        if not item["url"] or (matcher and not matcher.search(item["url"])):
+            continue
+        if since is not None and seen_date is not None and seen_date < since:
+            continue
+        found.append((item, published, seen_date))
+
+    if depth < DISCOVERY_CONFIG["max_sitemap_depth"]:
+        for sitemap_url in sub_sitemaps:
+            try:
+                found += read_feed(source_code, sitemap_url, pattern, since, depth + 1)
+            except (requests.RequestException, etree.XMLSyntaxError) as e:
+                print(f"   ⚠️ [{source_code.upper()}] Sitemap illisible {sitemap_url} : {e}")
+    return found
+
+
+def discover_articles(source_code, since=None, limit=None, archive_only=False):
+    """
+    Liste des articles d'une source via ses flux, du plus récent au plus ancien, telle que
+    les flux la donnent (titre vide / date non trouvée pour un sitemap : voir complete_from_known).
+    since : date limite (défaut : DISCOVERY_CONFIG["max_age_days"] jours).
+    archive_only : seulement les flux marqués "archive" (backfill).
+    Retourne None si la source n'a pas de flux ou si aucun n'a pu être lu.
+    """
+    feeds = get_feeds(source_code, archive_only)
+    if not feeds:
+        return None
+
+    if since is None:
+        since = date.today() - timedelta(days=DISCOVERY_CONFIG["max_age_days"])
+
+    entries = []
+    read_any = False
+    for feed in feeds:
+        try:
+            entries += read_feed(source_code, feed["url"], feed.get("pattern"), since)
+            read_any = True
+        except (requests.RequestException, etree.XMLSyntaxError) as e:
+            print(f"   ⚠️ [{source_code.upper()}] Flux illisible {feed['url']} : {e}")
+
+    if not read_any:
+        return None
+
+    # Dédoublonnage, plus récents d'abord (entrées sans date à la fin)
+    entries.sort(key=lambda entry: entry[2] or date.min, reverse=True)
+    items = []
+    seen = set()
+    for item, published, _ in entries:
+        if item["url"] in seen:
+            continue
+        seen.add(item["url"])
+        items.append({**item, "date": published.isoformat() if published else MISSING_DATE})
+
+    if limit is not None:
+        items = items[:limit]
+
+    print(f"   [{source_code.upper()}] {len(items)} articles découverts via les flux")
+    return items
+
+
+def _known_listing(source_code):
+    """Titre et date des articles déjà scrapés d'une source (liste HTML ou flux d'un run précédent)."""
+    known = {}
+    for path in (f"scrapers/{source_code}/results.json", find_stream_path(source_code)):
+        if not path or not os.path.exists(path):
+            continue
+        try:
+            for article in iter_articles_file(path):
+                if isinstance(article, dict) and article.get("url"):
+                    known[article["url"]] = article
+        except OSError as e:
+            print(f"   ⚠️ [{source_code.upper()}] Résultats précédents illisibles {path} : {e}")
+    return known
+
+
+def complete_from_known(source_code, items):
+    """
+    Complète le titre et la date des articles sans métadonnées (sitemaps) avec ceux
+    déjà relevés pour la même URL. Les autres sont complétés depuis la page de
+    l'article pendant l'extraction (complete_from_page), jamais depuis l'URL.
+    """
+    missing = [item for item in items if not item["title"] or item["date"] == MISSING_DATE]
+    if not missing:
+        return items
+
+    known = _known_listing(source_code)
+    for item in missing:
+        previous = known.get(item["url"])
+        if not previous:
+            continue
+        if not item["title"] and previous.get("title"):
+            item["title"] = previous["title"]
+        if item["date"] == MISSING_DATE and previous.get("date") and previous["date"] != MISSING_DATE:
+            item["date"] = previous["date"]
+    return items
+
+
+def complete_from_page(item, html):
+    """Item complété du titre et de la date lus dans la page de l'article, s'ils manquent."""
+    if item.get("title") and item.get("date") != MISSING_DATE:
+        return item
+    metadata = page_metadata(html)
+    completed = dict(item)
+    if not item.get("title") and metadata["title"]:
+        completed["title"] = metadata["title"]
+    if item.get("date") == MISSING_DATE and metadata["date"]:
+        completed["date"] = metadata["date"]
+    return completed
@@ -0,0 +1,182 @@
+"""
+Pipeline en deux étages pour le contenu des articles d'une source :
+- étage de fetch (un thread) : charge les pages avec le driver ou en HTTP et
+  dépose le HTML brut dans une file bornée
+- étage de parsing : un pool de processus exécute l'extracteur de la source
+  sur chaque page ; les résultats sont rendus dans l'ordre de la liste
+
+Le navigateur charge ainsi la page suivante pendant que les pages précédentes
+sont parsées sur les autres cœurs. La file bornée (PARSE_POOL_CONFIG["queue_size"])
+limite le nombre de pages en mémoire quand le parsing prend du retard.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config.settings import PARSE_POOL_CONFIG
+from src.common import timings
+from src.common.fetch import fetch_document
+from src.scrapers.pipeline import _article_result, extract_article, get_cached_extraction, store_extraction
+from src.scrapers.registry import SCRAPER_FUNCTIONS
+
+_DONE = object()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _extract_in_worker(source_code, html, url):
+    """Extraction dans un processus du pool. Retourne (contenu, temps par phase)."""
+    with timings.collect() as phases:
+        with timings.remainder("clean"):
+            content = SCRAPER_FUNCTIONS[source_code]["extract"](html, url)
+    return content, phases
+
+
+def get_parse_pool():
+    """Pool de processus d'extraction partagé par le run (créé au premier usage)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = PARSE_POOL_CONFIG["workers"] or os.cpu_count() or 1
+            # spawn : les processus ne copient pas le thread de fetch ni le driver du parent
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def shutdown_parse_pool():
+    """Arrête le pool d'extraction (fin de run)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+class _StagedPage:
+    """Une page entre les deux étages : résultat du fetch, puis extraction en cours."""
+
+    def __init__(self, position, item, result, error, phases, fetch_s):
+        self.position = position
+        self.item = item
+        self.result = result
+        self.error = error
+        self.phases = phases
+        self.fetch_s = fetch_s
+        self.content = None
+        self.future = None
+
+    def done(self):
+        return self.future is None or self.future.done()
+
+
+def _fetch_stage(source_code, items, driver, fetched):
+    """Charge les articles dans l'ordre et dépose chaque page dans la file (bloque si elle est pleine)."""
+    try:
+        for position, item in enumerate(items, 1):
+            start = time.perf_counter()
+            result, error = None, None
+            with timings.collect() as phases:
+                try:
+                    result = fetch_document(driver, item['url'], source_code, "content")
+                    if not result.ok:
+                        error = result.error
+                except Exception as e:
+                    error = str(e)
+            fetched.put(_StagedPage(position, item, result, error, phases, time.perf_counter() - start))
+    finally:
+        fetched.put(_DONE)
+
+
+def _submit(source_code, page):
+    """Envoie la page au pool (sauf erreur de fetch ou contenu déjà extrait en cache)."""
+    if page.error is not None:
+        return
+    page.content = get_cached_extraction(source_code, page.result)
+    if page.content is not None:
+        return
+    try:
+        page.future = get_parse_pool().submit(_extract_in_worker, source_code, page.result.html, page.result.url)
+    except BrokenProcessPool:
+        # Un processus d'extraction est mort : on recrée le pool au prochain envoi, cette page est extraite ici
+        shutdown_parse_pool()
+        with timings.collect() as phases:
+            page.content = extract_article(source_code, page.result)
+        page.phases.update(phases)
+
+
+def _finish(source_code, page, total):
+    """Attend l'extraction d'une page, enregistre ses temps et construit son entrée de résultats."""
+    extract_s = 0.0
+    if page.future is not None:
+        try:
+            page.content, phases = page.future.result()
+            store_extraction(source_code, page.result, page.content)
+            extract_s = sum(phases.values())
+            for phase, seconds in phases.items():
+                page.phases[phase] = page.phases.get(phase, 0.0) + seconds
+        except Exception as e:
+            page.error = str(e)
+
+    if page.error is not None:
+        article = _article_result(source_code, page.item, page.position, total, error=page.error)
+    else:
+        # Pièces jointes éventuelles : leur temps est ajouté à celui de la page. Une erreur
+        # ici ne concerne que cet article (comme dans les autres modes de scraping)
+        with timings.collect() as phases:
+            try:
+                article = _article_result(
+                    source_code, page.item, page.position, total, page.content, html=page.result.html
+                )
+            except Exception as e:
+                article = _article_result(source_code, page.item, page.position, total, error=str(e))
+        extract_s += sum(phases.values())
+        for phase, seconds in phases.items():
+            page.phases[phase] = page.phases.get(phase, 0.0) + seconds
+
+    timings.record(source_code, page.item['url'], page.phases, page.fetch_s + extract_s)
+    return article
+
+
+def scrape_articles_staged(source_code, items, driver=None, on_result=None):
+    """
+    Récupère le contenu des articles d'une source en deux étages (fetch / extraction en parallèle).
+    Les articles sont rendus dans l'ordre de la liste ; on_result(article) est appelé pour
+    chacun dès que lui et tous ceux qui le précèdent sont extraits.
+    """
+    total = len(items)
+    window = max(1, PARSE_POOL_CONFIG["queue_size"])
+    fetched = queue.Queue(maxsize=window)
+    pending = deque()
+    data = []
+
+    get_parse_pool()
+    fetcher = threading.Thread(
+        target=_fetch_stage, args=(source_code, items, driver, fetched), name=f"fetch-{source_code}", daemon=True
+    )
+    fetcher.start()
+
+    def emit(page):
+        data.append(_finish(source_code, page, total))
+        if on_result:
+            on_result(data[-1])
+
+    while True:
+        page = fetched.get()
+        if page is _DONE:
+            break
+        _submit(source_code, page)
+        pending.append(page)
+        # Pages prêtes en tête de file, ou fenêtre pleine : on attend la plus ancienne
+        while pending and (pending[0].done() or len(pending) >= window):
+            emit(pending.popleft())
+
+    while pending:
+        emit(pending.popleft())
+    fetcher.join()
+    return data
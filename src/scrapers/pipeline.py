@@ -0,0 +1,410 @@
+"""
+Étapes communes du scraping d'une source (liste, contenu, sauvegarde).
+Utilisées par le mode séquentiel et par le pool de workers.
+
+Chaque article extrait est ajouté au flux scrapers/<source>/results.jsonl dès
+qu'il est prêt ; un run interrompu reprend sans re-scraper les articles écrits.
+"""
+import json
+import os
+
+from config.settings import DISCOVERY_CONFIG
+from src.archive.html_archive import get_html_archive
+from src.common import run_stats, timings
+from src.common.async_fetch import fetch_many
+from src.common.driver_setup import DRIVER_STATS
+from src.common.fetch import archive_result, fetch_document, get_fetch_strategy, is_usable, record_http_result
+from src.common.http_cache import extractor_version, get_http_cache
+from src.common.http_client import FetchResult
+from src.common.politeness import get_scheduler
+from src.common.readiness import load_page, load_pages_in_tabs
+from src.scrapers.attachments import (
+    attachments_metadata, collect_attachments, is_enabled as attachments_enabled, with_attachments
+)
+from src.scrapers.backfill import backfill_articles_list
+from src.scrapers.discovery import complete_from_known, complete_from_page, discover_articles
+from src.scrapers.registry import SCRAPER_FUNCTIONS
+from src.storage.listing_fingerprints import get_fingerprint, listing_fingerprint, save_fingerprint
+from src.storage.results_stream import SourceCheckpoint
+
+
+def get_results_path(source_code):
+    """Chemin du fichier de résultats d'une source."""
+    return f"scrapers/{source_code}/results.json"
+
+
+def save_results(data, filepath):
+    """Sauvegarde les données en JSON."""
+    if data:
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+            print(f"   💾 Sauvegardé : {filepath}")
+        except Exception as e:
+            print(f"   ❌ Erreur sauvegarde : {e}")
+
+
+def filter_known_articles(source_code, items, known_urls):
+    """Retire de la liste les articles dont l'URL est déjà en base."""
+    if known_urls is None:
+        return items
+
+    new_items, skipped = known_urls.filter_new(items)
+    if skipped:
+        run_stats.increment(source_code, "known_skipped", skipped)
+        print(f"   ⏭️  {source_code.upper()} : {skipped}/{len(items)} articles déjà en base ignorés")
+    return new_items
+
+
+def fetch_articles_list(source_code, driver, known_urls=None, backfill=None):
+    """
+    Récupère la liste des articles d'une source (flux RSS/sitemap s'il y en a, sinon page HTML).
+    Si un index d'URLs connues est fourni, seuls les nouveaux articles sont gardés.
+    backfill ({"max_pages": N, "since": date}) : parcours profond des pages de liste.
+    """
+    listing = complete_from_known(source_code, _fetch_listing(source_code, driver, known_urls, backfill))
+    return filter_known_articles(source_code, listing, known_urls)
+
+
+def _fetch_listing(source_code, driver, known_urls=None, backfill=None):
+    """
+    Liste parsée d'une source telle que le site la donne, avant le filtre des articles déjà
+    en base et avant de compléter titres et dates depuis les résultats précédents.
+    """
+    with timings.page(source_code, None, kind="list"):
+        if backfill is not None:
+            items = backfill_articles_list(
+                source_code, driver, known_urls, backfill.get("max_pages"), backfill.get("since")
+            )
+        else:
+            items = discover_articles(source_code, limit=DISCOVERY_CONFIG["max_items"])
+            if items is None:
+                items = SCRAPER_FUNCTIONS[source_code]["list"](driver)
+    return items or []
+
+
+def open_source_run(source_code, driver, known_urls=None, resume=True, backfill=None, force=False):
+    """
+    Ouvre le run d'une source et retourne (checkpoint, articles à traiter).
+    Si le run précédent a été interrompu, sa liste est reprise et les articles déjà
+    écrits dans le flux sont ignorés ; sinon la liste est récupérée sur le site.
+    Une liste identique à celle du dernier run complet (même empreinte) est ignorée,
+    sauf si force est vrai (ou en backfill).
+    Retourne (None, []) si la source n'a aucun nouvel article.
+    """
+    checkpoint = SourceCheckpoint(source_code)
+
+    items = checkpoint.resume_items() if resume else None
+    if items is not None:
+        todo = checkpoint.start(items, resumed=True)
+        print(
+            f"   ♻️  {source_code.upper()} : reprise du run interrompu "
+            f"({len(items) - len(todo)}/{len(items)} articles déjà extraits)"
+        )
+        return checkpoint, todo
+
+    # L'empreinte porte sur la liste brute du site : les titres et dates repris des résultats
+    # précédents (sitemaps) dépendent des fichiers locaux, pas du site
+    listing = _fetch_listing(source_code, driver, known_urls, backfill)
+    fingerprint = listing_fingerprint(listing) if listing and backfill is None else None
+
+    if fingerprint is not None:
+        previous = get_fingerprint(source_code)
+        if fingerprint == previous and not force:
+            run_stats.increment(source_code, "listing_unchanged")
+            print(f"   ⏭️  {source_code.upper()} : liste inchangée depuis le dernier run "
+                  f"(empreinte {fingerprint[:12]}), contenu ignoré")
+            return None, []
+        reason = "forcé (--force)" if fingerprint == previous else (
+            "première empreinte" if previous is None else "liste modifiée")
+        print(f"   🔎 {source_code.upper()} : {reason} (empreinte {fingerprint[:12]}), contenu récupéré")
+
+    items = filter_known_articles(source_code, complete_from_known(source_code, listing), known_urls)
+    if not items:
+        if fingerprint is not None:
+            save_fingerprint(source_code, fingerprint, len(listing))
+        return None, []
+
+    checkpoint.listing = (fingerprint, len(listing)) if fingerprint is not None else None
+    return checkpoint, checkpoint.start(items)
+
+
+def finish_source_run(checkpoint):
+    """Clôt le run d'une source et écrit son results.json complet (ordre de la liste)."""
+    data = checkpoint.finish()
+    save_results(data, get_results_path(checkpoint.source_code))
+
+    # L'empreinte n'est gardée que si tous les articles ont été extraits : sinon le run
+    # suivant doit pouvoir les reprendre
+    if checkpoint.listing and not any(article.get("error") for article in data):
+        save_fingerprint(checkpoint.source_code, *checkpoint.listing)
+    return data
+
+
+def _article_result(source_code, item, position, total, content="", error=None, html=None):
+    """
+    Affiche le statut d'un article et construit son entrée de résultats.
+    html : page de l'article, dont les PDF liés sont ajoutés au contenu (ATTACHMENTS_CONFIG) et
+    d'où sont lus le titre et la date quand la liste ne les donne pas (sitemaps).
+    """
+    if html:
+        item = complete_from_page(item, html)
+    label = item['title'] or item['url']
+    title_preview = (label[:50] + '..') if len(label) > 50 else label
+    prefix = f"      [{source_code.upper()} {position}/{total}]"
+
+    if error is not None:
+        print(f"{prefix} ❌ {title_preview} : {error}")
+        return {**item, "content": "", "error": error}
+
+    attachments = []
+    if html and attachments_enabled(source_code):
+        attachments = collect_attachments(source_code, item['url'], html)
+
+    status = "✅" if content and len(content) > 50 else "⚠️"
+    extra = ""
+    if attachments:
+        extracted = [attachment for attachment in attachments if "text" in attachment]
+        extra = f" + {len(extracted)} PDF ({sum(attachment['pages'] for attachment in extracted)} pages)"
+        content = with_attachments(content, attachments)
+    print(f"{prefix} {status} {title_preview} ({len(content)} cars){extra}")
+
+    archive = get_html_archive()
+    if archive:
+        archive.remember_article(source_code, item)
+    if attachments:
+        # Le texte des documents est dans le contenu : seules leurs métadonnées sont gardées à part
+        return {**item, "content": content, "attachments": attachments_metadata(attachments)}
+    return {**item, "content": content}
+
+
+def get_cached_extraction(source_code, result):
+    """Contenu déjà extrait d'une page inchangée (304) avec le même extracteur, ou None."""
+    cache = get_http_cache()
+    if not (cache and result.not_modified):
+        return None
+
+    cached = cache.get_extracted(result.url, extractor_version(SCRAPER_FUNCTIONS[source_code]["extract"]))
+    if cached is not None:
+        run_stats.increment(source_code, "extract_skipped")
+    return cached
+
+
+def store_extraction(source_code, result, content):
+    """Garde le contenu extrait d'une page HTTP en cache, pour la prochaine revalidation."""
+    cache = get_http_cache()
+    if cache and result.via == "http":
+        cache.set_extracted(result.url, content, extractor_version(SCRAPER_FUNCTIONS[source_code]["extract"]))
+
+
+def extract_article(source_code, result):
+    """
+    Extrait le contenu d'une page d'article.
+    Si la page n'a pas changé (304) et que l'extracteur est le même, le contenu
+    extrait en cache est réutilisé sans re-parser la page.
+    """
+    cached = get_cached_extraction(source_code, result)
+    if cached is not None:
+        return cached
+
+    # parse et extract sont mesurés par le noyau d'extraction, le reste est du nettoyage
+    with timings.remainder("clean"):
+        content = SCRAPER_FUNCTIONS[source_code]["extract"](result.html, result.url)
+
+    store_extraction(source_code, result, content)
+    return content
+
+
+def scrape_article(source_code, driver, item, position, total):
+    """
+    Récupère le contenu d'un article de la liste.
+    Retourne l'item enrichi du contenu (ou de l'erreur rencontrée).
+    """
+    with timings.page(source_code, item['url']):
+        try:
+            result = fetch_document(driver, item['url'], source_code, "content")
+            if not result.ok:
+                return _article_result(source_code, item, position, total, error=result.error)
+            content = extract_article(source_code, result)
+            return _article_result(source_code, item, position, total, content, html=result.html)
+        except Exception as e:
+            return _article_result(source_code, item, position, total, error=str(e))
+
+
+def scrape_articles_async(source_code, items, driver=None, on_result=None):
+    """
+    Récupère le contenu de tous les articles d'une source en une passe asynchrone (HTTP).
+    Le HTML est passé directement à l'extracteur de la source ; les pages sans le
+    conteneur attendu repassent par le navigateur si la stratégie et le driver le permettent.
+    on_result(article) est appelé pour chaque article dès qu'il est extrait.
+    """
+    strategy = get_fetch_strategy(source_code, "content")
+    total = len(items)
+    data = []
+
+    if strategy == "browser":
+        for i, item in enumerate(items, 1):
+            data.append(scrape_article(source_code, driver, item, i, total))
+            if on_result:
+                on_result(data[-1])
+        return data
+
+    fetched = fetch_many([item['url'] for item in items])
+
+    for i, (item, result) in enumerate(zip(items, fetched), 1):
+        record_http_result(source_code, result)
+        with timings.page(source_code, item['url'], fetched_in=result.elapsed):
+            try:
+                if is_usable(result, source_code, "content", strategy):
+                    run_stats.increment(source_code, "fetch_http")
+                    archive_result(source_code, "content", result)
+                    data.append(_article_result(
+                        source_code, item, i, total, extract_article(source_code, result), html=result.html
+                    ))
+                elif strategy == "auto" and driver is not None:
+                    run_stats.increment(source_code, "fetch_fallback")
+                    run_stats.increment(source_code, "fetch_browser")
+                    html = load_page(driver, item['url'], source_code, "content")
+                    browser_result = FetchResult(item['url'], html=html, via="browser")
+                    archive_result(source_code, "content", browser_result)
+                    data.append(
+                        _article_result(
+                            source_code, item, i, total, extract_article(source_code, browser_result), html=html
+                        )
+                    )
+                else:
+                    run_stats.increment(source_code, "fetch_http_failed")
+                    data.append(
+                        _article_result(source_code, item, i, total, error=result.error or "Conteneur introuvable")
+                    )
+            except Exception as e:
+                data.append(_article_result(source_code, item, i, total, error=str(e)))
+
+        if on_result:
+            on_result(data[-1])
+
+    return data
+
+
+def scrape_articles_tabs(source_code, items, driver, on_result=None):
+    """
+    Récupère le contenu des articles dans plusieurs onglets du même Chrome (SELENIUM_CONFIG["tabs"]).
+    Chaque page est extraite dès qu'elle est prête, pendant que les autres onglets chargent ;
+    les articles sont rendus dans l'ordre de la liste (on_result appelé dans cet ordre).
+    """
+    total = len(items)
+    data = []
+    ready = {}
+
+    for index, html, error, elapsed in load_pages_in_tabs(driver, [item['url'] for item in items], source_code,
+                                                          "content"):
+        item = items[index]
+        # Chargement et attente se recouvrent dans un onglet : la durée est comptée en navigate
+        with timings.page(source_code, item['url'], fetched_in=elapsed):
+            try:
+                if error is not None:
+                    ready[index] = _article_result(source_code, item, index + 1, total, error=error)
+                else:
+                    run_stats.increment(source_code, "fetch_browser")
+                    result = FetchResult(item['url'], html=html, via="browser")
+                    archive_result(source_code, "content", result)
+                    ready[index] = _article_result(
+                        source_code, item, index + 1, total, extract_article(source_code, result), html=html
+                    )
+            except Exception as e:
+                ready[index] = _article_result(source_code, item, index + 1, total, error=str(e))
+
+        while len(data) in ready:
+            data.append(ready.pop(len(data)))
+            if on_result:
+                on_result(data[-1])
+
+    return data
+
+
+def print_timing_summary():
+    """Affiche les temps par phase (p50 / p95 / max en ms) et la phase dominante de chaque source."""
+    summary = timings.summarize()
+    if not summary:
+        return
+
+    print("\n⏱️  Temps par phase (p50 / p95 / max, ms) :")
+    for source_code, phases in sorted(summary.items()):
+        details = " | ".join(
+            f"{phase} " + "/".join(f"{phases[phase][key] * 1000:.1f}" for key in ("p50", "p95", "max"))
+            for phase in timings.PHASES if phase in phases
+        )
+        dominant = timings.dominant_phase(phases)
+        print(f"   • {source_code.upper():<6} {details}")
+        if dominant:
+            share = phases[dominant]['sum'] / phases['total']['sum'] if phases['total']['sum'] else 0
+            print(f"            phase dominante : {dominant} ({share:.0%} du temps, {phases['total']['count']} pages)")
+
+
+def save_run_report(started_at=None):
+    """Écrit le rapport de run (JSON + Prometheus) et affiche son chemin."""
+    path = timings.write_report(started_at=started_at)
+    if path:
+        print(f"\n🧾 Rapport de run : {path} (+ .prom)")
+    return path
+
+
+def print_run_summary(sources):
+    """Affiche le résumé du run : stratégie de fetch et pages récupérées par source."""
+    stats = run_stats.snapshot()
+
+    print("\n📊 Résumé par source :")
+    for source_code, config in sources.items():
+        source_stats = stats.get(source_code, {})
+        strategy = config.get("fetch_strategy", {})
+        print(
+            f"   • {source_code.upper():<6} "
+            f"[liste: {strategy.get('list', 'browser')}, contenu: {strategy.get('content', 'browser')}] "
+            f"HTTP: {source_stats.get('fetch_http', 0)} | "
+            f"navigateur: {source_stats.get('fetch_browser', 0)} "
+            f"(dont secours: {source_stats.get('fetch_fallback', 0)})"
+        )
+
+        if source_stats.get('discovery_requests'):
+            print(f"            liste découverte via les flux ({source_stats['discovery_requests']} requêtes)")
+
+        if source_stats.get('listing_unchanged'):
+            print(f"            liste inchangée depuis le dernier run : contenu ignoré")
+
+        if source_stats.get('known_skipped'):
+            print(f"            {source_stats['known_skipped']} articles déjà en base ignorés avant chargement")
+
+        pages = source_stats.get('browser_pages', 0)
+        if pages:
+            print(
+                f"            navigateur : {source_stats.get('browser_bytes', 0) / pages / 1024:.0f} Ko/page, "
+                f"{source_stats.get('browser_load_ms', 0) / pages:.0f} ms/page, "
+                f"{source_stats.get('browser_blocked_requests', 0) / pages:.1f} requêtes bloquées/page"
+            )
+
+        hits = source_stats.get('cache_hits', 0)
+        requests_count = hits + source_stats.get('cache_misses', 0)
+        if requests_count:
+            print(
+                f"            cache HTTP : {hits}/{requests_count} pages inchangées "
+                f"({hits / requests_count:.0%}), {source_stats.get('extract_skipped', 0)} extractions évitées"
+            )
+
+    driver_stats = stats.get(DRIVER_STATS, {})
+    if driver_stats:
+        print(
+            f"\n🛟 Driver : {driver_stats.get('restarts', 0)} relances après un crash, "
+            f"{driver_stats.get('recycled', 0)} recyclages (pages / mémoire)"
+        )
+
+    print_timing_summary()
+
+    hosts = get_scheduler().summary()
+    if hosts:
+        print("\n🚦 Politesse par hôte :")
+        for host, stats in sorted(hosts.items()):
+            print(
+                f"   • {host:<32} {stats['requests']} requêtes | débit final {stats['rate']:.2f}/s | "
+                f"{stats['waits']} attentes ({stats['wait_s']:.1f}s) | {stats['backoffs']} replis"
+            )
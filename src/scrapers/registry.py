@@ -0,0 +1,76 @@
+"""
+Registre des fonctions de scraping par source
+- list       : driver -> liste des articles
+- parse_list : (html, limit) -> articles d'une page de liste (backfill)
+- parse_api  : (hits, limit) -> articles d'une page de l'API de liste (si la source en a une)
+- content    : (driver, url) -> contenu de l'article
+- extract    : (html, url) -> contenu de l'article, sans driver
+"""
+from scrapers.afg.get_list import get_afg_articles_list, parse_afg_articles_list, parse_afg_api_hits
+from scrapers.afg.get_content import get_afg_article_content, extract_afg_article_content
+from scrapers.afm.get_list import get_afm_articles_list, parse_afm_articles_list
+from scrapers.afm.get_content import get_afm_article_content, extract_afm_article_content
+from scrapers.alfi.get_list import get_alfi_articles_list, parse_alfi_articles_list
+from scrapers.alfi.get_content import get_alfi_article_content, extract_alfi_article_content
+from scrapers.amf.get_list import get_amf_articles_list, parse_amf_articles_list
+from scrapers.amf.get_content import get_amf_article_content, extract_amf_article_content
+from scrapers.cbi.get_list import get_cbi_articles_list, parse_cbi_articles_list
+from scrapers.cbi.get_content import get_cbi_article_content, extract_cbi_article_content
+from scrapers.cssf.get_list import get_cssf_articles_list, parse_cssf_articles_list
+from scrapers.cssf.get_content import get_cssf_article_content, extract_cssf_article_content
+from scrapers.esma.get_list import get_esma_articles_list, parse_esma_articles_list
+from scrapers.esma.get_content import get_esma_article_content, extract_esma_article_content
+from scrapers.finma.get_list import get_finma_articles_list, parse_finma_articles_list
+from scrapers.finma.get_content import get_finma_article_content, extract_finma_article_content
+
+SCRAPER_FUNCTIONS = {
+    "afg": {
+        "list": get_afg_articles_list,
+        "parse_list": parse_afg_articles_list,
+        "parse_api": parse_afg_api_hits,
+        "content": get_afg_article_content,
+        "extract": extract_afg_article_content,
+    },
+    "afm": {
+        "list": get_afm_articles_list,
+        "parse_list": parse_afm_articles_list,
+        "content": get_afm_article_content,
+        "extract": extract_afm_article_content,
+    },
+    "alfi": {
+        "list": get_alfi_articles_list,
+        "parse_list": parse_alfi_articles_list,
+        "content": get_alfi_article_content,
+        "extract": extract_alfi_article_content,
+    },
+    "amf": {
+        "list": get_amf_articles_list,
+        "parse_list": parse_amf_articles_list,
+        "content": get_amf_article_content,
+        "extract": extract_amf_article_content,
+    },
+    "cbi": {
+        "list": get_cbi_articles_list,
+        "parse_list": parse_cbi_articles_list,
+        "content": get_cbi_article_content,
+        "extract": extract_cbi_article_content,
+    },
+    "cssf": {
+        "list": get_cssf_articles_list,
+        "parse_list": parse_cssf_articles_list,
+        "content": get_cssf_article_content,
+        "extract": extract_cssf_article_content,
+    },
+    "esma": {
+        "list": get_esma_articles_list,
+        "parse_list": parse_esma_articles_list,
+        "content": get_esma_article_content,
+        "extract": extract_esma_article_content,
+    },
+    "finma": {
+        "list": get_finma_articles_list,
+        "parse_list": parse_finma_articles_list,
+        "content": get_finma_article_content,
+        "extract": extract_finma_article_content,
+    },
+}
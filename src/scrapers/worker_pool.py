@@ -0,0 +1,162 @@
+"""
+Pool de workers Selenium pour scraper plusieurs sources en parallèle.
+
+Chaque worker possède son propre driver et consomme une file partagée
+contenant deux types de tâches :
+- ("source", code) : récupère la liste des articles d'une source
+- ("article", code, index) : récupère le contenu d'un article
+
+Les articles d'une source sont donc répartis entre tous les workers ; chaque
+article est ajouté au flux JSONL de sa source dès qu'il est extrait, et la source
+écrit son results.json dès que ses articles sont traités.
+En mode asynchrone, le contenu d'une source est récupéré en une seule passe
+HTTP par le worker qui a traité sa liste.
+"""
+import queue
+import threading
+
+from src.browser_service.client import connect_driver
+from src.common.driver_setup import SupervisedDriver
+from src.scrapers.pipeline import open_source_run, finish_source_run, scrape_article, scrape_articles_async
+
+
+def default_driver_factory():
+    """
+    Driver paresseux et supervisé (recyclé / relancé si Chrome meurt) : session du service
+    navigateur si disponible, sinon Chrome local.
+    """
+    return SupervisedDriver(connect_driver)
+
+
+class _SourceRun:
+    """État d'avancement d'une source pendant le run."""
+
+    def __init__(self, source_code, config, checkpoint, items):
+        self.source_code = source_code
+        self.config = config
+        self.checkpoint = checkpoint
+        self.items = items
+        self.remaining = len(items)
+
+
+class ScrapeWorkerPool:
+    """Pool de N drivers Selenium alimenté par une file de tâches partagée."""
+
+    def __init__(self, nb_workers, driver_factory=default_driver_factory, use_async=False, known_urls=None,
+                 resume=True, backfill=None, force=False):
+        self.nb_workers = max(1, nb_workers)
+        self.driver_factory = driver_factory
+        self.use_async = use_async
+        self.known_urls = known_urls
+        self.resume = resume
+        self.backfill = backfill
+        self.force = force
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._runs = {}
+
+    def run(self, sources):
+        """
+        Scrape les sources données ({code: config}) avec le pool.
+        Bloque jusqu'à ce que toutes les tâches soient traitées.
+        """
+        for source_code, config in sources.items():
+            self._put(("source", source_code, config))
+
+        workers = [
+            threading.Thread(target=self._worker_loop, args=(i,), name=f"scraper-{i}", daemon=True)
+            for i in range(1, self.nb_workers + 1)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        if self._pending:
+            print(f"   ⚠️  {self._pending} tâches non traitées (aucun worker disponible)")
+
+    def _put(self, task):
+        with self._lock:
+            self._pending += 1
+        self._tasks.put(task)
+
+    def _done(self):
+        with self._lock:
+            self._pending -= 1
+
+    def _has_pending(self):
+        with self._lock:
+            return self._pending > 0
+
+    def _worker_loop(self, worker_id):
+        """Boucle d'un worker : un driver, des tâches jusqu'à épuisement de la file."""
+        try:
+            driver = self.driver_factory()
+        except Exception as e:
+            print(f"   ❌ Worker {worker_id} : impossible de créer le driver ({e})")
+            return
+
+        try:
+            while self._has_pending():
+                try:
+                    task = self._tasks.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+
+                try:
+                    if task[0] == "source":
+                        self._handle_source(driver, task[1], task[2])
+                    else:
+                        self._handle_article(driver, task[1], task[2])
+                except Exception as e:
+                    print(f"   ❌ Worker {worker_id} : erreur sur la tâche {task[:2]} ({e})")
+                finally:
+                    self._done()
+        finally:
+            driver.quit()
+
+    def _handle_source(self, driver, source_code, config):
+        """Récupère la liste d'une source et planifie ses articles."""
+        print(f"\n🚀 LANCEMENT : {config['name']}")
+        checkpoint, items = open_source_run(
+            source_code, driver, self.known_urls, self.resume, self.backfill, self.force
+        )
+
+        if checkpoint is None:
+            print(f"   ⚠️  {config['name']} : aucun nouvel article")
+            return
+
+        print(f"   ... {config['name']} : extraction du contenu pour {len(items)} articles")
+
+        # Mode asynchrone (ou reprise déjà complète) : toute la source dans ce worker
+        if self.use_async or not items:
+            if items:
+                scrape_articles_async(source_code, items, driver, on_result=checkpoint.record)
+            finish_source_run(checkpoint)
+            print(f"✅ Module {config['name']} terminé")
+            return
+
+        with self._lock:
+            self._runs[source_code] = _SourceRun(source_code, config, checkpoint, items)
+
+        for index in range(len(items)):
+            self._put(("article", source_code, index))
+
+    def _handle_article(self, driver, source_code, index):
+        """Récupère le contenu d'un article et sauvegarde la source si c'était le dernier."""
+        run = self._runs[source_code]
+        try:
+            result = scrape_article(source_code, driver, run.items[index], index + 1, len(run.items))
+        except Exception as e:
+            result = {**run.items[index], "content": "", "error": str(e)}
+
+        run.checkpoint.record(result)
+
+        with self._lock:
+            run.remaining -= 1
+            finished = run.remaining == 0
+
+        if finished:
+            finish_source_run(run.checkpoint)
+            print(f"✅ Module {run.config['name']} terminé")
@@ -0,0 +1,9 @@
+"""Storage package"""
+from .results_stream import (
+    ResultsStreamWriter, SourceCheckpoint, UnreadableArticles, iter_results, iter_json_array, iter_articles_file,
+    find_stream_path
+)
+from .listing_fingerprints import listing_fingerprint, get_fingerprint, save_fingerprint
+
+__all__ = ['ResultsStreamWriter', 'SourceCheckpoint', 'UnreadableArticles', 'iter_results', 'iter_json_array',
+           'iter_articles_file', 'find_stream_path', 'listing_fingerprint', 'get_fingerprint', 'save_fingerprint']
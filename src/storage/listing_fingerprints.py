@@ -0,0 +1,49 @@
+"""
+Empreintes des listes d'articles de chaque source, d'un run à l'autre.
+
+L'empreinte est le SHA-256 de la liste parsée (couples URL / titre, dans l'ordre).
+Elle est enregistrée quand tous les articles d'une source ont été extraits ; au run
+suivant, une liste à l'empreinte identique permet de sauter l'étape de contenu.
+"""
+import hashlib
+import os
+import threading
+import time
+
+import orjson
+from config.settings import LISTING_FINGERPRINTS_PATH
+
+_lock = threading.Lock()
+
+
+def listing_fingerprint(items):
+    """SHA-256 de la liste ordonnée des (URL, titre) d'une source."""
+    pairs = [(item['url'], item.get('title') or "") for item in items]
+    return hashlib.sha256(orjson.dumps(pairs)).hexdigest()
+
+
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+
+def get_fingerprint(source_code, path=LISTING_FINGERPRINTS_PATH):
+    """Empreinte enregistrée au dernier run complet d'une source, ou None."""
+    with _lock:
+        entry = _read(path).get(source_code)
+    return entry["fingerprint"] if entry else None
+
+
+def save_fingerprint(source_code, fingerprint, count, path=LISTING_FINGERPRINTS_PATH):
+    """Enregistre l'empreinte de la liste d'une source (réécriture atomique du fichier)."""
+    with _lock:
+        data = _read(path)
+        data[source_code] = {"fingerprint": fingerprint, "items": count, "saved_at": time.time()}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, path)
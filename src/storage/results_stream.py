@@ -0,0 +1,256 @@
+"""
+Écriture en flux des résultats de scraping (JSONL, zstd en option) et reprise.
+
+- chaque article est ajouté au fichier dès qu'il est extrait (une ligne JSON,
+  écrite avec orjson puis flushée) : un crash ne perd que l'article en cours
+- un fichier progress.json par source garde la liste des articles du run et
+  son statut ; un run interrompu reprend là où il s'était arrêté
+- iter_results lit un flux JSONL article par article ; iter_json_array lit de la
+  même façon un fichier JSON [ {...}, ... ] (results.json, exports) sans le charger
+- iter_articles_file choisit l'un ou l'autre d'après le premier caractère du fichier
+"""
+import io
+import os
+import re
+import threading
+import time
+
+import orjson
+import zstandard
+from config.settings import RESULTS_STREAM_CONFIG
+
+
+def get_stream_path(source_code, compress=None):
+    """Chemin du flux JSONL d'une source (.jsonl.zst si compressé)."""
+    if compress is None:
+        compress = RESULTS_STREAM_CONFIG["compress"]
+    suffix = ".jsonl.zst" if compress else ".jsonl"
+    return f"scrapers/{source_code}/results{suffix}"
+
+
+def find_stream_path(source_code):
+    """Flux existant d'une source (compressé ou non), ou None."""
+    for compress in (False, True):
+        path = get_stream_path(source_code, compress)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _open_text_lines(path):
+    """Ouvre un fichier JSONL (éventuellement zstd) en lecture binaire ligne à ligne."""
+    raw = open(path, 'rb')
+    if not path.endswith(".zst"):
+        return raw
+    reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+    return io.BufferedReader(reader)
+
+
+_BOM = b"\xef\xbb\xbf"
+
+
+def _report_decode_error(path, location, error):
+    """Signale un article illisible (comportement par défaut des lecteurs, sans on_error)."""
+    print(f"   ❌ Article illisible ignoré ({path}, {location}) : {error}")
+
+
+class UnreadableArticles:
+    """on_error des lecteurs qui compte les articles illisibles (erreurs d'ingestion) et les signale."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, path, location, error):
+        self.count += 1
+        _report_decode_error(path, location, error)
+
+
+def iter_results(path, on_error=None):
+    """Itère sur les articles d'un flux JSONL(.zst), sans tout charger en mémoire.
+    Une ligne illisible (dont une dernière ligne tronquée par un crash) est ignorée et
+    signalée : on_error(chemin, "ligne N", erreur), par défaut un message."""
+    on_error = on_error or _report_decode_error
+    with _open_text_lines(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if number == 1:
+                line = line.removeprefix(_BOM)
+            if not line:
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                on_error(path, f"ligne {number}", e)
+
+
+# Caractères qui changent l'état du découpage d'un tableau JSON, et fin d'une chaîne
+# ouverte (échappements compris) trouvée en un seul passage du moteur de regex
+_STRUCTURE = re.compile(rb'[\[\]{},"]')
+_STRING_REST = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+def iter_json_array(path, chunk_size=1 << 16, on_error=None):
+    """
+    Itère sur les éléments d'un fichier JSON de la forme [ {...}, {...} ] sans le charger.
+    Le fichier est lu par blocs ; chaque élément de premier niveau est délimité (profondeur
+    d'imbrication, chaînes et échappements suivis au fil de la lecture) puis décodé avec
+    orjson. Mémoire : un bloc et un élément. Un élément tronqué en fin de fichier est ignoré.
+    Un élément illisible est ignoré et signalé : on_error(chemin, "octet N", erreur).
+    """
+    on_error = on_error or _report_decode_error
+    buf = b""
+    offset = 0                 # Position de buf dans le fichier
+    pos = start = depth = 0
+    in_string = False
+
+    with _open_text_lines(path) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            buf += chunk
+            while True:
+                if in_string:
+                    match = _STRING_REST.match(buf, pos)
+                    if match is None:
+                        # Chaîne coupée par la fin du bloc : reprise à son début au bloc suivant
+                        break
+                    in_string = False
+                    pos = match.end()
+                    continue
+
+                match = _STRUCTURE.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                char, pos = match.group(), match.end()
+
+                if char == b'"':
+                    in_string = True
+                elif char in (b"[", b"{"):
+                    if depth == 0 and char != b"[":
+                        raise ValueError(f"{path} : tableau JSON attendu")
+                    depth += 1
+                    if depth == 1:
+                        start = pos
+                elif depth == 1 and char in (b",", b"]"):
+                    element = buf[start:match.start()].strip()
+                    if element:
+                        try:
+                            yield orjson.loads(element)
+                        except orjson.JSONDecodeError as e:
+                            on_error(path, f"octet {offset + start}", e)
+                    start = pos
+                    if char == b"]":
+                        return
+                elif char in (b"]", b"}"):
+                    depth -= 1
+
+            # On ne garde que l'élément en cours de lecture
+            if depth >= 1:
+                buf, pos, offset = buf[start:], pos - start, offset + start
+                start = 0
+            else:
+                buf, pos, offset = buf[pos:], 0, offset + pos
+
+
+def iter_articles_file(path, on_error=None):
+    """Articles d'un fichier de résultats, lus au fil de l'eau : tableau JSON ou JSONL(.zst).
+    Le format est reconnu au premier caractère (BOM UTF-8 éventuel ignoré)."""
+    with _open_text_lines(path) as f:
+        head = f.read(64).removeprefix(_BOM).lstrip()
+    if head.startswith(b"["):
+        return iter_json_array(path, on_error=on_error)
+    return iter_results(path, on_error=on_error)
+
+
+class ResultsStreamWriter:
+    """Ajout d'articles à un flux JSONL, flushé après chaque article (thread-safe)."""
+
+    def __init__(self, path, append=True):
+        self.path = path
+        self.compressed = path.endswith(".zst")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, 'ab' if append else 'wb')
+        self._compressor = zstandard.ZstdCompressor() if self.compressed else None
+        self._lock = threading.Lock()
+
+    def write(self, article):
+        line = orjson.dumps(article) + b"\n"
+        if self._compressor is not None:
+            # Une trame zstd par article : le fichier reste lisible même après un crash
+            line = self._compressor.compress(line)
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            if RESULTS_STREAM_CONFIG["fsync"]:
+                os.fsync(self._file.fileno())
+
+    def close(self):
+        """Ferme le flux (sans effet s'il est déjà fermé)."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class SourceCheckpoint:
+    """Flux de résultats + progression d'une source, avec reprise d'un run interrompu."""
+
+    def __init__(self, source_code):
+        self.source_code = source_code
+        self.progress_path = f"scrapers/{source_code}/progress.json"
+        self.stream_path = get_stream_path(source_code)
+        self.writer = None
+        self.listing = None   # (empreinte, nombre d'articles) de la liste, enregistrée en fin de run
+
+    def _read_progress(self):
+        try:
+            with open(self.progress_path, 'rb') as f:
+                return orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None
+
+    def _write_progress(self, progress):
+        os.makedirs(os.path.dirname(self.progress_path), exist_ok=True)
+        tmp_path = f"{self.progress_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(progress, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, self.progress_path)
+
+    def resume_items(self):
+        """Liste d'articles d'un run interrompu de cette source, ou None."""
+        progress = self._read_progress()
+        if progress and progress.get("status") == "running" and os.path.exists(self.stream_path):
+            return progress["items"]
+        return None
+
+    def start(self, items, resumed=False):
+        """Démarre (ou reprend) le run de la source. Retourne les articles restant à traiter."""
+        if not resumed:
+            self._write_progress({
+                "source": self.source_code,
+                "status": "running",
+                "started_at": time.time(),
+                "items": items,
+            })
+        self.writer = ResultsStreamWriter(self.stream_path, append=resumed)
+
+        if not resumed:
+            return items
+
+        done = {article["url"] for article in iter_results(self.stream_path) if not article.get("error")}
+        return [item for item in items if item["url"] not in done]
+
+    def record(self, article):
+        """Ajoute un article extrait au flux."""
+        self.writer.write(article)
+
+    def finish(self):
+        """Clôt le run de la source et retourne tous ses articles (ordre de la liste)."""
+        self.writer.close()
+        progress = self._read_progress() or {"items": []}
+
+        # Dernière version de chaque URL (une erreur peut avoir été retentée après reprise)
+        latest = {article["url"]: article for article in iter_results(self.stream_path)}
+        ordered = [latest[item["url"]] for item in progress["items"] if item["url"] in latest]
+
+        progress.update({"status": "done", "finished_at": time.time(), "articles": len(ordered)})
+        self._write_progress(progress)
+        return ordered